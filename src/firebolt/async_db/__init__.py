@@ -1,23 +1,5 @@
-from firebolt.async_db.connection import Connection, connect
-from firebolt.async_db.cursor import Cursor
-from firebolt.common._types import (
-    ARRAY,
-    BINARY,
-    DATETIME,
-    DECIMAL,
-    NUMBER,
-    ROWID,
-    STRING,
-    STRUCT,
-    Binary,
-    Date,
-    DateFromTicks,
-    ExtendedType,
-    Time,
-    TimeFromTicks,
-    Timestamp,
-    TimestampFromTicks,
-)
+from typing import TYPE_CHECKING
+
 from firebolt.common.constants import ParameterStyle
 from firebolt.utils.exception import (
     DatabaseError,
@@ -31,6 +13,100 @@ from firebolt.utils.exception import (
     ProgrammingError,
     Warning,
 )
+from firebolt.utils.lazy_import import lazy_attributes, lazy_getattr
+
+if TYPE_CHECKING:
+    from firebolt.async_db.connection import Connection, connect
+    from firebolt.async_db.cursor import Cursor
+    from firebolt.async_db.prepared_statement import PreparedStatement
+    from firebolt.common._types import (
+        ARRAY,
+        BINARY,
+        DATETIME,
+        DECIMAL,
+        NUMBER,
+        ROWID,
+        STRING,
+        STRUCT,
+        Binary,
+        Date,
+        DateFromTicks,
+        ExtendedType,
+        Time,
+        TimeFromTicks,
+        Timestamp,
+        TimestampFromTicks,
+    )
+
+__all__ = [
+    "ARRAY",
+    "BINARY",
+    "DATETIME",
+    "DECIMAL",
+    "NUMBER",
+    "ROWID",
+    "STRING",
+    "STRUCT",
+    "Binary",
+    "Connection",
+    "Cursor",
+    "DatabaseError",
+    "DataError",
+    "Date",
+    "DateFromTicks",
+    "Error",
+    "ExtendedType",
+    "IntegrityError",
+    "InterfaceError",
+    "InternalError",
+    "NotSupportedError",
+    "OperationalError",
+    "PreparedStatement",
+    "ProgrammingError",
+    "Time",
+    "TimeFromTicks",
+    "Timestamp",
+    "TimestampFromTicks",
+    "Warning",
+    "apilevel",
+    "connect",
+    "paramstyle",
+    "threadsafety",
+]
+
+# Connections, cursors and types depend on http, parsing and crypto libraries,
+# which are only imported when these names are first used
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        **lazy_attributes(
+            "firebolt.common._types",
+            (
+                "ARRAY",
+                "BINARY",
+                "DATETIME",
+                "DECIMAL",
+                "NUMBER",
+                "ROWID",
+                "STRING",
+                "STRUCT",
+                "Binary",
+                "Date",
+                "DateFromTicks",
+                "ExtendedType",
+                "Time",
+                "TimeFromTicks",
+                "Timestamp",
+                "TimestampFromTicks",
+            ),
+        ),
+        **lazy_attributes("firebolt.async_db.connection", ("Connection", "connect")),
+        **lazy_attributes("firebolt.async_db.cursor", ("Cursor",)),
+        **lazy_attributes(
+            "firebolt.async_db.prepared_statement", ("PreparedStatement",)
+        ),
+    },
+)
 
 apilevel = "2.0"
 # threads may only share the module and connections, cursors should not be shared
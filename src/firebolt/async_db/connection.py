@@ -3,17 +3,25 @@ from __future__ import annotations
 import logging
 from ssl import SSLContext
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 import trio
-from httpx import Request, Response, Timeout, codes
+from anyio import create_task_group
+from httpx import AsyncBaseTransport, Request, Response, Timeout, codes
 
 from firebolt.async_db.cursor import Cursor, CursorV1, CursorV2
-from firebolt.client import DEFAULT_API_URL
+from firebolt.async_db.prepared_statement import PreparedStatement
+from firebolt.client import DEFAULT_API_URL, TransportOptions
 from firebolt.client.auth import Auth
 from firebolt.client.auth.base import FireboltAuthVersion
-from firebolt.client.client import AsyncClient, AsyncClientV1, AsyncClientV2
+from firebolt.client.client import (
+    AsyncClient,
+    AsyncClientV1,
+    AsyncClientV2,
+    _spawn_background_task,
+)
+from firebolt.client.transport_registry import async_use_shared_transport
 from firebolt.common.base_connection import (
     ASYNC_QUERY_CANCEL,
     ASYNC_QUERY_STATUS_REQUEST,
@@ -21,6 +29,7 @@ from firebolt.common.base_connection import (
     ASYNC_QUERY_STATUS_SUCCESSFUL,
     AsyncQueryInfo,
     BaseConnection,
+    ConnectionTimings,
     _parse_async_query_info_results,
     get_cached_system_engine_info,
     get_user_agent_for_connection,
@@ -82,6 +91,7 @@ class Connection(BaseConnection):
         "engine_url",
         "api_endpoint",
         "_is_closed",
+        "connect_timings",
         "_transaction_id",
         "_transaction_sequence_id",
         "_transaction_lock",
@@ -122,6 +132,33 @@ class Connection(BaseConnection):
         self._cursors.append(c)
         return c
 
+    def prepare(self, query: str) -> PreparedStatement:
+        """Prepare a query on a new cursor of this connection.
+
+        See :py:meth:`Cursor.prepare`.
+        """
+        return self.cursor().prepare(query)
+
+    async def _prewarm(self, count: int) -> None:
+        """Open keep-alive connections to the engine.
+
+        Sends `count` concurrent HEAD requests to the engine, so as many
+        TCP and TLS connections are established and kept in the client pool,
+        ready for the first queries. Failures are ignored.
+        """
+
+        async def warm() -> None:
+            try:
+                await self._client.head(
+                    self.engine_url, timeout=Timeout(DEFAULT_TIMEOUT_SECONDS)
+                )
+            except Exception as e:
+                logger.debug(f"Failed to prewarm a connection to the engine: {e}")
+
+        async with create_task_group() as tg:
+            for _ in range(count):
+                tg.start_soon(warm)
+
     # Server-side async methods
     async def get_async_query_info(self, token: str) -> List[AsyncQueryInfo]:
         """
@@ -292,12 +329,19 @@ async def connect(
     url: Optional[str] = None,
     autocommit: bool = True,
     additional_parameters: Dict[str, Any] = {},
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
+    prewarm: int = 0,
+    share_transport: bool = False,
+    transport: Optional[AsyncBaseTransport] = None,
 ) -> Connection:
     # auth parameter is optional in function signature
     # but is required to connect.
     # PEP 249 recommends making it kwargs.
     if not auth:
         raise ConfigurationError("auth is required to connect.")
+    if prewarm < 0:
+        raise ConfigurationError("prewarm must not be negative.")
 
     api_endpoint = fix_url_schema(api_endpoint)
     # Type checks
@@ -313,16 +357,19 @@ async def connect(
     if auth_version == FireboltAuthVersion.CORE:
         # Verify that Core-incompatible parameters are not provided
         validate_firebolt_core_parameters(account_name, engine_name, engine_url)
-        return connect_core(
+        connection = connect_core(
             auth=auth,
             user_agent_header=user_agent_header,
             database=database,
             connection_url=url,
             autocommit=autocommit,
+            http2=http2,
+            transport_options=transport_options,
+            transport=transport,
         )
     elif auth_version == FireboltAuthVersion.V2:
         assert account_name is not None
-        return await connect_v2(
+        connection = await connect_v2(
             auth=auth,
             user_agent_header=user_agent_header,
             account_name=account_name,
@@ -332,9 +379,12 @@ async def connect(
             connection_id=connection_id,
             disable_cache=disable_cache,
             autocommit=autocommit,
+            http2=http2,
+            transport_options=transport_options,
+            transport=transport,
         )
     elif auth_version == FireboltAuthVersion.V1:
-        return await connect_v1(
+        connection = await connect_v1(
             auth=auth,
             user_agent_header=user_agent_header,
             account_name=account_name,
@@ -343,10 +393,20 @@ async def connect(
             engine_url=engine_url,
             api_endpoint=api_endpoint,
             connection_id=connection_id,
+            http2=http2,
+            transport_options=transport_options,
+            transport=transport,
         )
     else:
         raise ConfigurationError(f"Unsupported auth type: {type(auth)}")
 
+    if share_transport:
+        await async_use_shared_transport(connection._client, connection.engine_url)
+    if prewarm:
+        # Connections are opened in the background, not delaying the first query
+        _spawn_background_task(lambda: connection._prewarm(prewarm))
+    return connection
+
 
 async def connect_v2(
     auth: Auth,
@@ -358,6 +418,9 @@ async def connect_v2(
     api_endpoint: str = DEFAULT_API_URL,
     disable_cache: bool = False,
     autocommit: bool = True,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
+    transport: Optional[AsyncBaseTransport] = None,
 ) -> Connection:
     """Connect to Firebolt.
 
@@ -370,6 +433,12 @@ async def connect_v2(
         `api_endpoint` (str): Firebolt API endpoint. Used for authentication
         `additional_parameters` (Optional[Dict]): Dictionary of less widely-used
                                 arguments for connection
+        `http2` (bool): Use HTTP/2, so concurrent queries share one TCP
+                        connection to the engine
+        `transport_options` (Optional[TransportOptions]): Connection pool and
+                        socket settings
+        `transport` (Optional[AsyncBaseTransport]): HTTP transport to use instead
+                        of creating one, closed with the connection
 
     """
     # These parameters are optional in function signature
@@ -383,46 +452,132 @@ async def connect_v2(
     assert auth is not None
     assert account_name is not None
 
-    system_engine_info = await _get_system_engine_url_and_params(
-        auth, account_name, api_endpoint, connection_id, disable_cache
-    )
-
-    client = AsyncClientV2(
-        auth=auth,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
-        headers={"User-Agent": user_agent_header},
-    )
-
-    async with Connection(
-        system_engine_info.url,
-        None,
-        client,
-        CursorV2,
-        api_endpoint,
-        system_engine_info.params,
-        connection_id,
-    ) as system_engine_connection:
-
-        cursor = system_engine_connection.cursor()
+    timings = ConnectionTimings()
+    with timings.measure("total"):
+        # One client is used for the gateway lookup, the system engine and
+        # the user engine, so its transport and connections are reused
+        client = AsyncClientV2(
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+            timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
+            headers={"User-Agent": user_agent_header},
+            http2=http2,
+            transport_options=transport_options,
+            transport=transport,
+        )
+        try:
+            with timings.measure("system_engine"):
+                system_engine_info = await _get_system_engine_url_and_params(
+                    client, auth, account_name, connection_id, disable_cache
+                )
+        except BaseException:
+            await client.aclose()
+            raise
+
+        system_engine_connection = Connection(
+            system_engine_info.url,
+            None,
+            client,
+            CursorV2,
+            api_endpoint,
+            system_engine_info.params,
+            connection_id,
+        )
+        try:
+            database_cursor, engine_cursor = await _resolve_database_and_engine(
+                system_engine_connection,
+                database,
+                engine_name,
+                disable_cache,
+                timings,
+            )
+        except BaseException:
+            await system_engine_connection.aclose()
+            raise
+        system_engine_connection._detach_client()
 
-        if database:
-            await cursor.use_database(database, cache=not disable_cache)
-        if engine_name:
-            await cursor.use_engine(engine_name, cache=not disable_cache)
         # Ensure cursors created from this connection are using the same starting
-        # database and engine
-        return Connection(
-            cursor.engine_url,
-            cursor.database,
-            client.clone(),
+        # database and engine. Without a requested database, the engine's
+        # default one returned by USE ENGINE is used
+        connection = Connection(
+            engine_cursor.engine_url,
+            database_cursor.database or engine_cursor.database,
+            client,
             CursorV2,
             api_endpoint,
-            cursor.parameters | cursor._set_parameters,
+            database_cursor.parameters
+            | database_cursor._set_parameters
+            | engine_cursor.parameters
+            | engine_cursor._set_parameters,
             connection_id,
             autocommit,
         )
+    connection.connect_timings = timings
+    logger.debug(f"Connection established: {timings}")
+    return connection
+
+
+async def _resolve_database_and_engine(
+    system_engine_connection: Connection,
+    database: Optional[str],
+    engine_name: Optional[str],
+    disable_cache: bool,
+    timings: ConnectionTimings,
+) -> Tuple[Cursor, Cursor]:
+    """Run USE DATABASE and USE ENGINE concurrently on the system engine.
+
+    The two statements are sent as separate requests, so that each cursor
+    gets its own response headers with the resolved database or engine.
+    The engine is resolved in the context of the requested database, so it
+    doesn't have to wait for the database to be resolved first. Both results
+    are merged into the cache record, which is stored once.
+
+    Returns:
+        Tuple[Cursor, Cursor]: Closed cursors holding the resolved database
+            and engine state
+    """
+    database_cursor = system_engine_connection.cursor()
+    engine_cursor = system_engine_connection.cursor()
+    record = None if disable_cache else database_cursor._get_cache_record_for_update()
+    errors: List[Optional[Exception]] = [None, None]
+    updated = [False, False]
+
+    async def use_database() -> None:
+        assert database is not None
+        try:
+            with timings.measure("use_database"):
+                updated[0] = await database_cursor._use_database(database, record)
+        except Exception as e:
+            errors[0] = e
+
+    async def use_engine() -> None:
+        assert engine_name is not None
+        if database:
+            engine_cursor.database = database
+        try:
+            with timings.measure("use_engine"):
+                updated[1] = await engine_cursor._use_engine(engine_name, record)
+        except Exception as e:
+            errors[1] = e
+
+    try:
+        async with create_task_group() as tg:
+            if database:
+                tg.start_soon(use_database)
+            if engine_name:
+                tg.start_soon(use_engine)
+        if record is not None and any(updated):
+            database_cursor.set_cache_record(record)
+        # A database error is reported first, since the engine
+        # is resolved in its context
+        for error in errors:
+            if error is not None:
+                raise error
+    finally:
+        await database_cursor.aclose()
+        await engine_cursor.aclose()
+    return database_cursor, engine_cursor
 
 
 async def connect_v1(
@@ -434,6 +589,9 @@ async def connect_v1(
     engine_name: Optional[str] = None,
     engine_url: Optional[str] = None,
     api_endpoint: str = DEFAULT_API_URL,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
+    transport: Optional[AsyncBaseTransport] = None,
 ) -> Connection:
     # These parameters are optional in function signature
     # but are required to connect.
@@ -450,6 +608,8 @@ async def connect_v1(
         api_endpoint=api_endpoint,
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
+        http2=http2,
+        transport_options=transport_options,
     )
 
     # Mypy checks, this should never happen
@@ -478,6 +638,9 @@ async def connect_v1(
         api_endpoint=api_endpoint,
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
+        http2=http2,
+        transport_options=transport_options,
+        transport=transport,
     )
     return Connection(
         engine_url, database, client, CursorV1, api_endpoint, id=connection_id
@@ -490,6 +653,9 @@ def connect_core(
     database: Optional[str] = None,
     connection_url: Optional[str] = None,
     autocommit: bool = True,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
+    transport: Optional[AsyncBaseTransport] = None,
 ) -> Connection:
     """Connect to Firebolt Core.
 
@@ -501,6 +667,11 @@ def connect_core(
         connection_url (Optional[str]): URL in format protocol://host:port
             Protocol defaults to http, host defaults to localhost, port
             defaults to 3473.
+        http2 (bool): Use HTTP/2 if the server supports it
+        transport_options (Optional[TransportOptions]): Connection pool and
+            socket settings
+        transport (Optional[AsyncBaseTransport]): HTTP transport to use instead
+            of creating one. It has to verify Core certificates itself
 
     Returns:
         Connection: A connection to Firebolt Core
@@ -509,7 +680,7 @@ def connect_core(
 
     ctx: Union[SSLContext, bool] = True  # Default context
     if connection_params.scheme == "https":
-        ctx = get_core_certificate_context()
+        ctx = get_core_certificate_context(http2)
 
     verified_url = connection_params.geturl()
     client = AsyncClientV2(
@@ -519,6 +690,9 @@ def connect_core(
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
         verify=ctx,
+        http2=http2,
+        transport_options=transport_options,
+        transport=transport,
     )
 
     return Connection(
@@ -532,9 +706,9 @@ def connect_core(
 
 
 async def _get_system_engine_url_and_params(
+    client: AsyncClient,
     auth: Auth,
     account_name: str,
-    api_endpoint: str,
     connection_id: str,
     disable_cache: bool = False,
 ) -> EngineInfo:
@@ -544,24 +718,19 @@ async def _get_system_engine_url_and_params(
     if cached_result:
         return cached_result
 
-    async with AsyncClientV2(
-        auth=auth,
-        base_url=api_endpoint,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
-    ) as client:
-        url = GATEWAY_HOST_BY_ACCOUNT_NAME.format(account_name=account_name)
-        response = await client.get(url=url)
-        if response.status_code == codes.NOT_FOUND:
-            raise AccountNotFoundOrNoAccessError(account_name)
-        if response.status_code != codes.OK:
-            raise InterfaceError(
-                f"Unable to retrieve system engine endpoint {url}: "
-                f"{response.status_code} {response.content.decode()}"
-            )
-        url, params = parse_url_and_params(response.json()["engineUrl"])
-
-        return set_cached_system_engine_info(
-            cache_key, connection_id, url, params, disable_cache
+    url = GATEWAY_HOST_BY_ACCOUNT_NAME.format(account_name=account_name)
+    response = await client.get(
+        url=client._api_endpoint.join(url), timeout=Timeout(DEFAULT_TIMEOUT_SECONDS)
+    )
+    if response.status_code == codes.NOT_FOUND:
+        raise AccountNotFoundOrNoAccessError(account_name)
+    if response.status_code != codes.OK:
+        raise InterfaceError(
+            f"Unable to retrieve system engine endpoint {url}: "
+            f"{response.status_code} {response.content.decode()}"
         )
+    url, params = parse_url_and_params(response.json()["engineUrl"])
+
+    return set_cached_system_engine_info(
+        cache_key, connection_id, url, params, disable_cache
+    )
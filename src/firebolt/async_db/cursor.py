@@ -5,25 +5,58 @@ import time
 import warnings
 from abc import ABCMeta, abstractmethod
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
-from urllib.parse import urljoin
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
+from anyio import Semaphore, create_task_group
 from httpx import URL, USE_CLIENT_DEFAULT, Response, TimeoutException, codes
 
+from firebolt.async_db.prepared_statement import PreparedStatement
 from firebolt.client.client import AsyncClient, AsyncClientV1, AsyncClientV2
 from firebolt.common._types import ColType, ParameterType, SetParameter
-from firebolt.common.constants import JSON_OUTPUT_FORMAT, CursorState
+from firebolt.common.constants import (
+    DEFAULT_BULK_BATCH_BYTES,
+    DEFAULT_BULK_BATCH_ROWS,
+    JSON_OUTPUT_FORMAT,
+    CursorState,
+)
 from firebolt.common.cursor.base_cursor import (
     BaseCursor,
     _raise_if_internal_set_parameter,
 )
+from firebolt.common.cursor.bulk_load import (
+    FilePath,
+    RowSource,
+    aiter_bulk_batches,
+    read_csv_rows,
+    read_json_lines_rows,
+)
+from firebolt.common.cursor.columnar import (
+    ArrowTableSource,
+    ColumnarSource,
+    DataFrameSource,
+    iter_columnar_batches,
+)
 from firebolt.common.cursor.decorators import (
     async_not_allowed,
     check_not_closed,
     check_query_executed,
 )
 from firebolt.common.cursor.statement_planners import (
+    BulkBatchPlan,
     ExecutionPlan,
+    PreparedQuery,
     StatementPlannerFactory,
 )
 from firebolt.common.row_set.asynchronous.base import BaseAsyncRowSet
@@ -31,6 +64,7 @@ from firebolt.common.row_set.asynchronous.in_memory import InMemoryAsyncRowSet
 from firebolt.common.row_set.asynchronous.streaming import StreamingAsyncRowSet
 from firebolt.common.statement_formatter import create_statement_formatter
 from firebolt.utils.exception import (
+    ConfigurationError,
     EngineNotRunningError,
     FireboltDatabaseError,
     FireboltError,
@@ -83,7 +117,7 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
 
     async def _api_request(
         self,
-        query: str = "",
+        query: Union[str, AsyncIterable[bytes]] = "",
         parameters: Optional[dict[str, Any]] = None,
         path: str = "",
         use_set_parameters: bool = True,
@@ -93,7 +127,8 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
         Query API, return Response object.
 
         Args:
-            query (str): SQL query
+            query (Union[str, AsyncIterable[bytes]]): SQL query, or an async
+                iterable of byte chunks to be streamed as the request body
             parameters (Optional[Sequence[ParameterType]]): A sequence of substitution
                 parameters. Used to replace '?' placeholders inside a query with
                 actual values. Note: In order to "output_format" dict value, it
@@ -112,7 +147,7 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
             parameters = {**self.parameters, **parameters}
         try:
             req = self._client.build_request(
-                url=urljoin(self.engine_url.rstrip("/") + "/", path or ""),
+                url=self._get_request_url(path),
                 method="POST",
                 params=parameters,
                 content=query,
@@ -215,6 +250,23 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
             self._state = CursorState.ERROR
             raise
 
+    async def _execute_prepared(
+        self,
+        prepared_query: PreparedQuery,
+        parameters: Sequence[Sequence[ParameterType]],
+        timeout: Optional[float] = None,
+        bulk_insert: bool = False,
+    ) -> None:
+        await self._close_rowset_and_reset()
+        self._row_set = InMemoryAsyncRowSet()
+        try:
+            plan = prepared_query.create_execution_plan(parameters, bulk_insert)
+            await self._execute_plan(plan, timeout)
+            self._state = CursorState.DONE
+        except Exception:
+            self._state = CursorState.ERROR
+            raise
+
     async def _execute_plan(
         self,
         plan: ExecutionPlan,
@@ -282,41 +334,55 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
 
     async def use_database(self, database: str, cache: bool = True) -> None:
         """Switch the current database context with caching."""
-        if cache:
-            cache_record = self.get_cache_record()
-            cache_record = (
-                cache_record if cache_record else ConnectionInfo(id=self.connection.id)
-            )
-            if cache_record.databases.get(database):
-                # If database is cached, use it
-                self.database = database
-            else:
-                await self.execute(f'USE DATABASE "{database}"')
-                cache_record.databases[database] = DatabaseInfo(database)
-                self.set_cache_record(cache_record)
-        else:
-            await self.execute(f'USE DATABASE "{database}"')
+        record = self._get_cache_record_for_update() if cache else None
+        if await self._use_database(database, record):
+            assert record is not None
+            self.set_cache_record(record)
+
+    async def _use_database(
+        self, database: str, record: Optional[ConnectionInfo]
+    ) -> bool:
+        """Switch the current database context, using a cache record if provided.
+
+        Returns:
+            bool: True if the record was updated and should be stored
+        """
+        if record is not None and record.databases.get(database):
+            # If database is cached, use it
+            self.database = database
+            return False
+        await self.execute(f'USE DATABASE "{database}"')
+        if record is None:
+            return False
+        record.databases[database] = DatabaseInfo(database)
+        return True
 
     async def use_engine(self, engine: str, cache: bool = True) -> None:
         """Switch the current engine context with caching."""
-        if cache:
-            cache_obj = self.get_cache_record()
-            cache_obj = (
-                cache_obj if cache_obj else ConnectionInfo(id=self.connection.id)
-            )
-            if cache_obj.engines.get(engine):
-                # If engine is cached, use it
-                self.engine_url = cache_obj.engines[engine].url
-                self._update_set_parameters(cache_obj.engines[engine].params)
-            else:
-                await self.execute(f'USE ENGINE "{engine}"')
-                params = self.parameters | self._set_parameters
-                # Ensure 'database' parameter is not cached with engine info
-                params = {k: v for k, v in params.items() if k != "database"}
-                cache_obj.engines[engine] = EngineInfo(self.engine_url, params)
-                self.set_cache_record(cache_obj)
-        else:
-            await self.execute(f'USE ENGINE "{engine}"')
+        record = self._get_cache_record_for_update() if cache else None
+        if await self._use_engine(engine, record):
+            assert record is not None
+            self.set_cache_record(record)
+
+    async def _use_engine(self, engine: str, record: Optional[ConnectionInfo]) -> bool:
+        """Switch the current engine context, using a cache record if provided.
+
+        Returns:
+            bool: True if the record was updated and should be stored
+        """
+        if record is not None and record.engines.get(engine):
+            # If engine is cached, use it
+            self.engine_url = record.engines[engine].url
+            self._update_set_parameters(record.engines[engine].params)
+            return False
+        await self.execute(f'USE ENGINE "{engine}"')
+        if record is None:
+            return False
+        params = self.parameters | self._set_parameters
+        # Ensure 'database' parameter is not cached with engine info
+        params = {k: v for k, v in params.items() if k != "database"}
+        record.engines[engine] = EngineInfo(self.engine_url, params)
+        return True
 
     @check_not_closed
     async def execute(
@@ -405,6 +471,352 @@ class Cursor(BaseCursor, metaclass=ABCMeta):
         )
         return self.rowcount
 
+    @check_not_closed
+    def prepare(self, query: str) -> PreparedStatement:
+        """Plan a query once, to execute it many times with different parameters.
+
+        The statement planner for the current paramstyle is resolved and the
+        query is parsed only once, so executing the prepared statement skips
+        all per-call planning. Results are available on this cursor.
+
+        Args:
+            query (str): SQL query to prepare. Must be a single statement.
+
+        Returns:
+            PreparedStatement: Reusable prepared statement.
+        """
+        from firebolt.async_db import paramstyle
+
+        planner = StatementPlannerFactory.create_planner(paramstyle, self._formatter)
+        return PreparedStatement(self, planner.prepare(query))
+
+    @check_not_closed
+    async def load_rows(
+        self,
+        query: str,
+        rows: RowSource,
+        batch_rows: int = DEFAULT_BULK_BATCH_ROWS,
+        max_batch_bytes: int = DEFAULT_BULK_BATCH_BYTES,
+        timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """Insert rows from an iterable in bounded batches.
+
+        Unlike `executemany`, rows are consumed lazily, so generators and
+        async generators can be used as a source. Each batch is formatted as
+        soon as it's collected and streamed into the request body, so memory
+        usage is bounded by the batch size rather than the size of the dataset.
+        With the fb_numeric paramstyle, parameters are sent in the request
+        url, so batches are also cut before their parameters exceed
+        ``BULK_QUERY_PARAMETERS_URL_BYTES``.
+
+        Args:
+            query (str): INSERT query with parameter placeholders.
+            rows (Union[Iterable, AsyncIterable]): Parameter sets,
+                one per inserted row.
+            batch_rows (int): Maximum number of rows sent in one request.
+            max_batch_bytes (int): Approximate maximum size of one request.
+            timeout_seconds (Optional[float]): Timeout for the whole load.
+
+        Returns:
+            int: Number of rows loaded.
+        """
+        await self._close_rowset_and_reset()
+        self._row_set = InMemoryAsyncRowSet()
+
+        from firebolt.async_db import paramstyle
+
+        try:
+            builder = StatementPlannerFactory.create_planner(
+                paramstyle, self._formatter
+            ).create_bulk_batch_builder(query)
+            loaded = await self._execute_bulk_batches(
+                aiter_bulk_batches(builder, rows, batch_rows, max_batch_bytes),
+                TimeoutController(timeout_seconds),
+            )
+            self._state = CursorState.DONE
+        except Exception:
+            self._state = CursorState.ERROR
+            raise
+        return loaded
+
+    @check_not_closed
+    async def load_csv(
+        self,
+        query: str,
+        path: FilePath,
+        header: bool = True,
+        null_value: Optional[str] = "",
+        encoding: str = "utf-8",
+        batch_rows: int = DEFAULT_BULK_BATCH_ROWS,
+        max_batch_bytes: int = DEFAULT_BULK_BATCH_BYTES,
+        timeout_seconds: Optional[float] = None,
+        **fmtparams: Any,
+    ) -> int:
+        """Insert rows from a local CSV file, reading it lazily.
+
+        CSV values are sent as strings. See :py:func:`load_rows` for details.
+
+        Args:
+            query (str): INSERT query with parameter placeholders.
+            path (FilePath): Path to the CSV file.
+            header (bool): Skip the first line of the file if True.
+            null_value (Optional[str]): Field value to be loaded as NULL.
+            encoding (str): File encoding.
+            batch_rows (int): Maximum number of rows sent in one request.
+            max_batch_bytes (int): Approximate maximum size of one request.
+            timeout_seconds (Optional[float]): Timeout for the whole load.
+            fmtparams: Additional formatting parameters for `csv.reader`.
+
+        Returns:
+            int: Number of rows loaded.
+        """
+        return await self.load_rows(
+            query,
+            read_csv_rows(path, header, null_value, encoding, **fmtparams),
+            batch_rows=batch_rows,
+            max_batch_bytes=max_batch_bytes,
+            timeout_seconds=timeout_seconds,
+        )
+
+    @check_not_closed
+    async def load_json_lines(
+        self,
+        query: str,
+        path: FilePath,
+        columns: Optional[Sequence[str]] = None,
+        encoding: str = "utf-8",
+        batch_rows: int = DEFAULT_BULK_BATCH_ROWS,
+        max_batch_bytes: int = DEFAULT_BULK_BATCH_BYTES,
+        timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """Insert rows from a local JSON-lines file, reading it lazily.
+
+        Each line must be a JSON array of values or a JSON object.
+        See :py:func:`load_rows` for details.
+
+        Args:
+            query (str): INSERT query with parameter placeholders.
+            path (FilePath): Path to the JSON-lines file.
+            columns (Optional[Sequence[str]]): Keys to take from JSON objects.
+            encoding (str): File encoding.
+            batch_rows (int): Maximum number of rows sent in one request.
+            max_batch_bytes (int): Approximate maximum size of one request.
+            timeout_seconds (Optional[float]): Timeout for the whole load.
+
+        Returns:
+            int: Number of rows loaded.
+        """
+        return await self.load_rows(
+            query,
+            read_json_lines_rows(path, columns, encoding),
+            batch_rows=batch_rows,
+            max_batch_bytes=max_batch_bytes,
+            timeout_seconds=timeout_seconds,
+        )
+
+    @check_not_closed
+    async def insert_dataframe(
+        self,
+        table: str,
+        df: Any,
+        batch_rows: int = DEFAULT_BULK_BATCH_ROWS,
+        max_batch_bytes: int = DEFAULT_BULK_BATCH_BYTES,
+        concurrency: int = 1,
+        timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """Insert the contents of a pandas DataFrame into a table.
+
+        DataFrame column names are used as target column names. Data is
+        converted to SQL one batch of rows at a time, using a formatter
+        specialised for each column's type. NaN and NaT values are
+        inserted as NULL.
+
+        Args:
+            table (str): Name of the table to insert into, optionally
+                qualified; names that aren't plain identifiers must be
+                double-quoted.
+            df (pandas.DataFrame): Data to insert.
+            batch_rows (int): Maximum number of rows sent in one request.
+            max_batch_bytes (int): Approximate maximum size of one request.
+            concurrency (int): Maximum number of batches sent concurrently.
+            timeout_seconds (Optional[float]): Timeout for the whole insert.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        return await self._insert_columnar(
+            table,
+            DataFrameSource(df),
+            batch_rows,
+            max_batch_bytes,
+            concurrency,
+            timeout_seconds,
+        )
+
+    @check_not_closed
+    async def insert_arrow(
+        self,
+        table: str,
+        table_obj: Any,
+        batch_rows: int = DEFAULT_BULK_BATCH_ROWS,
+        max_batch_bytes: int = DEFAULT_BULK_BATCH_BYTES,
+        concurrency: int = 1,
+        timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """Insert the contents of a pyarrow Table or RecordBatch into a table.
+
+        Arrow column names are used as target column names. Data is
+        converted to SQL one batch of rows at a time, using a formatter
+        specialised for each column's type.
+
+        Args:
+            table (str): Name of the table to insert into, optionally
+                qualified; names that aren't plain identifiers must be
+                double-quoted.
+            table_obj (pyarrow.Table): Data to insert.
+            batch_rows (int): Maximum number of rows sent in one request.
+            max_batch_bytes (int): Approximate maximum size of one request.
+            concurrency (int): Maximum number of batches sent concurrently.
+            timeout_seconds (Optional[float]): Timeout for the whole insert.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        return await self._insert_columnar(
+            table,
+            ArrowTableSource(table_obj),
+            batch_rows,
+            max_batch_bytes,
+            concurrency,
+            timeout_seconds,
+        )
+
+    async def _insert_columnar(
+        self,
+        table: str,
+        source: ColumnarSource,
+        batch_rows: int,
+        max_batch_bytes: int,
+        concurrency: int,
+        timeout_seconds: Optional[float],
+    ) -> int:
+        await self._close_rowset_and_reset()
+        self._row_set = InMemoryAsyncRowSet()
+        try:
+            loaded = await self._execute_bulk_batches(
+                iter_columnar_batches(
+                    table, source, self._formatter, batch_rows, max_batch_bytes
+                ),
+                TimeoutController(timeout_seconds),
+                concurrency,
+            )
+            self._state = CursorState.DONE
+        except Exception:
+            self._state = CursorState.ERROR
+            raise
+        return loaded
+
+    async def _execute_bulk_batches(
+        self,
+        batches: Union[Iterable[BulkBatchPlan], AsyncIterable[BulkBatchPlan]],
+        timeout_controller: TimeoutController,
+        concurrency: int = 1,
+    ) -> int:
+        """Send bulk insert batches, up to `concurrency` of them concurrently.
+
+        Batches are produced lazily, so at most `concurrency` formatted
+        batches are held in memory at a time.
+
+        Returns:
+            int: Number of loaded rows.
+        """
+        if concurrency < 1:
+            raise ConfigurationError("concurrency must be a positive integer")
+        loaded = 0
+        errors: List[Exception] = []
+        limiter = Semaphore(concurrency)
+
+        async def send(batch: BulkBatchPlan) -> None:
+            nonlocal loaded
+            try:
+                resp = await self._send_bulk_batch_isolated(batch, timeout_controller)
+                await self._handle_bulk_response(resp)
+                loaded += batch.row_count
+            except Exception as e:
+                # Collected to be re-raised outside of the task group,
+                # to avoid wrapping it into an exception group
+                errors.append(e)
+            finally:
+                limiter.release()
+
+        async def next_batch() -> Optional[BulkBatchPlan]:
+            try:
+                if isinstance(batch_iterator, AsyncIterator):
+                    return await batch_iterator.__anext__()
+                return next(batch_iterator)
+            except (StopIteration, StopAsyncIteration):
+                return None
+
+        batch_iterator: Union[Iterator[BulkBatchPlan], AsyncIterator[BulkBatchPlan]]
+        if isinstance(batches, AsyncIterable):
+            batch_iterator = batches.__aiter__()
+        else:
+            batch_iterator = iter(batches)
+
+        async with create_task_group() as tg:
+            while True:
+                # Take a slot before formatting the next batch, so no more
+                # than `concurrency` batches are held in memory
+                await limiter.acquire()
+                try:
+                    # Don't start new batches once one of them failed
+                    batch = None if errors else await next_batch()
+                except BaseException:
+                    limiter.release()
+                    raise
+                if batch is None:
+                    limiter.release()
+                    break
+                tg.start_soon(send, batch)
+        if errors:
+            raise errors[0]
+        if not loaded:
+            await self._append_row_set_from_response(None)
+        return loaded
+
+    async def _send_bulk_batch(
+        self, batch: BulkBatchPlan, timeout_controller: TimeoutController
+    ) -> Response:
+        """Send a single bulk insert batch, streaming its body."""
+        timeout_controller.raise_if_timeout()
+        logger.debug(f"Loading a batch of {batch.row_count} rows")
+        resp = await self._api_request(
+            batch.async_content(),
+            batch.query_params,
+            timeout=timeout_controller.remaining(),
+        )
+        await self._raise_if_error(resp)
+        return resp
+
+    async def _send_bulk_batch_isolated(
+        self, batch: BulkBatchPlan, timeout_controller: TimeoutController
+    ) -> Response:
+        """Send a bulk insert batch through a separate cursor.
+
+        Concurrent batches don't share this cursor's state; only their
+        responses are handled by it.
+        """
+        worker = self.connection.cursor()
+        self._copy_request_state(worker)
+        try:
+            return await worker._send_bulk_batch(batch, timeout_controller)
+        finally:
+            worker.close()
+
+    async def _handle_bulk_response(self, resp: Response) -> None:
+        self._parse_response_headers(resp.headers)
+        await self._append_row_set_from_response(resp)
+
     @check_not_closed
     async def execute_stream(
         self,
@@ -0,0 +1,440 @@
+"""Connection pool for asyncio and trio applications."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from time import monotonic
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+)
+
+from anyio import CancelScope, Event, create_task_group, fail_after, sleep
+from anyio.abc import TaskGroup
+from httpx import AsyncBaseTransport
+
+from firebolt.async_db.connection import Connection, connect
+from firebolt.client.auth.base import FireboltAuthVersion
+from firebolt.client.http_backend import (
+    DEFAULT_TRANSPORT_OPTIONS,
+    AsyncKeepaliveTransport,
+)
+from firebolt.client.transport_registry import (
+    AsyncSharedTransport,
+    TransportKey,
+    TransportRegistry,
+)
+from firebolt.common.base_pool import BasePool, PooledConnection, PoolMetrics
+from firebolt.utils.exception import (
+    InterfaceError,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[Connection], Awaitable[Any]]
+
+# Delay before retrying to open a connection in the background after a failure
+REPLENISH_RETRY_DELAY = 1.0
+
+# All connections opened by a pool from its connect arguments go to the same
+# engine, so they share a single transport
+_POOL_TRANSPORT_KEY: TransportKey = ()
+
+
+async def ping(connection: Connection) -> None:
+    """Default health check: run a trivial query on the connection."""
+    cursor = connection.cursor()
+    try:
+        await cursor.execute("SELECT 1")
+    finally:
+        await cursor.aclose()
+
+
+class _Waiter:
+    """A caller waiting for a connection, or for a slot to open a new one."""
+
+    __slots__ = ("event", "granted", "pooled")
+
+    def __init__(self) -> None:
+        self.event = Event()
+        self.granted = False
+        self.pooled: Optional[PooledConnection] = None
+
+    def grant(self, pooled: Optional[PooledConnection]) -> None:
+        self.granted = True
+        self.pooled = pooled
+        self.event.set()
+
+
+class ConnectionPool(BasePool):
+    """
+    Pool of asynchronous Firebolt connections, based on anyio.
+
+    Works under both asyncio and trio and should be used as an async context
+    manager, which also runs the background task keeping at least `min_size`
+    connections open. Waiting callers are served in the order they arrived,
+    and a checkout or return interrupted by cancellation never leaks
+    a connection. Connections opened from `connect_kwargs` share one HTTP
+    transport, closed together with the last of them.
+
+    Example:
+        async with ConnectionPool(auth=auth, account_name=...) as pool:
+            async with pool.connection() as connection:
+                await connection.cursor().execute("SELECT 1")
+
+    Args:
+        connection_factory (Optional[Callable[[], Awaitable[Connection]]]):
+            Coroutine function creating a new connection.
+            Mutually exclusive with `connect_kwargs`
+        min_size (int): Number of connections kept open regardless of
+            `idle_timeout`
+        max_size (int): Maximum number of open connections
+        idle_timeout (Optional[float]): Seconds after which an idle connection
+            is closed, None to keep idle connections open
+        max_lifetime (Optional[float]): Seconds after which a connection is
+            closed instead of being reused, None for no limit
+        checkout_timeout (Optional[float]): Default number of seconds to wait
+            for a connection, None to wait indefinitely
+        health_check (Optional[Callable[[Connection], Awaitable[Any]]]): Check
+            run on an idle connection before checkout. A connection is
+            discarded if the check raises an exception or returns False.
+            None disables checks
+        health_check_interval (float): Only connections idle for longer than
+            this number of seconds are checked
+        prewarm (int): Number of connections opened in the background to the
+            engine, so the first queries don't wait for TCP and TLS handshakes.
+            A shared transport is prewarmed once, when it is opened
+        connect_kwargs: Arguments for :py:func:`firebolt.async_db.connect`
+    """
+
+    def __init__(
+        self,
+        connection_factory: Optional[Callable[[], Awaitable[Connection]]] = None,
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        idle_timeout: Optional[float] = 300.0,
+        max_lifetime: Optional[float] = 3600.0,
+        checkout_timeout: Optional[float] = 30.0,
+        health_check: Optional[HealthCheck] = ping,
+        health_check_interval: float = 30.0,
+        prewarm: int = 0,
+        **connect_kwargs: Any,
+    ):
+        super().__init__(
+            min_size,
+            max_size,
+            idle_timeout,
+            max_lifetime,
+            checkout_timeout,
+            health_check_interval,
+            prewarm,
+            connection_factory is not None,
+            bool(connect_kwargs),
+        )
+        self._connection_factory = connection_factory
+        self._connect_kwargs = connect_kwargs
+        self.health_check = health_check
+
+        # Most recently used connections are at the right end
+        self._idle: Deque[PooledConnection] = deque()
+        self._in_use: Dict[int, PooledConnection] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        # Reference counted transport of connections opened from connect_kwargs
+        self._transports: TransportRegistry[AsyncBaseTransport] = TransportRegistry()
+        self._task_group: Optional[TaskGroup] = None
+        self._replenish_event = Event()
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Current pool state and statistics."""
+        return self._build_metrics(
+            len(self._idle), len(self._in_use), len(self._waiters)
+        )
+
+    async def acquire(self, timeout: Optional[float] = None) -> Connection:
+        """Check out a connection. It must be returned with :py:meth:`release`.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a connection,
+                defaults to the pool `checkout_timeout`
+
+        Returns:
+            Connection: Connection for exclusive use by the caller
+        """
+        if self._task_group is None and not self._closed:
+            raise InterfaceError(
+                "Connection pool is not open, use it as an async context manager."
+            )
+        start = monotonic()
+        if timeout is None:
+            timeout = self.checkout_timeout
+        deadline = start + timeout if timeout is not None else None
+        while True:
+            pooled = await self._checkout_idle_or_reserve(deadline)
+            if pooled is None:
+                pooled = await self._create()
+            else:
+                try:
+                    healthy = await self._is_healthy(pooled)
+                except BaseException:
+                    await self._discard(pooled)
+                    raise
+                if not healthy:
+                    await self._discard(pooled)
+                    continue
+            self._in_use[id(pooled.connection)] = pooled
+            self._record_checkout(monotonic() - start)
+            return pooled.connection
+
+    async def release(self, connection: Connection) -> None:
+        """Return a checked out connection to the pool.
+
+        Args:
+            connection (Connection): Connection returned by :py:meth:`acquire`
+        """
+        pooled = self._in_use.pop(id(connection), None)
+        if pooled is None or pooled.connection is not connection:
+            raise InterfaceError("Connection doesn't belong to this pool.")
+
+        # The connection is either returned or closed even if the caller is cancelled
+        with CancelScope(shield=True):
+            if (
+                await self._reset(connection)
+                and not self._is_expired(pooled, monotonic())
+                and not self._closed
+            ):
+                pooled.last_used_at = monotonic()
+                self._put(pooled)
+            else:
+                await self._discard(pooled)
+
+    @asynccontextmanager
+    async def connection(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[Connection]:
+        """Check out a connection for the duration of an `async with` block.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a connection,
+                defaults to the pool `checkout_timeout`
+        """
+        connection = await self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+    async def aclose(self) -> None:
+        """Close idle connections. Checked out ones are closed on release."""
+        if self._closed:
+            return
+        self._closed = True
+        # Wake up the waiters and the replenishment task so they can exit
+        for waiter in self._waiters:
+            waiter.event.set()
+        self._replenish_event.set()
+        with CancelScope(shield=True):
+            while self._idle:
+                await self._discard(self._idle.popleft())
+
+    async def _checkout_idle_or_reserve(
+        self, deadline: Optional[float]
+    ) -> Optional[PooledConnection]:
+        """Pop a usable idle connection, or reserve a slot for a new one (None)."""
+        if self._closed:
+            raise PoolClosedError("Unable to get connection: pool closed.")
+        for pooled in self._find_expired_idle(
+            self._idle, len(self._in_use), monotonic()
+        ):
+            self._idle.remove(pooled)
+            await self._discard(pooled)
+
+        # Don't overtake callers that are already waiting
+        if not self._waiters:
+            if self._idle:
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                return None
+
+        waiter = _Waiter()
+        self._waiters.append(waiter)
+        try:
+            remaining = deadline - monotonic() if deadline is not None else None
+            with fail_after(remaining):
+                await waiter.event.wait()
+        except TimeoutError:
+            if not waiter.granted:
+                self._checkout_timeouts += 1
+                raise PoolTimeoutError(
+                    "No connection available in the pool within the "
+                    "checkout timeout."
+                ) from None
+        except BaseException:
+            # Cancelled: pass on a connection or a slot granted meanwhile
+            if waiter.granted:
+                await self._regrant(waiter.pooled)
+            raise
+        finally:
+            if not waiter.granted:
+                self._waiters.remove(waiter)
+
+        if not waiter.granted:
+            raise PoolClosedError("Unable to get connection: pool closed.")
+        return waiter.pooled
+
+    def _put(self, pooled: PooledConnection) -> None:
+        """Hand a reusable connection to the first waiter or make it idle."""
+        if self._waiters:
+            self._waiters.popleft().grant(pooled)
+        else:
+            self._idle.append(pooled)
+
+    def _free_slot(self) -> None:
+        """Release a slot of a closed connection or a failed attempt to open one."""
+        self._size -= 1
+        if self._waiters and not self._closed:
+            self._size += 1
+            self._waiters.popleft().grant(None)
+        elif self._size < self.min_size:
+            self._replenish_event.set()
+
+    async def _regrant(self, pooled: Optional[PooledConnection]) -> None:
+        if pooled is None:
+            self._free_slot()
+        elif self._closed:
+            await self._discard(pooled)
+        else:
+            self._put(pooled)
+
+    async def _is_healthy(self, pooled: PooledConnection) -> bool:
+        if pooled.connection.closed:
+            return False
+        if self.health_check is None or not self._needs_health_check(
+            pooled, monotonic()
+        ):
+            return True
+        try:
+            return await self.health_check(pooled.connection) is not False
+        except Exception as e:
+            logger.warning(f"Pooled connection failed a health check: {e}")
+            return False
+
+    async def _create(self) -> PooledConnection:
+        """Open a new connection in a slot reserved by incrementing the size."""
+        try:
+            if self._connection_factory is not None:
+                prewarm = self.prewarm
+                connection = await self._connection_factory()
+            else:
+                # Only the connection opening the shared transport prewarms it
+                prewarm = 0 if len(self._transports) else self.prewarm
+                connection = await self._connect()
+            if prewarm:
+                assert self._task_group is not None
+                self._task_group.start_soon(connection._prewarm, prewarm)
+        except BaseException:
+            self._free_slot()
+            raise
+        self._connections_created += 1
+        now = monotonic()
+        return PooledConnection(connection, now, now)
+
+    async def _connect(self) -> Connection:
+        """Open a connection from the pool connect arguments."""
+        auth = self._connect_kwargs.get("auth")
+        if auth is not None and auth.get_firebolt_version() == FireboltAuthVersion.CORE:
+            # Firebolt Core connections need their own certificate verification
+            return await connect(**self._connect_kwargs)
+        # The client closes its reference to the transport when it's closed
+        transport = AsyncSharedTransport(
+            self._transports, _POOL_TRANSPORT_KEY, self._create_transport
+        )
+        try:
+            return await connect(transport=transport, **self._connect_kwargs)
+        except BaseException:
+            await transport.aclose()
+            raise
+
+    def _create_transport(self) -> AsyncBaseTransport:
+        return AsyncKeepaliveTransport(
+            http2=self._connect_kwargs.get("http2", False),
+            options=self._connect_kwargs.get("transport_options")
+            or DEFAULT_TRANSPORT_OPTIONS,
+        )
+
+    async def _reset(self, connection: Connection) -> bool:
+        """Reset connection state, return False if it can't be reused."""
+        if connection.closed:
+            return False
+        try:
+            if connection.in_transaction:
+                await connection.rollback()
+            # Closing cursors drops SET parameters set on them
+            for cursor in connection._cursors[:]:
+                await cursor.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to reset a pooled connection: {e}")
+            return False
+        return True
+
+    async def _discard(self, pooled: PooledConnection) -> None:
+        with CancelScope(shield=True):
+            try:
+                await pooled.connection.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close a pooled connection: {e}")
+            self._connections_closed += 1
+            self._free_slot()
+
+    async def _replenish(self) -> None:
+        """Keep at least `min_size` connections open in the background."""
+        while not self._closed:
+            while not self._closed and self._size < self.min_size:
+                self._size += 1
+                try:
+                    pooled = await self._create()
+                except Exception as e:
+                    logger.warning(f"Failed to open a pooled connection: {e}")
+                    await sleep(REPLENISH_RETRY_DELAY)
+                    continue
+                if self._closed:
+                    await self._discard(pooled)
+                else:
+                    pooled.last_used_at = monotonic()
+                    self._put(pooled)
+            await self._replenish_event.wait()
+            self._replenish_event = Event()
+
+    async def __aenter__(self) -> ConnectionPool:
+        if self._closed or self._task_group is not None:
+            raise InterfaceError("Connection pool can only be opened once.")
+        self._task_group = create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._replenish)
+        return self
+
+    async def __aexit__(
+        self, exc_type: type, exc_val: Exception, exc_tb: TracebackType
+    ) -> None:
+        await self.aclose()
+        assert self._task_group is not None
+        try:
+            await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException as e:
+            # The task group wraps an exception raised in the `async with` block
+            # into an exception group, let it propagate as is instead
+            if exc_val is not None and list(getattr(e, "exceptions", ())) == [exc_val]:
+                return
+            raise
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+from firebolt.common._types import ParameterType
+from firebolt.common.cursor.decorators import check_not_closed
+from firebolt.common.cursor.statement_planners import PreparedQuery
+
+if TYPE_CHECKING:
+    from firebolt.async_db.cursor import Cursor
+
+
+class PreparedStatement:
+    """
+    A query planned once, to be executed many times with different parameters.
+
+    Created with :py:meth:`Cursor.prepare` or :py:meth:`Connection.prepare`.
+    Results of the executed query are available on :py:attr:`cursor`.
+
+    Args:
+        cursor (Cursor): Cursor to execute the query with
+        prepared_query (PreparedQuery): Planned query
+    """
+
+    __slots__ = ("cursor", "_prepared_query")
+
+    def __init__(self, cursor: Cursor, prepared_query: PreparedQuery) -> None:
+        self.cursor = cursor
+        self._prepared_query = prepared_query
+
+    @property
+    def query(self) -> str:
+        """SQL query of the prepared statement."""
+        return self._prepared_query.raw_query
+
+    @property
+    def closed(self) -> bool:
+        """True if the cursor of the statement is closed."""
+        return self.cursor.closed
+
+    @check_not_closed
+    async def execute(
+        self,
+        parameters: Optional[Sequence[ParameterType]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Union[int, str]:
+        """Execute the prepared query.
+
+        Args:
+            parameters (Optional[Sequence[ParameterType]]): A sequence of
+                substitution parameters
+            timeout_seconds (Optional[float]): Query execution timeout in seconds
+
+        Returns:
+            int: Query row count.
+        """
+        params_list = [parameters] if parameters else []
+        await self.cursor._execute_prepared(
+            self._prepared_query, params_list, timeout=timeout_seconds
+        )
+        return self.cursor.rowcount
+
+    @check_not_closed
+    async def executemany(
+        self,
+        parameters_seq: Sequence[Sequence[ParameterType]],
+        timeout_seconds: Optional[float] = None,
+        bulk_insert: bool = False,
+    ) -> Union[int, str]:
+        """Execute the prepared query with each of the parameter sets.
+
+        Args:
+            parameters_seq (Sequence[Sequence[ParameterType]]): A sequence of
+               substitution parameter sets
+            timeout_seconds (Optional[float]): Query execution timeout in seconds
+            bulk_insert (bool): When True, concatenates multiple INSERT queries
+               into a single batch request. Only supported for INSERT statements.
+
+        Returns:
+            int: Query row count.
+        """
+        await self.cursor._execute_prepared(
+            self._prepared_query,
+            parameters_seq,
+            timeout=timeout_seconds,
+            bulk_insert=bulk_insert,
+        )
+        return self.cursor.rowcount
@@ -8,6 +8,7 @@ from firebolt.client.client import (
     ClientV2,
 )
 from firebolt.client.constants import DEFAULT_API_URL
+from firebolt.client.http_backend import TransportOptions
 from firebolt.client.resource_manager_hooks import (
     log_request,
     log_response,
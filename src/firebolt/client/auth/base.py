@@ -1,18 +1,36 @@
 import logging
 from abc import abstractmethod
 from enum import IntEnum
+from hashlib import sha256
+from random import uniform
+from threading import Lock as ThreadLock
 from time import time
-from typing import AsyncGenerator, Generator, Optional
+from typing import AsyncGenerator, Generator, Optional, Tuple, TypeVar
 
 from anyio import Lock
+from httpx import URL
 from httpx import Auth as HttpxAuth
 from httpx import Request, Response, codes
 
+from firebolt.client.auth.token_registry import (
+    TokenEntry,
+    TokenKey,
+    token_registry,
+)
+from firebolt.utils.exception import ConfigurationError
 from firebolt.utils.token_storage import TokenSecureStorage
 from firebolt.utils.util import Timer, cached_property, get_internal_error_code
 
 logger = logging.getLogger(__name__)
 
+AuthT = TypeVar("AuthT", bound="Auth")
+
+# Spread background token refreshes by up to this fraction of the refresh delay
+TOKEN_REFRESH_JITTER = 0.1
+
+# Token and its expiration timestamp
+TokenInfo = Tuple[Optional[str], Optional[int]]
+
 
 class FireboltAuthVersion(IntEnum):
     """Enum for Firebolt authentication versions."""
@@ -31,24 +49,47 @@ class Auth(HttpxAuth):
 
     Updates all http requests with bearer token authorization header
 
+    With ``refresh_ahead`` set, clients renew the token in the background once
+    this fraction of its lifetime has passed, with some jitter, so requests
+    don't wait for the token to be refreshed when it expires.
+
     Args:
         use_token_cache (bool): True if token should be cached in filesystem;
             False otherwise
+        refresh_ahead (Optional[float]): Fraction of the token lifetime after
+            which it's refreshed in the background, between 0 and 1;
+            None to only refresh expired tokens
     """
 
     __slots__ = (
-        "_token",
-        "_expires",
+        "_token_info",
         "_use_token_cache",
+        "_refresh_ahead",
+        "_refresh_at",
+        "_refresh_lock",
+        "_shared",
+        "_token_key",
     )
 
     requires_response_body = True
     request_class = AuthRequest
 
-    def __init__(self, use_token_cache: bool = True):
+    def __init__(
+        self, use_token_cache: bool = True, refresh_ahead: Optional[float] = None
+    ):
+        if refresh_ahead is not None and not 0 < refresh_ahead < 1:
+            raise ConfigurationError("refresh_ahead must be between 0 and 1.")
         self._use_token_cache = use_token_cache
-        self._token: Optional[str] = self._get_cached_token()
-        self._expires: Optional[int] = None
+        self._refresh_ahead = refresh_ahead
+        self._refresh_at: Optional[float] = None
+        self._refresh_lock = ThreadLock()
+        # Token shared with copies, and with other auth objects with the same
+        # credentials once bound to an auth endpoint
+        self._shared = TokenEntry()
+        self._token_key: Optional[TokenKey] = None
+        # Token and expiration are replaced together, so that other threads
+        # never see a new token with the expiration of the previous one
+        self._token_info: TokenInfo = (self._get_cached_token(), None)
         self._lock = Lock()
 
     def copy(self) -> "Auth":
@@ -57,7 +98,14 @@ class Auth(HttpxAuth):
         Returns:
             Auth: Auth object
         """
-        return self.__class__(self._use_token_cache)
+        return self._share_token(
+            self.__class__(self._use_token_cache, self._refresh_ahead)
+        )
+
+    def _share_token(self, other: "AuthT") -> "AuthT":
+        """Make a copy of this auth object share token refreshes with it."""
+        other._shared = self._shared
+        return other
 
     @property
     def token(self) -> Optional[str]:
@@ -66,7 +114,23 @@ class Auth(HttpxAuth):
         Returns:
             Optional[str]: Acquired token
         """
-        return self._token
+        return self._token_info[0]
+
+    @property
+    def _token(self) -> Optional[str]:
+        return self._token_info[0]
+
+    @_token.setter
+    def _token(self, token: Optional[str]) -> None:
+        self._token_info = (token, self._token_info[1])
+
+    @property
+    def _expires(self) -> Optional[int]:
+        return self._token_info[1]
+
+    @_expires.setter
+    def _expires(self, expires: Optional[int]) -> None:
+        self._token_info = (self._token_info[0], expires)
 
     @property
     @abstractmethod
@@ -101,7 +165,106 @@ class Auth(HttpxAuth):
         Returns:
             bool: True if expired, False otherwise
         """
-        return self._expires is not None and self._expires <= int(time())
+        return self._is_expired(self._token_info[1])
+
+    @staticmethod
+    def _is_expired(expires: Optional[int]) -> bool:
+        return expires is not None and expires <= int(time())
+
+    def _valid_token(self) -> Optional[str]:
+        """Current token, if it's set and not expired."""
+        token, expires = self._token_info
+        if not token or self._is_expired(expires):
+            return None
+        return token
+
+    def _bind_token_registry(self, auth_endpoint: URL) -> None:
+        """Share tokens with all auth objects with the same credentials.
+
+        Called by clients, since the token depends on the auth endpoint.
+        Auth objects that don't request tokens keep them to themselves.
+
+        Args:
+            auth_endpoint (URL): Endpoint tokens are requested from
+        """
+
+    def _token_registry_key(self, auth_endpoint: URL) -> TokenKey:
+        """Registry key of tokens requested with these credentials.
+
+        Args:
+            auth_endpoint (URL): Endpoint tokens are requested from
+
+        Returns:
+            TokenKey: Registry key
+        """
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            self.principal,
+            sha256(self.secret.encode("utf-8")).hexdigest(),
+            str(auth_endpoint),
+        )
+
+    def _use_token_registry(self, auth_endpoint: URL) -> None:
+        """Switch to the registry entry for the credentials and auth endpoint."""
+        key = self._token_registry_key(auth_endpoint)
+        if key == self._token_key:
+            return
+        entry = token_registry.entry(key)
+        token, expires = self._token_info
+        if self._token_key is not None:
+            # The token was issued by another auth endpoint
+            self._token_info = (None, None)
+        elif token and expires and entry.valid_token() is None:
+            entry.publish(token, expires)
+        self._shared, self._token_key = entry, key
+        self._use_shared_token()
+
+    def _token_updated(self) -> None:
+        """Share a new token and schedule its background refresh."""
+        token, expires = self._token_info
+        if token:
+            self._shared.publish(token, expires)
+        self._schedule_refresh()
+
+    def _use_shared_token(self) -> bool:
+        """Use a token got by another auth object, if it's still valid.
+
+        Returns:
+            bool: True if a valid token is available, False otherwise
+        """
+        shared = self._shared.valid_token()
+        if shared is not None:
+            changed = shared[0] != self._token_info[0]
+            self._token_info = shared
+            if changed:
+                self._cache_token()
+        return self._valid_token() is not None
+
+    def _schedule_refresh(self) -> None:
+        """Set the time to refresh a new token in the background, if enabled."""
+        self._refresh_at = None
+        expires = self._token_info[1]
+        if self._refresh_ahead is None or expires is None:
+            return
+        now = time()
+        delay = (expires - now) * self._refresh_ahead
+        self._refresh_at = now + delay * uniform(1 - TOKEN_REFRESH_JITTER, 1)
+
+    def _claim_refresh(self) -> bool:
+        """Check if a background refresh is due, and claim it.
+
+        Only one caller can claim each scheduled refresh.
+
+        Returns:
+            bool: True if the caller should refresh the token, False otherwise
+        """
+        if self._refresh_at is None or time() < self._refresh_at:
+            return False
+        with self._refresh_lock:
+            if self._refresh_at is None:
+                return False
+            self._refresh_at = None
+            return True
 
     @cached_property
     def _token_storage(self) -> Optional[TokenSecureStorage]:
@@ -131,8 +294,9 @@ class Auth(HttpxAuth):
         if not self._use_token_cache or not self._token_storage:
             return
         # Only cache if token and expiration are retrieved
-        if self._token and self._expires:
-            self._token_storage.cache_token(self._token, self._expires)
+        token, expires = self._token_info
+        if token and expires:
+            self._token_storage.cache_token(token, expires)
 
     @abstractmethod
     def get_new_token_generator(self) -> Generator[Request, Response, None]:
@@ -150,11 +314,14 @@ class Auth(HttpxAuth):
             Request: Request required for auth flow
         """
         with Timer("[PERFORMANCE] Authentication "):
-            if not self.token or self.expired:
+            token = self._valid_token()
+            if token is None:
                 yield from self.get_new_token_generator()
+                self._token_updated()
                 self._cache_token()
+                token = self.token
 
-            request.headers["Authorization"] = f"Bearer {self.token}"
+            request.headers["Authorization"] = f"Bearer {token}"
 
             response = yield request
 
@@ -163,6 +330,7 @@ class Auth(HttpxAuth):
                 or get_internal_error_code(response) == codes.UNAUTHORIZED
             ):
                 yield from self.get_new_token_generator()
+                self._token_updated()
                 request.headers["Authorization"] = f"Bearer {self.token}"
                 yield request
 
@@ -180,11 +348,11 @@ class Auth(HttpxAuth):
         if self.requires_request_body:
             await request.aread()
 
-        if not self.token or self.expired:
+        if not self._use_shared_token():
             await self._lock.acquire()
             # If another task has already updated the token,
             # we don't need to hold the lock
-            if self.token and not self.expired:
+            if self._use_shared_token():
                 self._lock.release()
 
         flow = self.auth_flow(request)
@@ -220,21 +388,87 @@ class Auth(HttpxAuth):
         """
         Execute the authentication flow synchronously.
 
-        Overridden in order to ensure reading the response body
-        in case of an error status code
+        Overridden in order to lock and ensure no more than one thread
+        requests a new token at a time, other threads reuse the token it got.
+        It also makes sure to read the response body in case of an error status code
         """
         if self.requires_request_body:
             request.read()
 
-        flow = self.auth_flow(request)
-        request = next(flow)
+        holds_lock = False
+        if not self._use_shared_token():
+            self._shared.lock.acquire()
+            holds_lock = True
+            # If another thread has already updated the token,
+            # we don't need to hold the lock
+            if self._use_shared_token():
+                self._shared.lock.release()
+                holds_lock = False
+
+        try:
+            flow = self.auth_flow(request)
+            request = next(flow)
+
+            while True:
+                response = yield request
+                if self.requires_response_body or codes.is_error(response.status_code):
+                    response.read()
+
+                try:
+                    request = flow.send(response)
+                except StopIteration:
+                    break
+                finally:
+                    # token gets updated only after flow.send is called
+                    # so unlock only after that
+                    if holds_lock:
+                        self._shared.lock.release()
+                        holds_lock = False
+        finally:
+            if holds_lock:
+                self._shared.lock.release()
+
+    def sync_refresh_flow(self) -> Generator[Request, Response, None]:
+        """Get a new token before the current one expires, in a thread.
+
+        The token is requested holding the same lock as
+        :py:meth:`sync_auth_flow`, so it's never requested twice at a time.
+        If another thread got a new token meanwhile, that one is used instead.
 
-        while True:
-            response = yield request
-            if self.requires_response_body or codes.is_error(response.status_code):
-                response.read()
+        Yields:
+            Request: Token requests, to be sent without authentication
+        """
+        token = self.token
+        with self._shared.lock:
+            if self._use_shared_token() and self.token != token:
+                self._schedule_refresh()
+                return
+            yield from self.get_new_token_generator()
+            self._token_updated()
+            self._cache_token()
+
+    async def async_refresh_flow(self) -> AsyncGenerator[Request, Response]:
+        """Get a new token before the current one expires, in a task.
+
+        The token is requested holding the same lock as
+        :py:meth:`async_auth_flow`, so it's never requested twice at a time.
+        If another task got a new token meanwhile, that one is used instead.
 
+        Yields:
+            Request: Token requests, to be sent without authentication
+        """
+        token = self.token
+        async with self._lock:
+            if self._use_shared_token() and self.token != token:
+                self._schedule_refresh()
+                return
+            flow = self.get_new_token_generator()
             try:
-                request = flow.send(response)
+                request = next(flow)
+                while True:
+                    response = yield request
+                    request = flow.send(response)
             except StopIteration:
-                break
+                pass
+            self._token_updated()
+            self._cache_token()
@@ -18,6 +18,9 @@ class ClientCredentials(_RequestBasedAuth):
         client_secret (str): Client secret
         use_token_cache (bool): True if token should be cached in filesystem;
             False otherwise
+        refresh_ahead (Optional[float]): Fraction of the token lifetime after
+            which it's refreshed in the background; None to only refresh
+            expired tokens
 
     Attributes:
         client_id (str): Client ID
@@ -27,8 +30,6 @@ class ClientCredentials(_RequestBasedAuth):
     __slots__ = (
         "client_id",
         "client_secret",
-        "_token",
-        "_expires",
         "_use_token_cache",
         "_user_agent",
     )
@@ -38,10 +39,11 @@ class ClientCredentials(_RequestBasedAuth):
         client_id: str,
         client_secret: str,
         use_token_cache: bool = True,
+        refresh_ahead: Optional[float] = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
-        super().__init__(use_token_cache)
+        super().__init__(use_token_cache, refresh_ahead)
 
     def copy(self) -> "ClientCredentials":
         """Make another auth object with same credentials.
@@ -49,8 +51,13 @@ class ClientCredentials(_RequestBasedAuth):
         Returns:
             ClientCredentials: Auth object
         """
-        return ClientCredentials(
-            self.client_id, self.client_secret, self._use_token_cache
+        return self._share_token(
+            ClientCredentials(
+                self.client_id,
+                self.client_secret,
+                self._use_token_cache,
+                self._refresh_ahead,
+            )
         )
 
     @property
@@ -12,11 +12,7 @@ class FireboltCore(Auth):
     which do not require authentication.
     """
 
-    __slots__ = (
-        "_token",
-        "_expires",
-        "_use_token_cache",
-    )
+    __slots__ = ("_use_token_cache",)
 
     def __init__(self) -> None:
         # Initialize with no token caching
@@ -24,8 +20,7 @@ class FireboltCore(Auth):
 
         # FireboltCore doesn't need a token, but we provide an empty one
         # to satisfy the Auth interface requirements
-        self._token = ""
-        self._expires = None
+        self._token_info = ("", None)
 
     @property
     def principal(self) -> str:
@@ -116,3 +111,17 @@ class FireboltCore(Auth):
         """
         # Yield the request without authentication
         yield request
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        """Override sync auth flow for Firebolt Core to avoid sending auth headers.
+
+        This implementation ensures no Authorization headers are sent.
+
+        Args:
+            request: The request to authenticate
+
+        Yields:
+            The request without authentication headers
+        """
+        # Yield the request without authentication
+        yield request
@@ -1,7 +1,7 @@
 from time import time
-from typing import Generator
+from typing import Generator, Optional
 
-from httpx import Request, Response, codes
+from httpx import URL, Request, Response, codes
 
 from firebolt.client.auth.base import Auth
 from firebolt.client.constants import _REQUEST_ERRORS
@@ -12,10 +12,20 @@ from firebolt.utils.usage_tracker import get_user_agent_header
 class _RequestBasedAuth(Auth):
     """Base abstract class for http request based authentication."""
 
-    def __init__(self, use_token_cache: bool = True):
+    def __init__(
+        self, use_token_cache: bool = True, refresh_ahead: Optional[float] = None
+    ):
         self._user_agent = get_user_agent_header()
         self.requires_response_body = False
-        super().__init__(use_token_cache)
+        super().__init__(use_token_cache, refresh_ahead)
+
+    def _bind_token_registry(self, auth_endpoint: URL) -> None:
+        """Share tokens with all auth objects with the same credentials.
+
+        Args:
+            auth_endpoint (URL): Endpoint tokens are requested from
+        """
+        self._use_token_registry(auth_endpoint)
 
     def _make_auth_request(self) -> Request:
         """Create an HTTP request required for authentication.
@@ -53,8 +63,10 @@ class _RequestBasedAuth(Auth):
             parsed = response.json()
             self._check_response_error(parsed)
 
-            self._token = parsed["access_token"]
-            self._expires = int(time()) + int(parsed["expires_in"])
+            self._token_info = (
+                parsed["access_token"],
+                int(time()) + int(parsed["expires_in"]),
+            )
 
         except _REQUEST_ERRORS as e:
             if e.response.status_code == codes.UNAUTHORIZED:
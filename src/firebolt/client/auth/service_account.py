@@ -18,6 +18,9 @@ class ServiceAccount(_RequestBasedAuth):
         client_secret (str): Client secret
         use_token_cache (bool): True if token should be cached in filesystem;
             False otherwise
+        refresh_ahead (Optional[float]): Fraction of the token lifetime after
+            which it's refreshed in the background; None to only refresh
+            expired tokens
 
     Attributes:
         client_id (str): Client ID
@@ -27,8 +30,6 @@ class ServiceAccount(_RequestBasedAuth):
     __slots__ = (
         "client_id",
         "client_secret",
-        "_token",
-        "_expires",
         "_use_token_cache",
         "_user_agent",
     )
@@ -38,10 +39,11 @@ class ServiceAccount(_RequestBasedAuth):
         client_id: str,
         client_secret: str,
         use_token_cache: bool = True,
+        refresh_ahead: Optional[float] = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
-        super().__init__(use_token_cache)
+        super().__init__(use_token_cache, refresh_ahead)
 
     @property
     def principal(self) -> str:
@@ -75,7 +77,14 @@ class ServiceAccount(_RequestBasedAuth):
         Returns:
             ServiceAccount: Auth object
         """
-        return ServiceAccount(self.client_id, self.client_secret, self._use_token_cache)
+        return self._share_token(
+            ServiceAccount(
+                self.client_id,
+                self.client_secret,
+                self._use_token_cache,
+                self._refresh_ahead,
+            )
+        )
 
     @cached_property
     def _token_storage(self) -> Optional[TokenSecureStorage]:
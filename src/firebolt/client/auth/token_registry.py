@@ -0,0 +1,134 @@
+"""Process-wide registry of tokens shared between auth objects.
+
+Auth objects that request tokens from the identity service look up a token
+in this registry before requesting a new one, and publish every new token to
+it. Tokens are registered by auth class, principal, a hash of the secret and
+the auth endpoint, so auth objects with the same credentials share a token,
+while objects with a different secret never get it.
+
+Entries are evicted once no auth object uses them and their token has
+expired.
+"""
+
+from threading import Lock
+from time import time
+from typing import Dict, Hashable, Optional, Tuple
+from weakref import WeakValueDictionary
+
+TokenKey = Tuple[Hashable, ...]
+
+# Minimum number of lookups between checks for entries to evict
+EVICTION_INTERVAL = 256
+
+
+class TokenEntry:
+    """Token and its expiration, shared by auth objects with the same key.
+
+    The lock makes sure only one thread at a time requests a new token;
+    other threads wait for it and reuse the token it got.
+    """
+
+    __slots__ = ("lock", "_value", "__weakref__")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # Token and expiration are replaced together, so that readers in other
+        # threads never see a token with the expiration of another one
+        self._value: Tuple[Optional[str], Optional[int]] = (None, None)
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._value[0]
+
+    @property
+    def expires(self) -> Optional[int]:
+        return self._value[1]
+
+    def valid_token(self) -> Optional[Tuple[str, Optional[int]]]:
+        """Get the token and its expiration, if the token isn't expired.
+
+        Returns:
+            Optional[Tuple[str, Optional[int]]]: Token and expiration timestamp
+        """
+        token, expires = self._value
+        if not token or (expires is not None and expires <= int(time())):
+            return None
+        return token, expires
+
+    def publish(self, token: str, expires: Optional[int]) -> None:
+        """Store a new token.
+
+        Args:
+            token (str): New token
+            expires (Optional[int]): Token expiration timestamp
+        """
+        self._value = (token, expires)
+
+
+class TokenRegistry:
+    """Token entries, created on first use and looked up by key.
+
+    Entries are referenced weakly, so that auth objects using an entry keep it
+    alive. Looked up entries are also kept, until a periodic check finds
+    their token expired.
+
+    Args:
+        eviction_interval (int): Minimum number of lookups between checks
+            for entries to evict
+    """
+
+    def __init__(self, eviction_interval: int = EVICTION_INTERVAL) -> None:
+        self._lock = Lock()
+        self._entries: "WeakValueDictionary[TokenKey, TokenEntry]" = (
+            WeakValueDictionary()
+        )
+        self._kept: Dict[TokenKey, TokenEntry] = {}
+        self._eviction_interval = eviction_interval
+        self._lookups = 0
+        self._evict_after = eviction_interval
+
+    def entry(self, key: TokenKey) -> TokenEntry:
+        """Get the entry for a key, creating it if needed.
+
+        Args:
+            key (TokenKey): Auth class, principal, secret hash and auth endpoint
+
+        Returns:
+            TokenEntry: Registry entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = TokenEntry()
+            self._kept[key] = entry
+            self._lookups += 1
+            if self._lookups >= self._evict_after:
+                self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Only keep the entries with a valid token.
+
+        The check runs after at least as many lookups as there are entries,
+        so on average it takes constant time per lookup.
+        """
+        self._kept = {
+            key: entry
+            for key, entry in list(self._entries.items())
+            if entry.valid_token() is not None
+        }
+        self._lookups = 0
+        self._evict_after = max(self._eviction_interval, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all tokens."""
+        with self._lock:
+            self._entries.clear()
+            self._kept.clear()
+            self._lookups = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_registry = TokenRegistry()
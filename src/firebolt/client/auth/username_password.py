@@ -18,6 +18,9 @@ class UsernamePassword(_RequestBasedAuth):
         password (str): Password
         use_token_cache (bool): True if token should be cached in filesystem;
             False otherwise
+        refresh_ahead (Optional[float]): Fraction of the token lifetime after
+            which it's refreshed in the background; None to only refresh
+            expired tokens
 
     Attributes:
         username (str): Username
@@ -27,8 +30,6 @@ class UsernamePassword(_RequestBasedAuth):
     __slots__ = (
         "username",
         "password",
-        "_token",
-        "_expires",
         "_use_token_cache",
         "_user_agent",
     )
@@ -38,10 +39,11 @@ class UsernamePassword(_RequestBasedAuth):
         username: str,
         password: str,
         use_token_cache: bool = True,
+        refresh_ahead: Optional[float] = None,
     ):
         self.username = username
         self.password = password
-        super().__init__(use_token_cache)
+        super().__init__(use_token_cache, refresh_ahead)
 
     @property
     def principal(self) -> str:
@@ -75,7 +77,14 @@ class UsernamePassword(_RequestBasedAuth):
         Returns:
             UsernamePassword: Auth object
         """
-        return UsernamePassword(self.username, self.password, self._use_token_cache)
+        return self._share_token(
+            UsernamePassword(
+                self.username,
+                self.password,
+                self._use_token_cache,
+                self._refresh_ahead,
+            )
+        )
 
     @cached_property
     def _token_storage(self) -> Optional[TokenSecureStorage]:
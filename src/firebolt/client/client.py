@@ -1,9 +1,13 @@
+import logging
 from abc import ABCMeta, abstractmethod
 from json import JSONDecodeError
-from typing import Any, Dict, Optional
+from threading import Thread
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, Set
 
-from httpx import URL
+import sniffio
+from httpx import URL, AsyncBaseTransport
 from httpx import AsyncClient as HttpxAsyncClient
+from httpx import BaseTransport
 from httpx import Client as HttpxClient
 from httpx import HTTPStatusError, Request, RequestError, Response
 from httpx import codes as HttpxCodes
@@ -17,8 +21,10 @@ from firebolt.client.constants import (
     PROTOCOL_VERSION_HEADER_NAME,
 )
 from firebolt.client.http_backend import (
+    DEFAULT_TRANSPORT_OPTIONS,
     AsyncKeepaliveTransport,
     KeepaliveTransport,
+    TransportOptions,
 )
 from firebolt.utils.exception import (
     AccountNotFoundError,
@@ -40,11 +46,41 @@ from firebolt.utils.util import (
     mixin_for,
 )
 
+if TYPE_CHECKING:
+    from asyncio import Task
+
+logger = logging.getLogger(__name__)
+
 FireboltClientMixinBase = mixin_for(HttpxClient)  # type: Any
 
+# Keep references to background tasks, so they aren't garbage collected
+_background_tasks: Set["Task[None]"] = set()
+
+
+def _spawn_background_task(func: Callable[[], Coroutine[Any, Any, None]]) -> None:
+    """Run a task in the current event loop without waiting for it."""
+    if sniffio.current_async_library() == "trio":
+        import trio
+
+        trio.lowlevel.spawn_system_task(func)
+        return
+
+    import asyncio
+
+    task = asyncio.get_running_loop().create_task(func())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 
 class FireboltClientMixin(FireboltClientMixinBase):
-    """HttpxAsyncClient mixin with Firebolt authentication functionality."""
+    """HttpxAsyncClient mixin with Firebolt authentication functionality.
+
+    With ``http2=True`` requests are sent over HTTP/2 when the server supports
+    it, so concurrent requests to one host share a single TCP connection.
+    ``transport_options`` configure the connection pool and socket settings.
+    A ``transport`` can be passed instead, e.g. to share one between clients,
+    in which case the client closes it when it is closed itself.
+    """
 
     def __init__(
         self,
@@ -52,25 +88,36 @@ class FireboltClientMixin(FireboltClientMixinBase):
         auth: Auth,
         account_name: Optional[str] = None,
         api_endpoint: str = DEFAULT_API_URL,
+        http2: bool = False,
+        transport_options: Optional[TransportOptions] = None,
         **kwargs: Any,
     ):
         self.account_name = account_name
         self._api_endpoint = URL(fix_url_schema(api_endpoint))
-        self._auth_endpoint = get_auth_endpoint(self._api_endpoint)
-        super().__init__(*args, auth=auth, **kwargs)
+        self._auth_endpoint = self._get_auth_endpoint()
+        self._http2 = http2
+        self._transport_options = transport_options
+        # Only token requests are sent without authentication
+        assert auth is not None, "Client requires authentication"
+        super().__init__(*args, auth=auth, http2=http2, **kwargs)
         self._set_default_header(PROTOCOL_VERSION_HEADER_NAME, PROTOCOL_VERSION)
+        auth._bind_token_registry(self._auth_endpoint)
+
+    def _get_auth_endpoint(self) -> URL:
+        return get_auth_endpoint(self._api_endpoint)
 
     def _set_default_header(self, key: str, value: str) -> None:
         if key not in self.headers:
             self.headers[key] = value
 
-    def _build_auth(self, auth: Optional[AuthTypes]) -> Auth:
+    def _build_auth(self, auth: Optional[AuthTypes]) -> Optional[Auth]:
         """Create Auth object based on auth provided.
 
         Overrides ``httpx.Client._build_auth``
 
         Args:
-            auth (AuthTypes): Provided auth
+            auth (Optional[AuthTypes]): Provided auth, None to send a request
+                without authentication
 
         Returns:
             Optional[Auth]: Auth object
@@ -80,7 +127,6 @@ class FireboltClientMixin(FireboltClientMixinBase):
         """
         if not (auth is None or isinstance(auth, Auth)):
             raise TypeError(f'Invalid "auth" argument: {auth!r}')
-        assert auth is not None  # type check
         return auth
 
     def _merge_auth_request(self, request: Request) -> Request:
@@ -101,15 +147,24 @@ class FireboltClientMixin(FireboltClientMixinBase):
             api_endpoint=str(self._api_endpoint),
             timeout=self.timeout,
             headers=self.headers,
+            http2=self._http2,
+            transport_options=self._transport_options,
         )
 
 
 class Client(FireboltClientMixin, HttpxClient, metaclass=ABCMeta):
-    def __init__(self, *args: Any, **kwargs: Any):
+    def __init__(
+        self, *args: Any, transport: Optional[BaseTransport] = None, **kwargs: Any
+    ):
         super().__init__(
             *args,
             **kwargs,
-            transport=KeepaliveTransport(verify=kwargs.get("verify", True)),
+            transport=transport
+            or KeepaliveTransport(
+                verify=kwargs.get("verify", True),
+                http2=kwargs.get("http2", False),
+                options=kwargs.get("transport_options") or DEFAULT_TRANSPORT_OPTIONS,
+            ),
         )
 
     @property
@@ -117,6 +172,32 @@ class Client(FireboltClientMixin, HttpxClient, metaclass=ABCMeta):
     def account_id(self) -> str:
         ...
 
+    def send(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        auth = self.auth
+        if isinstance(auth, Auth) and auth._claim_refresh():
+            Thread(
+                target=self._refresh_token,
+                args=(auth,),
+                name="firebolt-token-refresh",
+                daemon=True,
+            ).start()
+        return super().send(request, *args, **kwargs)
+
+    def _refresh_token(self, auth: Auth) -> None:
+        """Get a new token before the current one expires."""
+        flow = auth.sync_refresh_flow()
+        try:
+            request = next(flow)
+            while True:
+                request = flow.send(self.send(request, auth=None))
+        except StopIteration:
+            pass
+        except Exception as e:
+            # The token is refreshed when a request finds it expired
+            logger.warning(f"Failed to refresh token in the background: {e}")
+        finally:
+            flow.close()
+
     def _send_handling_redirects(
         self, request: Request, *args: Any, **kwargs: Any
     ) -> Response:
@@ -188,7 +269,9 @@ class ClientV1(Client):
             api_endpoint=api_endpoint,
             **kwargs,
         )
-        self._auth_endpoint = URL(fix_url_schema(api_endpoint))
+
+    def _get_auth_endpoint(self) -> URL:
+        return self._api_endpoint
 
     @cached_property
     def account_id(self) -> str:
@@ -272,11 +355,21 @@ class ClientV1(Client):
 
 
 class AsyncClient(FireboltClientMixin, HttpxAsyncClient, metaclass=ABCMeta):
-    def __init__(self, *args: Any, **kwargs: Any):
+    def __init__(
+        self,
+        *args: Any,
+        transport: Optional[AsyncBaseTransport] = None,
+        **kwargs: Any,
+    ):
         super().__init__(
             *args,
             **kwargs,
-            transport=AsyncKeepaliveTransport(verify=kwargs.get("verify", True)),
+            transport=transport
+            or AsyncKeepaliveTransport(
+                verify=kwargs.get("verify", True),
+                http2=kwargs.get("http2", False),
+                options=kwargs.get("transport_options") or DEFAULT_TRANSPORT_OPTIONS,
+            ),
         )
 
     @property
@@ -284,6 +377,27 @@ class AsyncClient(FireboltClientMixin, HttpxAsyncClient, metaclass=ABCMeta):
     async def account_id(self) -> str:
         ...
 
+    async def send(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        auth = self.auth
+        if isinstance(auth, Auth) and auth._claim_refresh():
+            _spawn_background_task(lambda: self._refresh_token(auth))
+        return await super().send(request, *args, **kwargs)
+
+    async def _refresh_token(self, auth: Auth) -> None:
+        """Get a new token before the current one expires."""
+        flow = auth.async_refresh_flow()
+        try:
+            request = await flow.__anext__()
+            while True:
+                request = await flow.asend(await self.send(request, auth=None))
+        except StopAsyncIteration:
+            pass
+        except Exception as e:
+            # The token is refreshed when a request finds it expired
+            logger.warning(f"Failed to refresh token in the background: {e}")
+        finally:
+            await flow.aclose()
+
     async def _send_handling_redirects(
         self, request: Request, *args: Any, **kwargs: Any
     ) -> Response:
@@ -356,7 +470,9 @@ class AsyncClientV1(AsyncClient):
             **kwargs,
         )
         self.account_id_cache: Dict[str, str] = {}
-        self._auth_endpoint = URL(fix_url_schema(api_endpoint))
+
+    def _get_auth_endpoint(self) -> URL:
+        return self._api_endpoint
 
     @property
     async def account_id(self) -> str:
@@ -1,5 +1,9 @@
+import os
 import socket
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from ssl import SSLContext
+from typing import Any, Optional, Union
 
 try:
     from httpcore.backends.auto import AutoBackend  # type: ignore
@@ -8,12 +12,109 @@ except ImportError:
     from httpcore._backends.auto import AutoBackend  # type: ignore
     from httpcore._backends.sync import SyncBackend  # type: ignore
 
-from httpx import AsyncHTTPTransport, HTTPTransport
+from httpx import AsyncHTTPTransport, HTTPTransport, Limits
+
+try:
+    from httpx import create_ssl_context
+except ImportError:  # httpx < 0.28
+    from httpx._config import create_ssl_context  # type: ignore
 
 from firebolt.common.constants import KEEPALIVE_FLAG, KEEPIDLE_RATE
 
 
-def override_stream(stream):  # type: ignore [no-untyped-def]
+@dataclass(frozen=True)
+class TransportOptions:
+    """Connection pool and socket settings of the HTTP transport.
+
+    Args:
+        max_connections (Optional[int]): Maximum number of open connections,
+            None for no limit
+        max_keepalive_connections (Optional[int]): Maximum number of idle
+            connections kept open, None for no limit
+        keepalive_expiry (Optional[float]): Seconds an idle connection is kept
+            open, None to keep it until the server closes it
+        tcp_nodelay (bool): Disable Nagle's algorithm, so small requests are sent
+            without delay
+        keepalive_idle (int): Seconds of inactivity before TCP keepalive probes
+            are sent
+        keepalive_interval (Optional[int]): Seconds between TCP keepalive probes,
+            None for the system default
+        keepalive_count (Optional[int]): Number of unanswered TCP keepalive
+            probes before the connection is dropped, None for the system default
+        local_address (Optional[str]): Local IP address to bind connections to
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    tcp_nodelay: bool = True
+    keepalive_idle: int = KEEPIDLE_RATE
+    keepalive_interval: Optional[int] = None
+    keepalive_count: Optional[int] = None
+    local_address: Optional[str] = None
+
+    @property
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+DEFAULT_TRANSPORT_OPTIONS = TransportOptions()
+
+
+def get_ssl_context(
+    verify: Union[SSLContext, str, bool] = True,
+    http2: bool = False,
+    trust_env: bool = True,
+) -> SSLContext:
+    """Get an SSL context for the verify settings, shared within the process.
+
+    Creating a context loads the trusted certificates, which is slow, so each
+    distinct combination of settings only does it once.
+
+    Args:
+        verify (Union[SSLContext, str, bool]): Verify settings, as accepted
+            by httpx. A context is returned as is.
+        http2 (bool): Whether the context is used for HTTP/2 connections. The
+            HTTP client sets the negotiated protocols on the context, so HTTP/1.1
+            and HTTP/2 clients don't share one.
+        trust_env (bool): Use SSL_CERT_FILE and SSL_CERT_DIR environment
+            variables, as httpx does
+
+    Returns:
+        SSLContext: SSL context
+    """
+    if isinstance(verify, SSLContext):
+        return verify
+    if trust_env:
+        return _create_ssl_context(
+            verify,
+            http2,
+            trust_env,
+            os.environ.get("SSL_CERT_FILE"),
+            os.environ.get("SSL_CERT_DIR"),
+        )
+    return _create_ssl_context(verify, http2, trust_env, None, None)
+
+
+@lru_cache(maxsize=None)
+def _create_ssl_context(
+    verify: Union[str, bool],
+    http2: bool,
+    trust_env: bool,
+    cert_file: Optional[str],
+    cert_dir: Optional[str],
+) -> SSLContext:
+    # http2 and the certificate locations are only part of the cache key
+    return create_ssl_context(verify=verify, trust_env=trust_env)
+
+
+def override_stream(  # type: ignore [no-untyped-def]
+    stream, options: TransportOptions = DEFAULT_TRANSPORT_OPTIONS
+):
     keepidle = getattr(socket, "TCP_KEEPIDLE", 0x10)  # 0x10 is TCP_KEEPALIVE on mac
 
     sock = (
@@ -24,8 +125,18 @@ def override_stream(stream):  # type: ignore [no-untyped-def]
 
     # Enable keepalive
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, KEEPALIVE_FLAG)
-    # Set keepalive to 60 seconds
-    sock.setsockopt(socket.IPPROTO_TCP, keepidle, KEEPIDLE_RATE)
+    # Set keepalive to 60 seconds by default
+    sock.setsockopt(socket.IPPROTO_TCP, keepidle, options.keepalive_idle)
+    # Not all platforms support configuring interval and count
+    if options.keepalive_interval is not None and hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, options.keepalive_interval
+        )
+    if options.keepalive_count is not None and hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, options.keepalive_count)
+    # httpcore enables TCP_NODELAY, only disable it if requested
+    if not options.tcp_nodelay:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
     return stream
 
 
@@ -39,13 +150,17 @@ class AsyncOverriddenHttpBackend(AutoBackend):
     and `KEEPIDLE` settings.
     """
 
+    def __init__(self, options: TransportOptions = DEFAULT_TRANSPORT_OPTIONS):
+        super().__init__()
+        self._options = options
+
     async def connect_tcp(self, *args, **kwargs):  # type: ignore
         stream = await super().connect_tcp(*args, **kwargs)
-        return override_stream(stream)
+        return override_stream(stream, self._options)
 
     async def open_tcp_stream(self, *args, **kwargs):  # type: ignore
         stream = await super().open_tcp_stream(*args, **kwargs)
-        return override_stream(stream)
+        return override_stream(stream, self._options)
 
 
 class OverriddenHttpBackend(SyncBackend):
@@ -58,28 +173,62 @@ class OverriddenHttpBackend(SyncBackend):
     and `KEEPIDLE` settings.
     """
 
+    def __init__(self, options: TransportOptions = DEFAULT_TRANSPORT_OPTIONS):
+        super().__init__()
+        self._options = options
+
     def connect_tcp(self, *args, **kwargs):  # type: ignore
         stream = super().connect_tcp(*args, **kwargs)
-        return override_stream(stream)
+        return override_stream(stream, self._options)
 
     def open_tcp_stream(self, *args, **kwargs):  # type: ignore
         stream = super().open_tcp_stream(*args, **kwargs)
-        return override_stream(stream)
+        return override_stream(stream, self._options)
 
 
 class AsyncKeepaliveTransport(AsyncHTTPTransport):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        options: TransportOptions = DEFAULT_TRANSPORT_OPTIONS,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("limits", options.limits)
+        kwargs.setdefault("local_address", options.local_address)
+        if kwargs.get("cert") is None:
+            kwargs["verify"] = get_ssl_context(
+                kwargs.get("verify", True),
+                kwargs.get("http2", False),
+                kwargs.get("trust_env", True),
+            )
+        self._verify = kwargs.get("verify", True)
         super().__init__(*args, **kwargs)
+        backend = AsyncOverriddenHttpBackend(options)
         if hasattr(self._pool, "_network_backend"):
-            self._pool._network_backend = AsyncOverriddenHttpBackend()  # type: ignore
+            self._pool._network_backend = backend  # type: ignore
         if hasattr(self._pool, "_backend"):
-            self._pool._backend = AsyncOverriddenHttpBackend()  # type: ignore
+            self._pool._backend = backend  # type: ignore
 
 
 class KeepaliveTransport(HTTPTransport):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        options: TransportOptions = DEFAULT_TRANSPORT_OPTIONS,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("limits", options.limits)
+        kwargs.setdefault("local_address", options.local_address)
+        if kwargs.get("cert") is None:
+            kwargs["verify"] = get_ssl_context(
+                kwargs.get("verify", True),
+                kwargs.get("http2", False),
+                kwargs.get("trust_env", True),
+            )
+        self._verify = kwargs.get("verify", True)
         super().__init__(*args, **kwargs)
+        backend = OverriddenHttpBackend(options)
         if hasattr(self._pool, "_network_backend"):
-            self._pool._network_backend = OverriddenHttpBackend()  # type: ignore
+            self._pool._network_backend = backend  # type: ignore
         if hasattr(self._pool, "_backend"):
-            self._pool._backend = OverriddenHttpBackend()  # type: ignore
+            self._pool._backend = backend  # type: ignore
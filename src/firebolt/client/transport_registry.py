@@ -0,0 +1,189 @@
+"""Process-wide registry of HTTP transports shared between connections.
+
+Each connection owns an HTTP client with its own connection pool. Connections
+opened with ``share_transport=True`` instead use a transport shared by all
+connections to the same engine with the same TLS and transport settings and
+the same auth principal, so sockets are reused across connections. Headers,
+auth and session state stay on each connection's client.
+
+A shared transport is closed when the last client using it is closed.
+"""
+
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import sniffio
+from httpx import URL, AsyncBaseTransport, BaseTransport, Request, Response
+
+from firebolt.client.auth import Auth
+from firebolt.client.client import AsyncClient, Client
+from firebolt.client.http_backend import (
+    DEFAULT_TRANSPORT_OPTIONS,
+    AsyncKeepaliveTransport,
+    KeepaliveTransport,
+)
+
+TransportKey = Tuple[Hashable, ...]
+T = TypeVar("T")
+
+
+class _Entry(Generic[T]):
+    __slots__ = ("transport", "references")
+
+    def __init__(self, transport: T):
+        self.transport = transport
+        self.references = 0
+
+
+class TransportRegistry(Generic[T]):
+    """Reference counted transports, created on first use and looked up by key."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: Dict[TransportKey, _Entry[T]] = {}
+
+    def acquire(self, key: TransportKey, factory: Callable[[], T]) -> T:
+        """Get the transport for a key, creating it if needed.
+
+        Every call must be matched by a :py:meth:`release` call.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(factory())
+            entry.references += 1
+            return entry.transport
+
+    def release(self, key: TransportKey) -> Optional[T]:
+        """Release a reference, return the transport if it should be closed."""
+        with self._lock:
+            entry = self._entries[key]
+            entry.references -= 1
+            if entry.references > 0:
+                return None
+            del self._entries[key]
+            return entry.transport
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SharedTransport(BaseTransport):
+    """A client's reference to a registered transport."""
+
+    def __init__(
+        self,
+        registry: TransportRegistry[BaseTransport],
+        key: TransportKey,
+        factory: Callable[[], BaseTransport],
+    ) -> None:
+        self._registry = registry
+        self._key = key
+        self._closed = False
+        self._transport = registry.acquire(key, factory)
+
+    def handle_request(self, request: Request) -> Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = self._registry.release(self._key)
+        if transport is not None:
+            transport.close()
+
+
+class AsyncSharedTransport(AsyncBaseTransport):
+    """A client's reference to a registered async transport."""
+
+    def __init__(
+        self,
+        registry: TransportRegistry[AsyncBaseTransport],
+        key: TransportKey,
+        factory: Callable[[], AsyncBaseTransport],
+    ) -> None:
+        self._registry = registry
+        self._key = key
+        self._closed = False
+        self._transport = registry.acquire(key, factory)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = self._registry.release(self._key)
+        if transport is not None:
+            await transport.aclose()
+
+
+transport_registry: TransportRegistry[BaseTransport] = TransportRegistry()
+async_transport_registry: TransportRegistry[AsyncBaseTransport] = TransportRegistry()
+
+
+def _transport_key(client: Union[Client, AsyncClient], url: str) -> TransportKey:
+    assert isinstance(client.auth, Auth)  # Type check
+    engine_url = URL(url)
+    return (
+        engine_url.scheme,
+        engine_url.host,
+        engine_url.port,
+        getattr(client._transport, "_verify", True),
+        client._http2,
+        client._transport_options or DEFAULT_TRANSPORT_OPTIONS,
+        client.auth.principal,
+    )
+
+
+def _current_event_loop() -> Hashable:
+    # Async transports can only be used within the event loop they were created in
+    if sniffio.current_async_library() == "trio":
+        import trio
+
+        return trio.lowlevel.current_trio_token()  # type: ignore[return-value]
+
+    import asyncio
+
+    return asyncio.get_running_loop()
+
+
+def use_shared_transport(client: Client, url: str) -> None:
+    """Switch the client to the transport shared by clients connecting to url."""
+    transport = client._transport
+    client._transport = SharedTransport(
+        transport_registry,
+        _transport_key(client, url),
+        lambda: KeepaliveTransport(
+            verify=getattr(transport, "_verify", True),
+            http2=client._http2,
+            options=client._transport_options or DEFAULT_TRANSPORT_OPTIONS,
+        ),
+    )
+    transport.close()
+
+
+async def async_use_shared_transport(client: AsyncClient, url: str) -> None:
+    """Switch the client to the transport shared by clients connecting to url."""
+    transport = client._transport
+    client._transport = AsyncSharedTransport(
+        async_transport_registry,
+        _transport_key(client, url) + (_current_event_loop(),),
+        lambda: AsyncKeepaliveTransport(
+            verify=getattr(transport, "_verify", True),
+            http2=client._http2,
+            options=client._transport_options or DEFAULT_TRANSPORT_OPTIONS,
+        ),
+    )
+    await transport.aclose()
@@ -1 +1,12 @@
-from firebolt.common.settings import Settings
+from typing import TYPE_CHECKING
+
+from firebolt.utils.lazy_import import lazy_getattr
+
+if TYPE_CHECKING:
+    from firebolt.common.settings import Settings
+
+__all__ = ["Settings"]
+
+# Settings depend on pydantic and the http client, which are only imported
+# when Settings are first used
+__getattr__ = lazy_getattr(__name__, {"Settings": "firebolt.common.settings"})
@@ -5,8 +5,10 @@ from collections import namedtuple
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from io import StringIO
-from typing import Any, Dict, List, Sequence, Tuple, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Sequence, Tuple, Union
+from weakref import WeakValueDictionary
 
 try:
     from ciso8601 import parse_datetime  # type: ignore
@@ -79,10 +81,28 @@ ROWID = int
 
 
 class ExtendedType:
-    """Base type for all extended types in Firebolt (array, decimal, struct, etc.)."""
+    """Base type for all extended types in Firebolt (array, decimal, struct, etc.).
+
+    Extended types are immutable, so the instances returned by
+    :py:func:`parse_type` can be shared between result sets.
+    """
 
     __name__ = "ExtendedType"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__name__} type is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__name__} type is immutable")
+
+    def _intern_key(self) -> Hashable:
+        """Key identifying equal types, used to intern parsed types.
+
+        Built-in extended types override it, so equal types share an instance.
+        Other types are never shared, each instance having a key of its own.
+        """
+        return (type(self), id(self))
+
     @staticmethod
     def is_valid_type(type_: Any) -> bool:
         return type_ in _col_types or isinstance(type_, ExtendedType)
@@ -103,7 +123,8 @@ class ARRAY(ExtendedType):
     def __init__(self, subtype: Union[type, ExtendedType]):
         if not self.is_valid_type(subtype):
             raise ValueError(f"Invalid array subtype: {str(subtype)}")
-        self.subtype = subtype
+        self.subtype: Union[type, ExtendedType]
+        object.__setattr__(self, "subtype", subtype)
 
     def __str__(self) -> str:
         return f"Array({str(self.subtype)})"
@@ -113,6 +134,9 @@ class ARRAY(ExtendedType):
             return NotImplemented
         return other.subtype == self.subtype
 
+    def _intern_key(self) -> Hashable:
+        return (ARRAY, self.subtype)
+
     __hash__ = ExtendedType.__hash__
 
 
@@ -123,8 +147,10 @@ class DECIMAL(ExtendedType):
     _prefixes = ["Decimal(", "numeric("]
 
     def __init__(self, precision: int, scale: int):
-        self.precision = precision
-        self.scale = scale
+        self.precision: int
+        self.scale: int
+        object.__setattr__(self, "precision", precision)
+        object.__setattr__(self, "scale", scale)
 
     def __str__(self) -> str:
         return f"Decimal({self.precision}, {self.scale})"
@@ -134,6 +160,9 @@ class DECIMAL(ExtendedType):
             return NotImplemented
         return other.precision == self.precision and other.scale == self.scale
 
+    def _intern_key(self) -> Hashable:
+        return (DECIMAL, self.precision, self.scale)
+
     __hash__ = ExtendedType.__hash__
 
 
@@ -145,7 +174,8 @@ class STRUCT(ExtendedType):
         for name, type_ in fields.items():
             if not self.is_valid_type(type_):
                 raise ValueError(f"Invalid struct field type: {str(type_)}")
-        self.fields = fields
+        self.fields: Mapping[str, Union[type, ExtendedType]]
+        object.__setattr__(self, "fields", MappingProxyType(dict(fields)))
 
     def __str__(self) -> str:
         return f"Struct({', '.join(f'{k}: {v}' for k, v in self.fields.items())})"
@@ -153,6 +183,13 @@ class STRUCT(ExtendedType):
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, STRUCT) and other.fields == self.fields
 
+    def _intern_key(self) -> Hashable:
+        return (STRUCT, tuple(self.fields.items()))
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+        # Mapping proxies can't be pickled or copied, pass the fields as a dict
+        return STRUCT, (dict(self.fields),)
+
     __hash__ = ExtendedType.__hash__
 
 
@@ -222,21 +259,18 @@ def split_struct_fields(raw_struct: str) -> List[str]:
     ['field1 int', 'field2 struct(field1 int, field2 text)']
     """
     balance = 0  # keep track of the level of nesting, and only split on level 0
-    separator = ","
     res = []
-    current = StringIO()
+    start = 0
     for i, ch in enumerate(raw_struct):
         if ch == "(":
             balance += 1
         elif ch == ")":
             balance -= 1
-        elif ch == separator and balance == 0:
-            res.append(current.getvalue().strip())
-            current = StringIO()
-            continue
-        current.write(ch)
+        elif ch == "," and balance == 0:
+            res.append(raw_struct[start:i].strip())
+            start = i + 1
 
-    res.append(current.getvalue().strip())
+    res.append(raw_struct[start:].strip())
     return res
 
 
@@ -263,20 +297,42 @@ def split_struct_field(raw_field: str) -> Tuple[str, str]:
     return name.strip(" `"), type_.strip()
 
 
-def parse_type(raw_type: str) -> Union[type, ExtendedType]:  # noqa: C901
-    """Parse typename provided by query metadata into Python type."""
+# Maximum number of distinct raw type strings to keep parsed types for
+PARSE_TYPE_CACHE_SIZE = 1024
+
+# Parsed extended types by their intern key, so equal types parsed from
+# different raw strings are the same object while any result set uses them
+_interned_types: "WeakValueDictionary[Hashable, ExtendedType]" = WeakValueDictionary()
+
+
+def _intern_type(type_: ExtendedType) -> ExtendedType:
+    return _interned_types.setdefault(type_._intern_key(), type_)
+
+
+def parse_type(raw_type: str) -> Union[type, ExtendedType]:
+    """Parse typename provided by query metadata into Python type.
+
+    Parsed types are cached by raw typename, and equal extended types are
+    interned, so the same type is returned as the same object and can be
+    compared by identity.
+    """
     if not isinstance(raw_type, str):
         raise DataError(f"Invalid typename {str(raw_type)}: str expected")
+    return _parse_type(raw_type)
+
+
+@lru_cache(maxsize=PARSE_TYPE_CACHE_SIZE)
+def _parse_type(raw_type: str) -> Union[type, ExtendedType]:  # noqa: C901
     # Handle arrays
     if raw_type.startswith(ARRAY._prefix) and raw_type.endswith(")"):
-        return ARRAY(parse_type(raw_type[len(ARRAY._prefix) : -1]))
+        return _intern_type(ARRAY(_parse_type(raw_type[len(ARRAY._prefix) : -1])))
     # Handle decimal
     for prefix in DECIMAL._prefixes:
         if raw_type.startswith(prefix) and raw_type.endswith(")"):
             try:
                 prec_scale = raw_type[len(prefix) : -1].split(",")
                 precision, scale = int(prec_scale[0]), int(prec_scale[1])
-                return DECIMAL(precision, scale)
+                return _intern_type(DECIMAL(precision, scale))
             except (ValueError, IndexError):
                 pass
     # Handle structs
@@ -286,13 +342,13 @@ def parse_type(raw_type: str) -> Union[type, ExtendedType]:  # noqa: C901
             fields = {}
             for f in fields_raw:
                 name, type_ = split_struct_field(f)
-                fields[name.strip()] = parse_type(type_.strip())
-            return STRUCT(fields)
+                fields[name.strip()] = _parse_type(type_.strip())
+            return _intern_type(STRUCT(fields))
         except ValueError:
             pass
     # Handle nullable
     if raw_type.endswith(NULLABLE_SUFFIX):
-        return parse_type(raw_type[: -len(NULLABLE_SUFFIX)].strip(" "))
+        return _parse_type(raw_type[: -len(NULLABLE_SUFFIX)].strip(" "))
     try:
         return _InternalType(raw_type).python_type
     except ValueError:
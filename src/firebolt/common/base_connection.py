@@ -1,5 +1,8 @@
 from collections import namedtuple
-from typing import Any, Dict, List, Optional, Tuple, Type
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from httpx import Headers, Request
 
@@ -76,6 +79,35 @@ def _parse_async_query_info_results(
     return async_query_infos
 
 
+@dataclass
+class ConnectionTimings:
+    """Time spent in each phase of establishing a connection, in seconds.
+
+    Database and engine resolution may run concurrently, in which case their
+    timings overlap.
+
+    Attributes:
+        system_engine: Retrieving the system engine url from the gateway
+        use_database: Resolving the database
+        use_engine: Resolving the engine url and parameters
+        total: Whole connection establishment
+    """
+
+    system_engine: float = 0.0
+    use_database: float = 0.0
+    use_engine: float = 0.0
+    total: float = 0.0
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the `with` block to a phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, phase, getattr(self, phase) + perf_counter() - start)
+
+
 class BaseConnection:
     def __init__(self, cursor_type: Type) -> None:
         self.cursor_type = cursor_type
@@ -84,6 +116,7 @@ class BaseConnection:
         self._transaction_id: Optional[str] = None
         self._transaction_sequence_id: Optional[str] = None
         self._autocommit: bool = True
+        self.connect_timings: Optional[ConnectionTimings] = None
 
     def _remove_cursor(self, cursor: Any) -> None:
         # This way it's atomic
@@ -156,6 +189,13 @@ class BaseConnection:
         """`True` if connection is closed; `False` otherwise."""
         return self._is_closed
 
+    def _detach_client(self) -> None:
+        """Mark the connection closed, leaving its client open for reuse.
+
+        All cursors of the connection must already be closed.
+        """
+        self._is_closed = True
+
 
 def get_cached_system_engine_info(
     auth: Auth,
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional
+
+from firebolt.utils.exception import ConfigurationError
+
+
+@dataclass
+class PoolMetrics:
+    """Snapshot of connection pool state and statistics.
+
+    Attributes:
+        size: Number of open connections, both idle and checked out
+        idle: Number of connections available for checkout
+        in_use: Number of checked out connections
+        waiters: Number of callers waiting for a connection
+        max_size: Maximum number of open connections
+        checkouts: Total number of successful checkouts
+        checkout_timeouts: Total number of checkouts that timed out
+        connections_created: Total number of connections opened
+        connections_closed: Total number of connections closed
+        total_checkout_time: Total time spent in checkouts, in seconds
+        max_checkout_time: Longest checkout, in seconds
+    """
+
+    size: int
+    idle: int
+    in_use: int
+    waiters: int
+    max_size: int
+    checkouts: int
+    checkout_timeouts: int
+    connections_created: int
+    connections_closed: int
+    total_checkout_time: float
+    max_checkout_time: float
+
+    @property
+    def avg_checkout_time(self) -> float:
+        """Average checkout latency, in seconds."""
+        return self.total_checkout_time / self.checkouts if self.checkouts else 0.0
+
+
+@dataclass
+class PooledConnection:
+    connection: Any
+    created_at: float
+    last_used_at: float
+
+
+class BasePool:
+    """Configuration, expiry rules and statistics shared by connection pools."""
+
+    def __init__(
+        self,
+        min_size: int,
+        max_size: int,
+        idle_timeout: Optional[float],
+        max_lifetime: Optional[float],
+        checkout_timeout: Optional[float],
+        health_check_interval: float,
+        prewarm: int,
+        has_factory: bool,
+        has_connect_kwargs: bool,
+    ):
+        if has_factory and has_connect_kwargs:
+            raise ConfigurationError(
+                "Either connection_factory or connect arguments should be provided."
+            )
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ConfigurationError(
+                "Pool sizes should satisfy 0 <= min_size <= max_size and max_size > 0."
+            )
+        if prewarm < 0:
+            raise ConfigurationError("prewarm must not be negative.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.prewarm = prewarm
+
+        # Open connections, including the ones being created
+        self._size = 0
+        self._closed = False
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._connections_created = 0
+        self._connections_closed = 0
+        self._total_checkout_time = 0.0
+        self._max_checkout_time = 0.0
+
+    @property
+    def closed(self) -> bool:
+        """`True` if the pool is closed; `False` otherwise."""
+        return self._closed
+
+    def _build_metrics(self, idle: int, in_use: int, waiters: int) -> PoolMetrics:
+        return PoolMetrics(
+            size=self._size,
+            idle=idle,
+            in_use=in_use,
+            waiters=waiters,
+            max_size=self.max_size,
+            checkouts=self._checkouts,
+            checkout_timeouts=self._checkout_timeouts,
+            connections_created=self._connections_created,
+            connections_closed=self._connections_closed,
+            total_checkout_time=self._total_checkout_time,
+            max_checkout_time=self._max_checkout_time,
+        )
+
+    def _record_checkout(self, duration: float) -> None:
+        self._checkouts += 1
+        self._total_checkout_time += duration
+        self._max_checkout_time = max(self._max_checkout_time, duration)
+
+    def _is_expired(self, pooled: PooledConnection, now: float) -> bool:
+        return (
+            self.max_lifetime is not None
+            and now - pooled.created_at > self.max_lifetime
+        )
+
+    def _needs_health_check(self, pooled: PooledConnection, now: float) -> bool:
+        return now - pooled.last_used_at > self.health_check_interval
+
+    def _find_expired_idle(
+        self, idle: Iterable[PooledConnection], in_use: int, now: float
+    ) -> List[PooledConnection]:
+        """Idle connections exceeding their lifetime or idle timeout.
+
+        Idle connections are ordered from the least recently used. Connections
+        over the idle timeout are only expired while more than `min_size`
+        connections remain open.
+        """
+        idle = list(idle)
+        expired = [pooled for pooled in idle if self._is_expired(pooled, now)]
+        if self.idle_timeout is not None:
+            keep = max(self.min_size - in_use, 0)
+            for pooled in idle[: max(len(idle) - keep, 0)]:
+                if now - pooled.last_used_at <= self.idle_timeout:
+                    break
+                if pooled not in expired:
+                    expired.append(pooled)
+        return expired
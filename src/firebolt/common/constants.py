@@ -6,6 +6,13 @@ KEEPALIVE_FLAG: int = 1
 KEEPIDLE_RATE: int = 60  # seconds
 DEFAULT_TIMEOUT_SECONDS: int = 60
 
+# Streaming bulk load batching defaults
+DEFAULT_BULK_BATCH_ROWS: int = 10_000
+DEFAULT_BULK_BATCH_BYTES: int = 16 * 1024 * 1024  # 16 MiB
+BULK_STATEMENT_SEPARATOR = "; "
+# fb_numeric bulk parameters are sent in the url, which httpx limits to 64 KiB
+BULK_QUERY_PARAMETERS_URL_BYTES: int = 32 * 1024
+
 # Running statuses in information schema
 ENGINE_STATUS_RUNNING_LIST = ["RUNNING", "Running", "ENGINE_STATE_RUNNING"]
 JSON_OUTPUT_FORMAT = "JSON_Compact"
@@ -4,6 +4,7 @@ import logging
 import re
 from types import TracebackType
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from urllib.parse import urljoin
 
 from httpx import URL, Headers, Response
 
@@ -88,6 +89,7 @@ class BaseCursor:
         "_query_token",
         "_row_set",
         "engine_url",
+        "_query_url",
     )
 
     default_arraysize = 1
@@ -108,6 +110,8 @@ class BaseCursor:
         # Server-side parameters (user can't change them)
         self.parameters: Dict[str, str] = dict()
         self.engine_url = ""
+        # Engine url and the query request url built from it
+        self._query_url: Tuple[str, URL] = ("", URL())
         self._query_id = ""  # not used
         self._query_token = ""
         self._client: Optional[Union[Client, AsyncClient]] = None
@@ -199,6 +203,27 @@ class BaseCursor:
         """Cleanup all previously set parameters"""
         self._set_parameters = dict()
 
+    def _copy_request_state(self, cursor: "BaseCursor") -> None:
+        """Make another cursor send requests the same way this one does.
+
+        Copies the engine url, server-side and set parameters, so that
+        the cursor can send requests on behalf of this one while keeping its
+        own result and error-handling state.
+        """
+        cursor.engine_url = self.engine_url
+        cursor.parameters = dict(self.parameters)
+        cursor._set_parameters = dict(self._set_parameters)
+
+    def _get_request_url(self, path: str = "") -> URL:
+        """Build an engine request url, reusing the one for queries."""
+        if path:
+            return URL(urljoin(self.engine_url.rstrip("/") + "/", path))
+        engine_url, url = self._query_url
+        if engine_url != self.engine_url:
+            url = URL(urljoin(self.engine_url.rstrip("/") + "/", ""))
+            self._query_url = (self.engine_url, url)
+        return url
+
     def _reset(self) -> None:
         """Clear all data stored from previous query."""
         self._state = CursorState.NONE
@@ -242,6 +267,8 @@ class BaseCursor:
                 headers.get(UPDATE_ENDPOINT_HEADER)
             )
             self._update_set_parameters(params)
+            if endpoint != self.engine_url:
+                self._invalidate_cached_engine_url(self.engine_url)
             self.engine_url = endpoint
 
         if headers.get(RESET_SESSION_HEADER):
@@ -332,6 +359,25 @@ class BaseCursor:
         record = _firebolt_cache.get(cache_key)
         return record
 
+    def _get_cache_record_for_update(self) -> ConnectionInfo:
+        """Get the cache record of the connection, or a new empty one."""
+        return self.get_cache_record() or ConnectionInfo(
+            id=self.connection.id  # type: ignore[attr-defined]
+        )
+
+    def _invalidate_cached_engine_url(self, engine_url: str) -> None:
+        """Remove cached engines that were resolved to an outdated url."""
+        record = self.get_cache_record()
+        if not record:
+            return
+        stale = [
+            name for name, info in record.engines.items() if info.url == engine_url
+        ]
+        for name in stale:
+            del record.engines[name]
+        if stale:
+            self.set_cache_record(record)
+
     def set_cache_record(self, record: ConnectionInfo) -> None:
         if not self._client or not self._client.auth:
             return
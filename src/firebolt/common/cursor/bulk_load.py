@@ -0,0 +1,171 @@
+"""Helpers for streaming bulk inserts from lazily consumed row sources."""
+
+import csv
+import json
+from os import PathLike
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from firebolt.common._types import ParameterType
+from firebolt.common.cursor.statement_planners import (
+    BulkBatchBuilder,
+    BulkBatchPlan,
+)
+from firebolt.utils.exception import ConfigurationError, DataError
+
+Row = Sequence[ParameterType]
+RowSource = Union[Iterable[Row], AsyncIterable[Row]]
+FilePath = Union[str, "PathLike[str]"]
+
+
+def validate_batch_limits(batch_rows: int, max_batch_bytes: int) -> None:
+    if batch_rows < 1:
+        raise ConfigurationError("batch_rows must be a positive integer")
+    if max_batch_bytes < 1:
+        raise ConfigurationError("max_batch_bytes must be a positive integer")
+
+
+def _is_batch_full(
+    builder: BulkBatchBuilder, batch_rows: int, max_batch_bytes: int
+) -> bool:
+    return (
+        builder.row_count >= batch_rows
+        or builder.size >= max_batch_bytes
+        or builder.is_full()
+    )
+
+
+def iter_bulk_batches(
+    builder: BulkBatchBuilder,
+    rows: Iterable[Row],
+    batch_rows: int,
+    max_batch_bytes: int,
+) -> Iterator[BulkBatchPlan]:
+    """Lazily consume rows, yielding a batch plan whenever a limit is reached.
+
+    Args:
+        builder (BulkBatchBuilder): Builder formatting rows into statements
+        rows (Iterable[Row]): Source of parameter rows, consumed lazily
+        batch_rows (int): Maximum number of rows in one batch
+        max_batch_bytes (int): Approximate maximum size of one batch request
+
+    Yields:
+        BulkBatchPlan: A bounded batch, ready to be sent
+    """
+    validate_batch_limits(batch_rows, max_batch_bytes)
+    for row in rows:
+        builder.add_row(row)
+        if _is_batch_full(builder, batch_rows, max_batch_bytes):
+            yield builder.build()
+    if builder.row_count:
+        yield builder.build()
+
+
+async def aiter_bulk_batches(
+    builder: BulkBatchBuilder,
+    rows: RowSource,
+    batch_rows: int,
+    max_batch_bytes: int,
+) -> AsyncIterator[BulkBatchPlan]:
+    """Async version of :py:func:`iter_bulk_batches`.
+
+    Accepts both regular and asynchronous iterables of rows.
+    """
+    validate_batch_limits(batch_rows, max_batch_bytes)
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            builder.add_row(row)
+            if _is_batch_full(builder, batch_rows, max_batch_bytes):
+                yield builder.build()
+    else:
+        for row in rows:
+            builder.add_row(row)
+            if _is_batch_full(builder, batch_rows, max_batch_bytes):
+                yield builder.build()
+    if builder.row_count:
+        yield builder.build()
+
+
+def read_csv_rows(
+    path: FilePath,
+    header: bool = True,
+    null_value: Optional[str] = "",
+    encoding: str = "utf-8",
+    **fmtparams: Any,
+) -> Iterator[List[Optional[str]]]:
+    """Lazily read rows from a local CSV file.
+
+    Values are passed to the database as strings, relying on the server
+    to cast them to column types.
+
+    Args:
+        path (FilePath): Path to the CSV file
+        header (bool): Skip the first line of the file if True
+        null_value (Optional[str]): Field value to be loaded as NULL;
+            None disables NULL detection
+        encoding (str): File encoding
+        fmtparams: Additional formatting parameters for :py:func:`csv.reader`
+
+    Yields:
+        List[Optional[str]]: Row values
+    """
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, **fmtparams)
+        if header:
+            next(reader, None)
+        for row in reader:
+            if null_value is None:
+                yield list(row)
+            else:
+                yield [None if value == null_value else value for value in row]
+
+
+def read_json_lines_rows(
+    path: FilePath,
+    columns: Optional[Sequence[str]] = None,
+    encoding: str = "utf-8",
+) -> Iterator[List[Any]]:
+    """Lazily read rows from a local JSON-lines file.
+
+    Each line must contain either a JSON array of row values or a JSON object.
+    Object values are taken in the order of `columns` if provided, otherwise
+    in the order they appear in the object.
+
+    Args:
+        path (FilePath): Path to the JSON-lines file
+        columns (Optional[Sequence[str]]): Keys to take from JSON objects
+        encoding (str): File encoding
+
+    Yields:
+        List[Any]: Row values
+    """
+    with open(path, encoding=encoding) as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise DataError(f"Invalid JSON on line {line_number}: {e}") from e
+            if isinstance(value, dict):
+                if columns is None:
+                    yield list(value.values())
+                else:
+                    yield [value.get(column) for column in columns]
+            elif isinstance(value, list):
+                yield value
+            else:
+                raise DataError(
+                    f"Expected a JSON array or object on line {line_number}, "
+                    f"got {type(value).__name__}"
+                )
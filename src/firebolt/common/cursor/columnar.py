@@ -0,0 +1,172 @@
+"""Helpers for inserting columnar data, such as pandas DataFrames and Arrow tables.
+
+Neither pandas nor pyarrow is a dependency of the SDK: sources are accessed
+through the small subset of their APIs used below.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, List, Optional
+
+from firebolt.common.constants import JSON_OUTPUT_FORMAT
+from firebolt.common.cursor.bulk_load import validate_batch_limits
+from firebolt.common.cursor.statement_planners import BulkBatchPlan
+from firebolt.common.statement_formatter import StatementFormatter
+from firebolt.utils.exception import DataError
+
+VALUES_SEPARATOR = ", "
+
+_IDENTIFIER_PART = r'(?:[A-Za-z_][A-Za-z0-9_$]*|"(?:[^"]|"")+")'
+# One or more dot-separated identifiers, each either plain or double-quoted
+TABLE_NAME_RE = re.compile(rf"{_IDENTIFIER_PART}(?:\.{_IDENTIFIER_PART})*")
+
+
+class ColumnarSource(ABC):
+    """A table of column vectors that can be read in row slices."""
+
+    @property
+    @abstractmethod
+    def column_names(self) -> List[str]:
+        """Names of the source columns."""
+
+    @property
+    @abstractmethod
+    def num_rows(self) -> int:
+        """Total number of rows in the source."""
+
+    @abstractmethod
+    def slice_columns(self, start: int, stop: int) -> List[List[Any]]:
+        """Python values of each column for rows [start, stop), None for nulls."""
+
+
+class DataFrameSource(ColumnarSource):
+    """Columnar source backed by a pandas DataFrame."""
+
+    def __init__(self, df: Any) -> None:
+        self._df = df
+
+    @property
+    def column_names(self) -> List[str]:
+        return [str(name) for name in self._df.columns]
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._df)
+
+    def slice_columns(self, start: int, stop: int) -> List[List[Any]]:
+        chunk = self._df.iloc[start:stop]
+        columns = []
+        for i in range(chunk.shape[1]):
+            series = chunk.iloc[:, i]
+            values = series.tolist()
+            if series.hasnans:
+                # NaN and NaT represent missing values in pandas
+                mask = series.isna().tolist()
+                values = [None if is_na else v for v, is_na in zip(values, mask)]
+            columns.append(values)
+        return columns
+
+
+class ArrowTableSource(ColumnarSource):
+    """Columnar source backed by a pyarrow Table or RecordBatch."""
+
+    def __init__(self, table: Any) -> None:
+        self._table = table
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._table.column_names)
+
+    @property
+    def num_rows(self) -> int:
+        return self._table.num_rows
+
+    def slice_columns(self, start: int, stop: int) -> List[List[Any]]:
+        chunk = self._table.slice(start, stop - start)
+        return [chunk.column(i).to_pylist() for i in range(chunk.num_columns)]
+
+
+def _quote_identifier(name: str) -> str:
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def validate_table_name(table: str) -> str:
+    """Make sure a table name is a valid, possibly qualified, SQL identifier.
+
+    Unquoted parts are kept as is, so that the server applies its usual
+    case rules to them; anything else has to be double-quoted by the caller.
+
+    Raises:
+        DataError: Table name is not a valid identifier
+    """
+    if not isinstance(table, str) or not TABLE_NAME_RE.fullmatch(table):
+        raise DataError(f"Invalid table name: {table!r}")
+    return table
+
+
+def iter_columnar_batches(
+    table: str,
+    source: ColumnarSource,
+    formatter: StatementFormatter,
+    batch_rows: int,
+    max_batch_bytes: int,
+) -> Iterator[BulkBatchPlan]:
+    """Format a columnar source into multi-row INSERT batches.
+
+    Each column gets a formatter specialised for its type, selected from the
+    first non-null value. Only one slice of rows is converted to Python
+    objects at a time.
+
+    Args:
+        table (str): Name of the table to insert into
+        source (ColumnarSource): Data to insert
+        formatter (StatementFormatter): Formatter for the cursor's SQL dialect
+        batch_rows (int): Maximum number of rows in one batch
+        max_batch_bytes (int): Approximate maximum size of one batch request
+
+    Yields:
+        BulkBatchPlan: A bounded batch, ready to be sent
+
+    Raises:
+        DataError: Invalid table name or a source without columns
+    """
+    validate_batch_limits(batch_rows, max_batch_bytes)
+    validate_table_name(table)
+    column_names = source.column_names
+    if not column_names:
+        raise DataError("Cannot insert data without columns")
+
+    header = (
+        f"INSERT INTO {table} "
+        f"({', '.join(_quote_identifier(name) for name in column_names)}) VALUES "
+    )
+    query_params = {"output_format": JSON_OUTPUT_FORMAT}
+    column_formatters: List[Optional[Callable[[Any], str]]] = [None] * len(column_names)
+
+    def build(rows: List[str]) -> BulkBatchPlan:
+        rows[0] = header + rows[0]
+        return BulkBatchPlan(rows, query_params, VALUES_SEPARATOR)
+
+    num_rows = source.num_rows
+    for start in range(0, num_rows, batch_rows):
+        columns = source.slice_columns(start, min(start + batch_rows, num_rows))
+        for i, values in enumerate(columns):
+            if column_formatters[i] is None:
+                sample = next((v for v in values if v is not None), None)
+                if sample is not None:
+                    column_formatters[i] = formatter.column_formatter(sample)
+        formatters = [f or formatter.format_value for f in column_formatters]
+
+        rows: List[str] = []
+        size = len(header)
+        for row in zip(*columns):
+            formatted = f"({', '.join(f(v) for f, v in zip(formatters, row))})"
+            rows.append(formatted)
+            size += len(formatted) + len(VALUES_SEPARATOR)
+            if size >= max_batch_bytes:
+                yield build(rows)
+                rows = []
+                size = len(header)
+        if rows:
+            yield build(rows)
@@ -3,18 +3,37 @@ from __future__ import annotations
 """Statement planning handlers for different parameter styles."""
 
 import json
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+from urllib.parse import quote
+
+from sqlparse import parse as parse_sql  # type: ignore
 
 from firebolt.common._types import ParameterType, SetParameter
 from firebolt.common.constants import (
+    BULK_QUERY_PARAMETERS_URL_BYTES,
+    BULK_STATEMENT_SEPARATOR,
     JSON_LINES_OUTPUT_FORMAT,
     JSON_OUTPUT_FORMAT,
 )
 from firebolt.utils.exception import (
     ConfigurationError,
+    DataError,
     FireboltError,
+    NotSupportedError,
     ProgrammingError,
 )
 
@@ -33,6 +52,322 @@ class ExecutionPlan:
     streaming: bool = False
 
 
+class _BulkBody:
+    """Replayable request body, streaming bulk statements as bytes.
+
+    Unlike a generator, the body can be iterated again if the request
+    has to be resent, e.g. after a token refresh.
+    """
+
+    def __init__(self, statements: List[str], separator: str) -> None:
+        self._statements = statements
+        self._separator = separator
+
+    def _chunks(self) -> Iterator[bytes]:
+        separator = self._separator.encode("utf-8")
+        for i, statement in enumerate(self._statements):
+            if i:
+                yield separator
+            yield statement.encode("utf-8")
+
+
+class _SyncBulkBody(_BulkBody):
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks()
+
+
+class _AsyncBulkBody(_BulkBody):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks():
+            yield chunk
+
+
+@dataclass
+class BulkBatchPlan:
+    """Represents a single bounded batch of a streaming bulk insert.
+
+    The batch is sent as one request, with its statements streamed
+    into the request body instead of being joined into one string.
+    Each element of `statements` corresponds to a single inserted row:
+    either a whole INSERT statement or a row of a multi-row VALUES clause.
+    """
+
+    statements: List[str]
+    query_params: Dict[str, Any]
+    separator: str = BULK_STATEMENT_SEPARATOR
+
+    @property
+    def row_count(self) -> int:
+        return len(self.statements)
+
+    def content(self) -> _SyncBulkBody:
+        """Request body for a synchronous client."""
+        return _SyncBulkBody(self.statements, self.separator)
+
+    def async_content(self) -> _AsyncBulkBody:
+        """Request body for an asynchronous client."""
+        return _AsyncBulkBody(self.statements, self.separator)
+
+
+class BulkBatchBuilder(ABC):
+    """Incrementally formats rows of a bulk insert into a batch.
+
+    Rows are formatted as soon as they are added, so the builder only ever
+    holds the formatted statements of the current batch.
+    """
+
+    def __init__(self, query: str, formatter: StatementFormatter) -> None:
+        self.query = query
+        self.formatter = formatter
+        self._statements: List[str] = []
+        self.size = 0
+
+    @property
+    def row_count(self) -> int:
+        return len(self._statements)
+
+    def add_row(self, row: Sequence[ParameterType]) -> None:
+        """Format a row and add it to the current batch."""
+        statement = self._format_row(row)
+        self._statements.append(statement)
+        self.size += len(statement) + len(BULK_STATEMENT_SEPARATOR)
+
+    def build(self) -> BulkBatchPlan:
+        """Return the current batch as a plan and start a new one."""
+        plan = BulkBatchPlan(self._statements, self._build_query_params())
+        self._statements = []
+        self.size = 0
+        self._reset()
+        return plan
+
+    def is_full(self) -> bool:
+        """Check if the batch has reached a limit of its request format."""
+        return False
+
+    @abstractmethod
+    def _format_row(self, row: Sequence[ParameterType]) -> str:
+        """Format a single row into an INSERT statement."""
+
+    @abstractmethod
+    def _build_query_params(self) -> Dict[str, Any]:
+        """Build request query parameters for the current batch."""
+
+    def _reset(self) -> None:
+        """Reset batch-specific state."""
+
+
+class _QmarkBulkBatchBuilder(BulkBatchBuilder):
+    """Bulk batch builder substituting parameters on the client side."""
+
+    def __init__(self, query: str, formatter: StatementFormatter) -> None:
+        super().__init__(query, formatter)
+        statements = parse_sql(query)
+        if not statements:
+            raise DataError("Invalid SQL query for bulk insert")
+        self._template = formatter.compile_statement(statements[0])
+
+    def _format_row(self, row: Sequence[ParameterType]) -> str:
+        return self._template.format_row(row)
+
+    def _build_query_params(self) -> Dict[str, Any]:
+        return {"output_format": JSON_OUTPUT_FORMAT}
+
+
+class _FbNumericBulkBatchBuilder(BulkBatchBuilder):
+    """Bulk batch builder sending parameters as server-side query_parameters."""
+
+    def __init__(self, query: str, formatter: StatementFormatter) -> None:
+        super().__init__(query, formatter)
+        self._parameters: List[Dict[str, Any]] = []
+        self._url_size = 0
+
+    def _format_row(self, row: Sequence[ParameterType]) -> str:
+        offset = len(self._parameters)
+        entries = [
+            {
+                "name": f"${offset + i + 1}",
+                "value": self.formatter.convert_parameter_for_serialization(value),
+            }
+            for i, value in enumerate(row)
+        ]
+        self._parameters.extend(entries)
+        # Account for serialized parameters in the batch size
+        serialized = json.dumps(entries)
+        self.size += len(serialized)
+        self._url_size += len(quote(serialized))
+        return FbNumericStatementPlanner._renumber_placeholders(
+            self.query, len(row), offset
+        )
+
+    def _build_query_params(self) -> Dict[str, Any]:
+        query_params: Dict[str, Any] = {"output_format": JSON_OUTPUT_FORMAT}
+        if self._parameters:
+            query_params["query_parameters"] = json.dumps(self._parameters)
+        return query_params
+
+    def is_full(self) -> bool:
+        # Parameters are sent in the url, which is much shorter than the body
+        return self._url_size >= BULK_QUERY_PARAMETERS_URL_BYTES
+
+    def _reset(self) -> None:
+        self._parameters = []
+        self._url_size = 0
+
+
+class PreparedQuery(ABC):
+    """A query planned once, to be executed many times with different parameters.
+
+    Everything that doesn't depend on parameter values, such as parsing the
+    query and building constant request parameters, is done on creation.
+    """
+
+    def __init__(self, raw_query: str, planner: BaseStatementPlanner) -> None:
+        self.raw_query = raw_query
+        self.planner = planner
+        self._query_params: Dict[str, Any] = {"output_format": JSON_OUTPUT_FORMAT}
+        self._bulk_validated = False
+
+    def create_execution_plan(
+        self,
+        parameters: Sequence[Sequence[ParameterType]],
+        bulk_insert: bool = False,
+    ) -> ExecutionPlan:
+        """Create an execution plan for the given parameter sets.
+
+        Args:
+            parameters (Sequence[Sequence[ParameterType]]): A sequence of
+                parameter sets for the query.
+            bulk_insert (bool): If True, the query will be treated as a bulk
+                insert operation. Defaults to False.
+
+        Returns:
+            ExecutionPlan: An object representing the execution plan.
+        """
+        if not bulk_insert:
+            return self._create_standard_execution_plan(parameters)
+        if not self._bulk_validated:
+            self.planner._validate_bulk_insert_query(self.raw_query)
+            self._bulk_validated = True
+        if not parameters:
+            raise ProgrammingError("bulk_insert requires at least one parameter set")
+        return self._create_bulk_execution_plan(parameters)
+
+    @abstractmethod
+    def _create_standard_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        """Create standard (non-bulk) execution plan."""
+
+    @abstractmethod
+    def _create_bulk_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        """Create bulk insert execution plan."""
+
+
+class _QmarkPreparedQuery(PreparedQuery):
+    """Prepared query substituting parameters into a compiled template."""
+
+    def __init__(self, raw_query: str, planner: BaseStatementPlanner) -> None:
+        super().__init__(raw_query, planner)
+        statements = parse_sql(raw_query)
+        if len(statements) != 1:
+            raise NotSupportedError(
+                "Only single-statement queries can be prepared, "
+                f"got {len(statements)} statements."
+            )
+        if planner.formatter.statement_to_set(statements[0]):
+            raise NotSupportedError("SET statements can't be prepared.")
+        self._template = planner.formatter.compile_statement(statements[0])
+
+    def _create_standard_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        queries: List[Union[SetParameter, str]] = [
+            self._template.format_row(param_set) for param_set in parameters or [()]
+        ]
+        return ExecutionPlan(
+            queries=queries,
+            query_params=self._query_params,
+            is_multi_statement=len(queries) > 1,
+        )
+
+    def _create_bulk_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        combined_query = BULK_STATEMENT_SEPARATOR.join(
+            self._template.format_row(param_set) for param_set in parameters
+        )
+        return ExecutionPlan(queries=[combined_query], query_params=self._query_params)
+
+
+_FB_NUMERIC_PLACEHOLDER = re.compile(r"\$(\d+)")
+
+
+class _FbNumericPreparedQuery(PreparedQuery):
+    """Prepared query with pre-serialized parts of server-side query_parameters."""
+
+    def __init__(self, raw_query: str, planner: BaseStatementPlanner) -> None:
+        super().__init__(raw_query, planner)
+        # Query text split around $N placeholders for bulk insert renumbering
+        parts = _FB_NUMERIC_PLACEHOLDER.split(raw_query)
+        self._query_parts = parts[::2]
+        self._placeholder_numbers = [int(number) for number in parts[1::2]]
+        # Serialized '{"name": "$N", "value": ' prefixes, grown on demand
+        self._parameter_prefixes: List[str] = []
+
+    def _serialize_parameters(self, values: Sequence[ParameterType]) -> str:
+        """Serialize values the same way as json.dumps of query_parameters."""
+        prefixes = self._parameter_prefixes
+        while len(prefixes) < len(values):
+            prefixes.append(f'{{"name": "${len(prefixes) + 1}", "value": ')
+        convert = self.planner.formatter.convert_parameter_for_serialization
+        serialized = ", ".join(
+            f"{prefix}{json.dumps(convert(value))}}}"
+            for prefix, value in zip(prefixes, values)
+        )
+        return f"[{serialized}]"
+
+    def _build_query_params(self, values: Sequence[ParameterType]) -> Dict[str, Any]:
+        if not values:
+            return self._query_params
+        return {
+            **self._query_params,
+            "query_parameters": self._serialize_parameters(values),
+        }
+
+    def _renumber_placeholders(self, param_count: int, offset: int) -> str:
+        chunks = [self._query_parts[0]]
+        for number, part in zip(self._placeholder_numbers, self._query_parts[1:]):
+            if number <= param_count:
+                number += offset
+            chunks.append(f"${number}")
+            chunks.append(part)
+        return "".join(chunks)
+
+    def _create_standard_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        return ExecutionPlan(
+            queries=[self.raw_query],
+            query_params=self._build_query_params(parameters[0] if parameters else []),
+        )
+
+    def _create_bulk_execution_plan(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> ExecutionPlan:
+        queries = []
+        offset = 0
+        for param_set in parameters:
+            queries.append(self._renumber_placeholders(len(param_set), offset))
+            offset += len(param_set)
+        values = [value for param_set in parameters for value in param_set]
+        return ExecutionPlan(
+            queries=[BULK_STATEMENT_SEPARATOR.join(queries)],
+            query_params=self._build_query_params(values),
+        )
+
+
 class BaseStatementPlanner(ABC):
     """Base class for statement planning handlers."""
 
@@ -108,6 +443,33 @@ class BaseStatementPlanner(ABC):
 
         return self._create_bulk_plan_impl(raw_query, parameters, async_execution)
 
+    def create_bulk_batch_builder(self, raw_query: str) -> BulkBatchBuilder:
+        """Create a builder for streaming a bulk insert in bounded batches.
+
+        Args:
+            raw_query (str): INSERT query template with parameter placeholders.
+
+        Returns:
+            BulkBatchBuilder: Builder formatting rows for this paramstyle.
+        """
+        self._validate_bulk_insert_query(raw_query)
+        return self._bulk_batch_builder_class(raw_query, self.formatter)
+
+    _bulk_batch_builder_class: Type[BulkBatchBuilder]
+
+    def prepare(self, raw_query: str) -> PreparedQuery:
+        """Plan a query once, for repeated execution with different parameters.
+
+        Args:
+            raw_query (str): The raw SQL query to be prepared.
+
+        Returns:
+            PreparedQuery: Query, ready to create execution plans.
+        """
+        return self._prepared_query_class(raw_query, self)
+
+    _prepared_query_class: Type[PreparedQuery]
+
     @abstractmethod
     def _create_standard_execution_plan(
         self,
@@ -139,6 +501,9 @@ class BaseStatementPlanner(ABC):
 class FbNumericStatementPlanner(BaseStatementPlanner):
     """Statement planner for fb_numeric parameter style."""
 
+    _bulk_batch_builder_class = _FbNumericBulkBatchBuilder
+    _prepared_query_class = _FbNumericPreparedQuery
+
     def _create_standard_execution_plan(
         self,
         raw_query: str,
@@ -222,25 +587,32 @@ class FbNumericStatementPlanner(BaseStatementPlanner):
         queries = []
         param_offset = 0
         for param_set in parameters_seq:
-            # Replace parameter placeholders with unique numbers
-            modified_query = query
-            for i in range(len(param_set)):
-                old_param = f"${i + 1}"
-                new_param = f"${param_offset + i + 1}"
-                modified_query = modified_query.replace(old_param, new_param)
-            queries.append(modified_query)
+            queries.append(
+                self._renumber_placeholders(query, len(param_set), param_offset)
+            )
             param_offset += len(param_set)
 
-        combined_query = "; ".join(queries)
+        combined_query = BULK_STATEMENT_SEPARATOR.join(queries)
         flattened_parameters = [
             param for param_set in parameters_seq for param in param_set
         ]
         return combined_query, [flattened_parameters]
 
+    @staticmethod
+    def _renumber_placeholders(query: str, param_count: int, offset: int) -> str:
+        """Shift $N placeholders in a query by offset to make them unique."""
+        # Replace parameter placeholders with unique numbers
+        for i in range(param_count):
+            query = query.replace(f"${i + 1}", f"${offset + i + 1}")
+        return query
+
 
 class QmarkStatementPlanner(BaseStatementPlanner):
     """Statement planner for qmark parameter style."""
 
+    _bulk_batch_builder_class = _QmarkBulkBatchBuilder
+    _prepared_query_class = _QmarkPreparedQuery
+
     def _create_standard_execution_plan(
         self,
         raw_query: str,
@@ -1,6 +1,6 @@
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from sqlparse import parse as parse_sql  # type: ignore
 from sqlparse import tokens as _T
@@ -113,27 +113,102 @@ escape_chars_v1 = {
 }
 
 
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _format_datetime(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    if value.year < 1000:
+        # strftime doesn't pad years to 4 digits on every platform, keep it
+        return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+    return f"'{value.isoformat(' ', 'seconds')}'"
+
+
+def _format_date(value: date) -> str:
+    return f"'{value.isoformat()}'"
+
+
+def _format_bytes(value: bytes) -> str:
+    if not value:
+        return "E''"
+    # Encode each byte into hex, prefixed with \x
+    return "E'\\x" + value.hex(" ").replace(" ", "\\x") + "'"
+
+
+class StatementTemplate:
+    """
+    A statement split around its placeholders, for formatting many rows.
+
+    Each parameter position gets a formatter specialised for the type of its
+    first non-null value, so the statement is parsed and the value type is
+    resolved only once instead of once per row.
+    """
+
+    def __init__(self, parts: List[str], formatter: "StatementFormatter"):
+        self._parts = parts
+        self._formatter = formatter
+        self._column_formatters: List[Optional[Callable[[ParameterType], str]]] = [
+            None
+        ] * (len(parts) - 1)
+
+    @property
+    def placeholder_count(self) -> int:
+        return len(self._column_formatters)
+
+    def format_row(self, parameters: Sequence[ParameterType]) -> str:
+        """Substitute placeholders with provided values."""
+        if len(parameters) > self.placeholder_count:
+            raise DataError(
+                "too many parameters provided for substitution:"
+                f" given {len(parameters)}, "
+                f"used only {self.placeholder_count}"
+            )
+        if len(parameters) < self.placeholder_count:
+            raise DataError(
+                "not enough parameters provided for substitution: given "
+                f"{len(parameters)}, found one more"
+            )
+        parts = self._parts
+        formatters = self._column_formatters
+        chunks = [parts[0]]
+        for i, value in enumerate(parameters):
+            format_column_value = formatters[i]
+            if format_column_value is None:
+                if value is None:
+                    chunks.append("NULL")
+                    chunks.append(parts[i + 1])
+                    continue
+                format_column_value = self._formatter.column_formatter(value)
+                formatters[i] = format_column_value
+            chunks.append(format_column_value(value))
+            chunks.append(parts[i + 1])
+        return "".join(chunks)
+
+
 class StatementFormatter:
     def __init__(self, escape_chars: Dict[str, str]):
         self.escape_chars = escape_chars
+        self._escape_table = str.maketrans(escape_chars)
+
+    def _format_str(self, value: str) -> str:
+        return f"'{value.translate(self._escape_table)}'"
 
     def format_value(self, value: ParameterType) -> str:
         """For Python value to be used in a SQL query."""
         if isinstance(value, bool):
-            return "true" if value else "false"
+            return _format_bool(value)
         if isinstance(value, (int, float, Decimal)):
             return str(value)
         elif isinstance(value, str):
-            return f"'{''.join(self.escape_chars.get(c, c) for c in value)}'"
+            return self._format_str(value)
         elif isinstance(value, datetime):
-            if value.tzinfo is not None:
-                value = value.astimezone(timezone.utc)
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+            return _format_datetime(value)
         elif isinstance(value, date):
-            return f"'{value.isoformat()}'"
+            return _format_date(value)
         elif isinstance(value, bytes):
-            # Encode each byte into hex
-            return "E'" + "".join(f"\\x{b:02x}" for b in value) + "'"
+            return _format_bytes(value)
         if value is None:
             return "NULL"
         elif isinstance(value, Sequence):
@@ -141,6 +216,43 @@ class StatementFormatter:
 
         raise DataError(f"unsupported parameter type {type(value)}")
 
+    def _type_encoder(self, sample: ParameterType) -> Optional[Callable[[Any], str]]:
+        if isinstance(sample, bool):
+            return _format_bool
+        if isinstance(sample, (int, float, Decimal)):
+            return str
+        if isinstance(sample, str):
+            return self._format_str
+        if isinstance(sample, datetime):
+            return _format_datetime
+        if isinstance(sample, date):
+            return _format_date
+        if isinstance(sample, bytes):
+            return _format_bytes
+        return None
+
+    def column_formatter(self, sample: ParameterType) -> Callable[[ParameterType], str]:
+        """
+        Create a formatter specialised for values of the same type as `sample`.
+
+        The formatting function is selected once per column instead of walking
+        the isinstance chain of `format_value` for every value. Values of any
+        other type, including None, fall back to `format_value`.
+        """
+        encode = self._type_encoder(sample)
+        if encode is None:
+            return self.format_value
+
+        sample_type = type(sample)
+        format_value = self.format_value
+
+        def format_column_value(value: ParameterType) -> str:
+            if type(value) is sample_type:
+                return encode(value)
+            return format_value(value)
+
+        return format_column_value
+
     def convert_parameter_for_serialization(
         self, value: ParameterType
     ) -> Union[int, float, bool, None, str, List]:
@@ -206,6 +318,27 @@ class StatementFormatter:
 
         return formatted_sql
 
+    def compile_statement(self, statement: Statement) -> StatementTemplate:
+        """
+        Split a `sqlparse` statement around its placeholders.
+
+        Formatting a row with the resulting template produces the same result
+        as `format_statement`.
+        """
+        parts = [""]
+        for token in statement.flatten():
+            if token.ttype == TokenType.Name.Placeholder:
+                parts.append("")
+            else:
+                parts[-1] += str(token)
+        if len(parts) == 1:
+            parts[0] = parts[0].strip().rstrip(";")
+        else:
+            # Formatted values never start or end with whitespace or semicolons
+            parts[0] = parts[0].lstrip()
+            parts[-1] = parts[-1].rstrip().rstrip(";")
+        return StatementTemplate(parts, self)
+
     def statement_to_set(self, statement: Statement) -> Optional[SetParameter]:
         """
         Try to parse `statement` as a `SET` command.
@@ -315,12 +448,8 @@ class StatementFormatter:
         if not statements:
             raise DataError("Invalid SQL query for bulk insert")
 
-        formatted_queries = []
-        for param_set in parameters_seq:
-            formatted_query = self.format_statement(statements[0], param_set)
-            formatted_queries.append(formatted_query)
-
-        return "; ".join(formatted_queries)
+        template = self.compile_statement(statements[0])
+        return "; ".join(template.format_row(param_set) for param_set in parameters_seq)
 
 
 def create_statement_formatter(version: int) -> StatementFormatter:
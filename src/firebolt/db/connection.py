@@ -10,9 +10,16 @@ from warnings import warn
 
 from httpx import Request, Response, Timeout, codes
 
-from firebolt.client import DEFAULT_API_URL, Client, ClientV1, ClientV2
+from firebolt.client import (
+    DEFAULT_API_URL,
+    Client,
+    ClientV1,
+    ClientV2,
+    TransportOptions,
+)
 from firebolt.client.auth import Auth
 from firebolt.client.auth.base import FireboltAuthVersion
+from firebolt.client.transport_registry import use_shared_transport
 from firebolt.common.base_connection import (
     ASYNC_QUERY_CANCEL,
     ASYNC_QUERY_STATUS_REQUEST,
@@ -20,6 +27,7 @@ from firebolt.common.base_connection import (
     ASYNC_QUERY_STATUS_SUCCESSFUL,
     AsyncQueryInfo,
     BaseConnection,
+    ConnectionTimings,
     _parse_async_query_info_results,
     get_cached_system_engine_info,
     get_user_agent_for_connection,
@@ -27,6 +35,7 @@ from firebolt.common.base_connection import (
 )
 from firebolt.common.constants import DEFAULT_TIMEOUT_SECONDS
 from firebolt.db.cursor import Cursor, CursorV1, CursorV2
+from firebolt.db.prepared_statement import PreparedStatement
 from firebolt.utils.cache import EngineInfo
 from firebolt.utils.exception import (
     AccountNotFoundOrNoAccessError,
@@ -61,12 +70,18 @@ def connect(
     url: Optional[str] = None,
     autocommit: bool = True,
     additional_parameters: Dict[str, Any] = {},
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
+    prewarm: int = 0,
+    share_transport: bool = False,
 ) -> Connection:
     # auth parameter is optional in function signature
     # but is required to connect.
     # PEP 249 recommends making it kwargs.
     if not auth:
         raise ConfigurationError("auth is required to connect.")
+    if prewarm < 0:
+        raise ConfigurationError("prewarm must not be negative.")
 
     api_endpoint = fix_url_schema(api_endpoint)
     # Type checks
@@ -83,16 +98,18 @@ def connect(
         # Verify that Core-incompatible parameters are not provided
         validate_firebolt_core_parameters(account_name, engine_name, engine_url)
 
-        return connect_core(
+        connection = connect_core(
             auth=auth,
             user_agent_header=user_agent_header,
             database=database,
             connection_url=url,
             autocommit=autocommit,
+            http2=http2,
+            transport_options=transport_options,
         )
     elif auth_version == FireboltAuthVersion.V2:
         assert account_name is not None
-        return connect_v2(
+        connection = connect_v2(
             auth=auth,
             user_agent_header=user_agent_header,
             account_name=account_name,
@@ -102,9 +119,11 @@ def connect(
             connection_id=connection_id,
             disable_cache=disable_cache,
             autocommit=autocommit,
+            http2=http2,
+            transport_options=transport_options,
         )
     elif auth_version == FireboltAuthVersion.V1:
-        return connect_v1(
+        connection = connect_v1(
             auth=auth,
             user_agent_header=user_agent_header,
             account_name=account_name,
@@ -113,10 +132,18 @@ def connect(
             engine_url=engine_url,
             api_endpoint=api_endpoint,
             connection_id=connection_id,
+            http2=http2,
+            transport_options=transport_options,
         )
     else:
         raise ConfigurationError(f"Unsupported auth type: {type(auth)}")
 
+    if share_transport:
+        use_shared_transport(connection._client, connection.engine_url)
+    if prewarm:
+        connection._prewarm(prewarm)
+    return connection
+
 
 def connect_v2(
     auth: Auth,
@@ -128,6 +155,8 @@ def connect_v2(
     api_endpoint: str = DEFAULT_API_URL,
     disable_cache: bool = False,
     autocommit: bool = True,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
 ) -> Connection:
     """Connect to Firebolt.
 
@@ -140,6 +169,10 @@ def connect_v2(
         `api_endpoint` (str): Firebolt API endpoint. Used for authentication
         `additional_parameters` (Optional[Dict]): Dictionary of less widely-used
                                 arguments for connection
+        `http2` (bool): Use HTTP/2, so concurrent queries share one TCP
+                        connection to the engine
+        `transport_options` (Optional[TransportOptions]): Connection pool and
+                        socket settings
 
     """
     # These parameters are optional in function signature
@@ -153,45 +186,65 @@ def connect_v2(
     assert auth is not None
     assert account_name is not None
 
-    system_engine_info = _get_system_engine_url_and_params(
-        auth, account_name, api_endpoint, connection_id, disable_cache
-    )
-
-    client = ClientV2(
-        auth=auth,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
-        headers={"User-Agent": user_agent_header},
-    )
+    timings = ConnectionTimings()
+    with timings.measure("total"):
+        # One client is used for the gateway lookup, the system engine and
+        # the user engine, so its transport and connections are reused
+        client = ClientV2(
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+            timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
+            headers={"User-Agent": user_agent_header},
+            http2=http2,
+            transport_options=transport_options,
+        )
+        try:
+            with timings.measure("system_engine"):
+                system_engine_info = _get_system_engine_url_and_params(
+                    client, auth, account_name, connection_id, disable_cache
+                )
+        except BaseException:
+            client.close()
+            raise
+
+        system_engine_connection = Connection(
+            system_engine_info.url,
+            None,
+            client,
+            CursorV2,
+            api_endpoint,
+            system_engine_info.params,
+            connection_id,
+        )
+        try:
+            with system_engine_connection.cursor() as cursor:
+                if database:
+                    with timings.measure("use_database"):
+                        cursor.use_database(database, cache=not disable_cache)
+                if engine_name:
+                    with timings.measure("use_engine"):
+                        cursor.use_engine(engine_name, cache=not disable_cache)
+        except BaseException:
+            system_engine_connection.close()
+            raise
+        system_engine_connection._detach_client()
 
-    with Connection(
-        system_engine_info.url,
-        None,
-        client,
-        CursorV2,
-        api_endpoint,
-        system_engine_info.params,
-        connection_id,
-    ) as system_engine_connection:
-
-        cursor = system_engine_connection.cursor()
-        if database:
-            cursor.use_database(database, cache=not disable_cache)
-        if engine_name:
-            cursor.use_engine(engine_name, cache=not disable_cache)
         # Ensure cursors created from this connection are using the same starting
         # database and engine
-        return Connection(
+        connection = Connection(
             cursor.engine_url,
             cursor.database,
-            client.clone(),
+            client,
             CursorV2,
             api_endpoint,
             cursor.parameters | cursor._set_parameters,
             connection_id,
             autocommit,
         )
+    connection.connect_timings = timings
+    logger.debug(f"Connection established: {timings}")
+    return connection
 
 
 class Connection(BaseConnection):
@@ -219,6 +272,7 @@ class Connection(BaseConnection):
         "engine_url",
         "api_endpoint",
         "_is_closed",
+        "connect_timings",
         "_transaction_id",
         "_transaction_sequence_id",
         "_transaction_lock",
@@ -258,6 +312,32 @@ class Connection(BaseConnection):
         self._cursors.append(c)
         return c
 
+    def prepare(self, query: str) -> PreparedStatement:
+        """Prepare a query on a new cursor of this connection.
+
+        See :py:meth:`Cursor.prepare`.
+        """
+        return self.cursor().prepare(query)
+
+    def _prewarm(self, count: int) -> None:
+        """Open keep-alive connections to the engine in background threads.
+
+        Each thread sends a HEAD request to the engine, so up to `count`
+        TCP and TLS connections are established and kept in the client pool,
+        ready for the first queries. Failures are ignored.
+        """
+
+        def warm() -> None:
+            try:
+                self._client.head(
+                    self.engine_url, timeout=Timeout(DEFAULT_TIMEOUT_SECONDS)
+                )
+            except Exception as e:
+                logger.debug(f"Failed to prewarm a connection to the engine: {e}")
+
+        for _ in range(count):
+            threading.Thread(target=warm, name="firebolt-prewarm", daemon=True).start()
+
     def _remove_cursor(self, cursor: Cursor) -> None:
         # This way it's atomic
         try:
@@ -433,6 +513,8 @@ def connect_v1(
     engine_name: Optional[str] = None,
     engine_url: Optional[str] = None,
     api_endpoint: str = DEFAULT_API_URL,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
 ) -> Connection:
     # These parameters are optional in function signature
     # but are required to connect.
@@ -450,6 +532,8 @@ def connect_v1(
         api_endpoint=api_endpoint,
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
+        http2=http2,
+        transport_options=transport_options,
     )
 
     # Mypy checks, this should never happen
@@ -478,6 +562,8 @@ def connect_v1(
         api_endpoint=api_endpoint,
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
+        http2=http2,
+        transport_options=transport_options,
     )
     return Connection(
         engine_url, database, client, CursorV1, api_endpoint, id=connection_id
@@ -490,6 +576,8 @@ def connect_core(
     database: Optional[str] = None,
     connection_url: Optional[str] = None,
     autocommit: bool = True,
+    http2: bool = False,
+    transport_options: Optional[TransportOptions] = None,
 ) -> Connection:
     """Connect to Firebolt Core.
 
@@ -501,6 +589,9 @@ def connect_core(
         connection_url (Optional[str]): URL in format protocol://host:port
             Protocol defaults to http, host defaults to localhost, port
             defaults to 3473.
+        http2 (bool): Use HTTP/2 if the server supports it
+        transport_options (Optional[TransportOptions]): Connection pool and
+            socket settings
 
     Returns:
         Connection: A connection to Firebolt Core
@@ -509,7 +600,7 @@ def connect_core(
 
     ctx: Union[SSLContext, bool] = True  # Default context
     if connection_params.scheme == "https":
-        ctx = get_core_certificate_context()
+        ctx = get_core_certificate_context(http2)
 
     verified_url = connection_params.geturl()
 
@@ -520,6 +611,8 @@ def connect_core(
         timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
         headers={"User-Agent": user_agent_header},
         verify=ctx,
+        http2=http2,
+        transport_options=transport_options,
     )
 
     return Connection(
@@ -533,9 +626,9 @@ def connect_core(
 
 
 def _get_system_engine_url_and_params(
+    client: Client,
     auth: Auth,
     account_name: str,
-    api_endpoint: str,
     connection_id: str,
     disable_cache: bool = False,
 ) -> EngineInfo:
@@ -545,24 +638,19 @@ def _get_system_engine_url_and_params(
     if cached_result:
         return cached_result
 
-    with ClientV2(
-        auth=auth,
-        base_url=api_endpoint,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
-    ) as client:
-        url = GATEWAY_HOST_BY_ACCOUNT_NAME.format(account_name=account_name)
-        response = client.get(url=url)
-        if response.status_code == codes.NOT_FOUND:
-            raise AccountNotFoundOrNoAccessError(account_name)
-        if response.status_code != codes.OK:
-            raise InterfaceError(
-                f"Unable to retrieve system engine endpoint {url}: "
-                f"{response.status_code} {response.content.decode()}"
-            )
-        url, params = parse_url_and_params(response.json()["engineUrl"])
-
-        return set_cached_system_engine_info(
-            cache_key, connection_id, url, params, disable_cache
+    url = GATEWAY_HOST_BY_ACCOUNT_NAME.format(account_name=account_name)
+    response = client.get(
+        url=client._api_endpoint.join(url), timeout=Timeout(DEFAULT_TIMEOUT_SECONDS)
+    )
+    if response.status_code == codes.NOT_FOUND:
+        raise AccountNotFoundOrNoAccessError(account_name)
+    if response.status_code != codes.OK:
+        raise InterfaceError(
+            f"Unable to retrieve system engine endpoint {url}: "
+            f"{response.status_code} {response.content.decode()}"
         )
+    url, params = parse_url_and_params(response.json()["engineUrl"])
+
+    return set_cached_system_engine_info(
+        cache_key, connection_id, url, params, disable_cache
+    )
@@ -0,0 +1,299 @@
+"""Thread-safe pool of reusable connections."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from time import monotonic
+from types import TracebackType
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from firebolt.common.base_pool import BasePool, PooledConnection, PoolMetrics
+from firebolt.db.connection import Connection, connect
+from firebolt.utils.exception import (
+    InterfaceError,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[Connection], Any]
+
+
+def ping(connection: Connection) -> None:
+    """Default health check: run a trivial query on the connection."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+class ConnectionPool(BasePool):
+    """
+    Thread-safe pool of Firebolt connections.
+
+    Connections are created lazily, up to `max_size`, using
+    :py:func:`firebolt.db.connect` with the provided keyword arguments,
+    or with a custom `connection_factory`. Each connection is used by a single
+    thread at a time. When a connection is returned to the pool, all of its
+    cursors, together with their SET parameters, are closed and an open
+    transaction is rolled back.
+
+    Example:
+        pool = ConnectionPool(auth=auth, account_name=..., max_size=10)
+        with pool.connection() as connection:
+            connection.cursor().execute("SELECT 1")
+
+    Args:
+        connection_factory (Optional[Callable[[], Connection]]): Function creating
+            a new connection. Mutually exclusive with `connect_kwargs`
+        min_size (int): Number of connections opened on pool creation and kept
+            open regardless of `idle_timeout`
+        max_size (int): Maximum number of open connections
+        idle_timeout (Optional[float]): Seconds after which an idle connection
+            is closed, None to keep idle connections open
+        max_lifetime (Optional[float]): Seconds after which a connection is
+            closed instead of being reused, None for no limit
+        checkout_timeout (Optional[float]): Default number of seconds to wait
+            for a connection, None to wait indefinitely
+        health_check (Optional[Callable[[Connection], Any]]): Check run on an
+            idle connection before checkout. A connection is discarded if the
+            check raises an exception or returns False. None disables checks
+        health_check_interval (float): Only connections idle for longer than
+            this number of seconds are checked
+        prewarm (int): Number of connections to the engine each new pooled
+            connection opens in background threads, so its first queries
+            don't wait for TCP and TLS handshakes
+        connect_kwargs: Arguments for :py:func:`firebolt.db.connect`
+    """
+
+    def __init__(
+        self,
+        connection_factory: Optional[Callable[[], Connection]] = None,
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        idle_timeout: Optional[float] = 300.0,
+        max_lifetime: Optional[float] = 3600.0,
+        checkout_timeout: Optional[float] = 30.0,
+        health_check: Optional[HealthCheck] = ping,
+        health_check_interval: float = 30.0,
+        prewarm: int = 0,
+        **connect_kwargs: Any,
+    ):
+        super().__init__(
+            min_size,
+            max_size,
+            idle_timeout,
+            max_lifetime,
+            checkout_timeout,
+            health_check_interval,
+            prewarm,
+            connection_factory is not None,
+            bool(connect_kwargs),
+        )
+        self._connection_factory = connection_factory or (
+            lambda: connect(**connect_kwargs)
+        )
+        self.health_check = health_check
+
+        self._lock = Condition()
+        # Most recently used connections are at the right end
+        self._idle: Deque[PooledConnection] = deque()
+        self._in_use: Dict[int, PooledConnection] = {}
+        self._waiters = 0
+
+        try:
+            for _ in range(min_size):
+                with self._lock:
+                    self._size += 1
+                pooled = self._create()
+                with self._lock:
+                    self._idle.append(pooled)
+        except BaseException:
+            # Don't leak connections opened before the failing one
+            self.close()
+            raise
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Current pool state and statistics."""
+        with self._lock:
+            return self._build_metrics(
+                len(self._idle), len(self._in_use), self._waiters
+            )
+
+    def acquire(self, timeout: Optional[float] = None) -> Connection:
+        """Check out a connection. It must be returned with :py:meth:`release`.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a connection,
+                defaults to the pool `checkout_timeout`
+
+        Returns:
+            Connection: Connection for exclusive use by the caller
+        """
+        start = monotonic()
+        if timeout is None:
+            timeout = self.checkout_timeout
+        deadline = start + timeout if timeout is not None else None
+        while True:
+            pooled = self._checkout_idle_or_reserve(deadline)
+            if pooled is None:
+                pooled = self._create()
+            elif not self._is_healthy(pooled):
+                self._discard(pooled)
+                continue
+            now = monotonic()
+            with self._lock:
+                self._in_use[id(pooled.connection)] = pooled
+                self._record_checkout(now - start)
+            return pooled.connection
+
+    def release(self, connection: Connection) -> None:
+        """Return a checked out connection to the pool.
+
+        Args:
+            connection (Connection): Connection returned by :py:meth:`acquire`
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(connection), None)
+        if pooled is None or pooled.connection is not connection:
+            raise InterfaceError("Connection doesn't belong to this pool.")
+
+        if not self._reset(connection) or self._is_expired(pooled, monotonic()):
+            self._discard(pooled)
+            return
+        with self._lock:
+            if not self._closed:
+                pooled.last_used_at = monotonic()
+                self._idle.append(pooled)
+                self._lock.notify()
+                return
+        self._discard(pooled)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Connection]:
+        """Check out a connection for the duration of a `with` block.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a connection,
+                defaults to the pool `checkout_timeout`
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close idle connections. Checked out ones are closed on release."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _checkout_idle_or_reserve(
+        self, deadline: Optional[float]
+    ) -> Optional[PooledConnection]:
+        """Pop a usable idle connection, or reserve a slot for a new one (None)."""
+        expired: List[PooledConnection] = []
+        try:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise PoolClosedError("Unable to get connection: pool closed.")
+                    now = monotonic()
+                    expired.extend(self._pop_expired_idle(now))
+                    if self._idle:
+                        return self._idle.pop()
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None
+                    remaining = deadline - now if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        self._checkout_timeouts += 1
+                        raise PoolTimeoutError(
+                            "No connection available in the pool within the "
+                            "checkout timeout."
+                        )
+                    self._waiters += 1
+                    try:
+                        self._lock.wait(remaining)
+                    finally:
+                        self._waiters -= 1
+        finally:
+            for pooled in expired:
+                self._discard(pooled)
+
+    def _pop_expired_idle(self, now: float) -> List[PooledConnection]:
+        expired = self._find_expired_idle(self._idle, len(self._in_use), now)
+        for pooled in expired:
+            self._idle.remove(pooled)
+        return expired
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        if pooled.connection.closed:
+            return False
+        if self.health_check is None or not self._needs_health_check(
+            pooled, monotonic()
+        ):
+            return True
+        try:
+            return self.health_check(pooled.connection) is not False
+        except Exception as e:
+            logger.warning(f"Pooled connection failed a health check: {e}")
+            return False
+
+    def _create(self) -> PooledConnection:
+        """Open a new connection in a slot reserved by incrementing the size."""
+        try:
+            connection = self._connection_factory()
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        if self.prewarm:
+            connection._prewarm(self.prewarm)
+        now = monotonic()
+        with self._lock:
+            self._connections_created += 1
+        return PooledConnection(connection, now, now)
+
+    def _reset(self, connection: Connection) -> bool:
+        """Reset connection state, return False if it can't be reused."""
+        if connection.closed:
+            return False
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            # Closing cursors drops SET parameters set on them
+            for cursor in connection._cursors[:]:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Failed to reset a pooled connection: {e}")
+            return False
+        return True
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        try:
+            pooled.connection.close()
+        except Exception as e:
+            logger.warning(f"Failed to close a pooled connection: {e}")
+        with self._lock:
+            self._size -= 1
+            self._connections_closed += 1
+            self._lock.notify()
+
+    def __enter__(self) -> ConnectionPool:
+        return self
+
+    def __exit__(
+        self, exc_type: type, exc_val: Exception, exc_tb: TracebackType
+    ) -> None:
+        self.close()
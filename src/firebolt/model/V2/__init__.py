@@ -1,15 +1,15 @@
 import json
 from dataclasses import dataclass, field, fields
-from typing import ClassVar, Dict, Iterable, Optional, Type, TypeVar
+from typing import ClassVar, Dict, Iterable, Optional, Type, TypeVar, Union
 
-from firebolt.service.V2.base import BaseService
+from firebolt.service.V2.base import AsyncBaseService, BaseService
 
 Model = TypeVar("Model", bound="FireboltBaseModel")
 
 
 @dataclass
 class FireboltBaseModel:
-    _service: BaseService = field(repr=False, compare=False)
+    _service: Union[BaseService, AsyncBaseService] = field(repr=False, compare=False)
 
     @classmethod
     def _get_field_overrides(cls) -> Dict[str, str]:
@@ -27,7 +27,9 @@ class FireboltBaseModel:
 
     @classmethod
     def _from_dict(
-        cls: Type[Model], data: dict, service: Optional[BaseService] = None
+        cls: Type[Model],
+        data: dict,
+        service: Union[BaseService, AsyncBaseService, None] = None,
     ) -> Model:
         data["_service"] = service
         field_name_overrides = cls._get_field_overrides()
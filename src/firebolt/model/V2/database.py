@@ -3,26 +3,26 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, ClassVar, List
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Sequence, Union
 
 from firebolt.model.V2 import FireboltBaseModel
 from firebolt.service.V2.types import EngineStatus
 from firebolt.utils.exception import AttachedEngineInUseError
 
 if TYPE_CHECKING:
-    from firebolt.model.V2.engine import Engine
-    from firebolt.service.V2.database import DatabaseService
+    from firebolt.model.V2.engine import AsyncEngine, BaseEngine, Engine
+    from firebolt.service.V2.database import (
+        AsyncDatabaseService,
+        DatabaseService,
+    )
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
-class Database(FireboltBaseModel):
+class BaseDatabase(FireboltBaseModel):
     """
-    A Firebolt database.
-
-    Databases belong to a region and have a description,
-    but otherwise are not configurable.
+    Database attributes and logic shared by the sync and async databases.
     """
 
     ALTER_SQL: ClassVar[str] = 'ALTER DATABASE "{}" SET DESCRIPTION = ?'
@@ -30,7 +30,9 @@ class Database(FireboltBaseModel):
     DROP_SQL: ClassVar[str] = 'DROP DATABASE "{}"'
 
     # internal
-    _service: DatabaseService = field(repr=False, compare=False)
+    _service: Union[DatabaseService, AsyncDatabaseService] = field(
+        repr=False, compare=False
+    )
 
     # required
     name: str = field(metadata={"db_name": "catalog_name"})
@@ -38,6 +40,37 @@ class Database(FireboltBaseModel):
     create_time: datetime = field(metadata={"db_name": "created"})
     create_actor: str = field(metadata={"db_name": "catalog_owner"})
 
+    @staticmethod
+    def _check_engines_for_update(engines: Sequence[BaseEngine]) -> None:
+        for engine in engines:
+            if engine.current_status not in {
+                EngineStatus.RUNNING,
+                EngineStatus.STOPPED,
+            }:
+                raise AttachedEngineInUseError(method_name="update")
+
+    @staticmethod
+    def _check_engines_for_delete(engines: Sequence[BaseEngine]) -> None:
+        for engine in engines:
+            if engine.current_status in {
+                EngineStatus.STARTING,
+                EngineStatus.DRAINING,
+                EngineStatus.STOPPING,
+            }:
+                raise AttachedEngineInUseError(method_name="delete")
+
+
+@dataclass
+class Database(BaseDatabase):
+    """
+    A Firebolt database.
+
+    Databases belong to a region and have a description,
+    but otherwise are not configurable.
+    """
+
+    _service: DatabaseService = field(repr=False, compare=False)
+
     def get_attached_engines(self) -> List[Engine]:
         """Get a list of engines that are attached to this database."""
         return self._service.resource_manager.engines.get_many(database_name=self.name)
@@ -60,12 +93,7 @@ class Database(FireboltBaseModel):
         if not description:
             return self
 
-        for engine in self.get_attached_engines():
-            if engine.current_status not in {
-                EngineStatus.RUNNING,
-                EngineStatus.STOPPED,
-            }:
-                raise AttachedEngineInUseError(method_name="update")
+        self._check_engines_for_update(self.get_attached_engines())
 
         sql = self.ALTER_SQL.format(self.name)
         with self._service._connection.cursor() as c:
@@ -80,13 +108,61 @@ class Database(FireboltBaseModel):
         Raises an error if there are any attached engines.
         """
 
-        for engine in self.get_attached_engines():
-            if engine.current_status in {
-                EngineStatus.STARTING,
-                EngineStatus.DRAINING,
-                EngineStatus.STOPPING,
-            }:
-                raise AttachedEngineInUseError(method_name="delete")
+        self._check_engines_for_delete(self.get_attached_engines())
 
         with self._service._connection.cursor() as c:
             c.execute(self.DROP_SQL.format(self.name))
+
+
+@dataclass
+class AsyncDatabase(BaseDatabase):
+    """
+    A Firebolt database managed with an async resource manager.
+
+    Provides the same operations as :py:class:`Database` as coroutines.
+    """
+
+    _service: AsyncDatabaseService = field(repr=False, compare=False)
+
+    async def get_attached_engines(self) -> List[AsyncEngine]:
+        """Get a list of engines that are attached to this database."""
+        return await self._service.resource_manager.engines.get_many(
+            database_name=self.name
+        )
+
+    async def attach_engine(self, engine: AsyncEngine) -> None:
+        """
+        Attach an engine to this database.
+
+        Args:
+            engine: The engine to attach.
+        """
+        await self._service.resource_manager.engines.attach_to_database(
+            engine.name, self.name
+        )
+
+    async def _execute(self, sql: str, parameters: Optional[List] = None) -> None:
+        connection = await self._service._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+
+    async def update(self, description: str) -> AsyncDatabase:
+        """
+        Updates a database description.
+        """
+        if not description:
+            return self
+
+        self._check_engines_for_update(await self.get_attached_engines())
+        await self._execute(self.ALTER_SQL.format(self.name), [description])
+        self.description = description
+        return self
+
+    async def delete(self) -> None:
+        """
+        Delete a database from Firebolt.
+
+        Raises an error if there are any attached engines.
+        """
+        self._check_engines_for_delete(await self.get_attached_engines())
+        await self._execute(self.DROP_SQL.format(self.name))
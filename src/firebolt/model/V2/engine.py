@@ -1,28 +1,241 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple, Union
-
+from threading import Condition, Lock, Thread, current_thread
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from firebolt.async_db import Connection as AsyncConnection
+from firebolt.async_db import connect as async_connect
 from firebolt.db import Connection, connect
 from firebolt.model.V2 import FireboltBaseModel
-from firebolt.model.V2.database import Database
+from firebolt.model.V2.database import AsyncDatabase, Database
 from firebolt.model.V2.instance_type import InstanceType
-from firebolt.service.V2.types import EngineStatus
+from firebolt.service.V2.types import EngineStatus, WaitStrategy
 from firebolt.utils.exception import DatabaseNotFoundError
 
 if TYPE_CHECKING:
-    from firebolt.service.V2.engine import EngineService
+    from firebolt.service.V2.engine import AsyncEngineService, EngineService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of engine operations running in the background at once
+ENGINE_OPERATION_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def _engine_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=ENGINE_OPERATION_WORKERS,
+                thread_name_prefix="firebolt-engine",
+            )
+            atexit.register(_shutdown_engine_executor)
+        return _executor
+
+
+def _shutdown_engine_executor() -> None:
+    """Cancel engine starts that haven't begun and stop the worker threads."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(eq=False)
+class _PendingStart:
+    """Engine waiting to finish stopping or draining before it's started."""
+
+    engine: Engine
+    wait_strategy: WaitStrategy
+    future: Future[Engine] = field(default_factory=Future)
+    # The engine status is checked right away
+    poll_at: float = 0
+    timeout_time: float = field(init=False)
+    intervals: Iterator[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.timeout_time = time.time() + self.wait_strategy.timeout
+        self.intervals = self.wait_strategy.intervals()
+
+
+class _EngineStartPoller:
+    """Starts engines in the background, once they're ready to be started.
+
+    A single thread checks the status of all engines waiting to be started,
+    with one query per engine service. A worker thread is only used to
+    run the start statement of an engine that is ready.
+    """
+
+    def __init__(self) -> None:
+        self._condition = Condition()
+        self._pending: List[_PendingStart] = []
+        self._thread: Optional[Thread] = None
+
+    def start(
+        self, engine: Engine, wait_strategy: Optional[WaitStrategy]
+    ) -> Future[Engine]:
+        pending = _PendingStart(engine, wait_strategy or WaitStrategy())
+        with self._condition:
+            self._pending.append(pending)
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="firebolt-engine-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return pending.future
+
+    def _run(self) -> None:
+        error: Exception = RuntimeError("Checking engine status failed")
+        try:
+            while True:
+                due = self._next_due()
+                if not due:
+                    return
+                self._poll(due)
+        except Exception as e:
+            logger.exception("Checking engine status failed")
+            error = e
+        finally:
+            with self._condition:
+                # Still set if polling failed, otherwise reset by _next_due
+                failed = self._thread is current_thread()
+                if failed:
+                    self._thread = None
+                    pending_starts, self._pending = self._pending, []
+            if failed:
+                # Don't leave futures waiting for a thread that has stopped
+                for pending in pending_starts:
+                    if pending.future.set_running_or_notify_cancel():
+                        pending.future.set_exception(error)
+
+    def _next_due(self) -> List[_PendingStart]:
+        """Wait until an engine status is due to be checked.
+
+        Returns:
+            List[_PendingStart]: Engines to check, empty if none is waiting
+        """
+        with self._condition:
+            while self._pending:
+                now = time.time()
+                services = {
+                    pending.engine._service
+                    for pending in self._pending
+                    if pending.poll_at <= now
+                }
+                if services:
+                    # All engines of a service are checked when any of them is due
+                    return [
+                        pending
+                        for pending in self._pending
+                        if pending.engine._service in services
+                    ]
+                self._condition.wait(
+                    min(pending.poll_at for pending in self._pending) - now
+                )
+            self._thread = None
+            return []
+
+    def _poll(self, due: List[_PendingStart]) -> None:
+        by_service: Dict[EngineService, List[_PendingStart]] = {}
+        for pending in due:
+            if pending.future.cancelled():
+                self._remove(pending)
+            else:
+                by_service.setdefault(pending.engine._service, []).append(pending)
+
+        for service, group in by_service.items():
+            try:
+                dicts = service._get_dicts(
+                    list(dict.fromkeys(pending.engine.name for pending in group))
+                )
+            except Exception as e:
+                for pending in group:
+                    self._fail(pending, e)
+                continue
+
+            for pending in group:
+                try:
+                    self._check(service, pending, dicts)
+                except Exception as e:
+                    self._fail(pending, e)
+
+    def _check(
+        self, service: EngineService, pending: _PendingStart, dicts: Dict[str, dict]
+    ) -> None:
+        """Start the engine if it's ready, or schedule its next status check.
+
+        Raises:
+            TimeoutError: The engine is still not ready after the timeout
+        """
+        pending.engine._update(dicts[pending.engine.name])
+        if not service._waiting_engines([pending.engine]):
+            if self._remove(pending):
+                try:
+                    _engine_executor().submit(self._start_engine, pending)
+                except RuntimeError as e:
+                    # The interpreter is shutting down
+                    pending.future.set_exception(e)
+            return
+        interval = service._next_wait_interval(
+            [pending.engine],
+            pending.wait_strategy,
+            pending.intervals,
+            pending.timeout_time,
+        )
+        pending.poll_at = time.time() + interval
+
+    def _remove(self, pending: _PendingStart) -> bool:
+        """Stop checking the engine status.
+
+        Returns:
+            bool: True if the engine start should go on, False if it was
+                cancelled or has already finished
+        """
+        with self._condition:
+            if pending not in self._pending:
+                return False
+            self._pending.remove(pending)
+        return pending.future.set_running_or_notify_cancel()
+
+    def _fail(self, pending: _PendingStart, error: Exception) -> None:
+        if self._remove(pending):
+            pending.future.set_exception(error)
+
+    @staticmethod
+    def _start_engine(pending: _PendingStart) -> None:
+        try:
+            pending.future.set_result(pending.engine._start())
+        except Exception as e:
+            pending.future.set_exception(e)
+
+
+_start_poller = _EngineStartPoller()
+
 
 @dataclass
-class Engine(FireboltBaseModel):
+class BaseEngine(FireboltBaseModel):
     """
-    A Firebolt engine. Responsible for performing work (queries, ingestion).
+    Engine attributes and logic shared by the sync and async engines.
     """
 
     START_SQL: ClassVar[str] = 'START ENGINE "{}"'
@@ -34,11 +247,19 @@ class Engine(FireboltBaseModel):
         "AUTO_STOP",
     )
     DROP_SQL: ClassVar[str] = 'DROP ENGINE "{}"'
+    # Engines in these states must be waited for before they can be changed
+    WAIT_STATUSES: ClassVar[Tuple[EngineStatus, ...]] = (
+        EngineStatus.DRAINING,
+        EngineStatus.STOPPING,
+        EngineStatus.STARTING,
+    )
 
     # Engine names can only contain alphanumeric characters and underscores
     _engine_name_re = re.compile(r"^[a-zA-Z0-9_]+$")
 
-    _service: EngineService = field(repr=False, compare=False)
+    _service: Union[EngineService, AsyncEngineService] = field(
+        repr=False, compare=False
+    )
 
     name: str = field(metadata={"db_name": "engine_name"})
     region: str = field()
@@ -63,6 +284,88 @@ class Engine(FireboltBaseModel):
             # Resolve engine status
             self.current_status = EngineStatus(self.current_status)
 
+    def _update(self, data: dict) -> None:
+        field_name_overrides = self._get_field_overrides()
+        for field_name, value in data.items():
+            setattr(self, field_name_overrides.get(field_name, field_name), value)
+
+        self.__post_init__()
+
+    def _check_not_draining(self, action: str) -> None:
+        if self.current_status in (EngineStatus.DRAINING,):
+            raise ValueError(
+                f"Unable to {action} engine {self.name} because it's "
+                f"in {self.current_status.value.lower()} state"
+            )
+
+    def _check_update_parameters(
+        self,
+        name: Optional[str],
+        engine_type: Optional[str],
+        scale: Optional[int],
+        spec: Union[InstanceType, str, None],
+        auto_stop: Optional[int],
+        warmup: Optional[str],
+    ) -> bool:
+        # Returns False if there is nothing to update
+        disallowed = [
+            name
+            for name, value in (("engine_type", engine_type), ("warmup", warmup))
+            if value
+        ]
+        if disallowed:
+            raise ValueError(
+                f"Parameters {disallowed} are not supported for this account"
+            )
+
+        if not any(x is not None for x in (name, scale, spec, auto_stop)):
+            # Nothing to be updated
+            return False
+
+        if name is not None and any(x is not None for x in (scale, spec, auto_stop)):
+            raise ValueError("Cannot update name and other parameters at the same time")
+        return True
+
+    def _update_sql(
+        self,
+        name: Optional[str],
+        scale: Optional[int],
+        spec: Union[InstanceType, str, None],
+        auto_stop: Optional[int],
+    ) -> Tuple[str, List[Union[str, int]]]:
+        sql = self.ALTER_PREFIX_SQL.format(self.name)
+        parameters: List[Union[str, int]] = []
+        if name is not None:
+            if not self._engine_name_re.match(name):
+                raise ValueError(
+                    f"Engine name {name} is invalid, "
+                    "it must only contain alphanumeric characters and underscores."
+                )
+            sql += f" RENAME TO {name}"
+        else:
+            sql += " SET "
+            parameters = []
+            for param, value in zip(
+                self.ALTER_PARAMETER_NAMES,
+                (scale, spec, auto_stop),
+            ):
+                if value is not None:
+                    sql_part, new_params = self._service._format_engine_attribute_sql(
+                        param, value
+                    )
+                    sql += sql_part
+                    parameters.extend(new_params)
+        return sql, parameters
+
+
+@dataclass
+class Engine(BaseEngine):
+    """
+    A Firebolt engine. Responsible for performing work (queries, ingestion).
+    """
+
+    _service: EngineService = field(repr=False, compare=False)
+
     @property
     def database(self) -> Optional[Database]:
         if self._database_name:
@@ -74,11 +377,7 @@ class Engine(FireboltBaseModel):
 
     def refresh(self, name: Optional[str] = None) -> None:
         """Update attributes of the instance from Firebolt."""
-        field_name_overrides = self._get_field_overrides()
-        for field_name, value in self._service._get_dict(name or self.name).items():
-            setattr(self, field_name_overrides.get(field_name, field_name), value)
-
-        self.__post_init__()
+        self._update(self._service._get_dict(name or self.name))
 
     def attach_to_database(self, database: Union[Database, str]) -> None:
         """
@@ -103,48 +402,36 @@ class Engine(FireboltBaseModel):
             engine_name=self.name,
             account_name=self._service.resource_manager.account_name,
             api_endpoint=self._service.resource_manager.api_endpoint,
+            transport_options=self._service.resource_manager.transport_options,
         )
 
-    def _wait_for_start_stop(self) -> None:
-        wait_timeout = 3600
-        interval_seconds = 5
-        timeout_time = time.time() + wait_timeout
-        while self.current_status in (
-            EngineStatus.DRAINING,
-            EngineStatus.STOPPING,
-            EngineStatus.STARTING,
-        ):
-            logger.info(
-                f"Engine {self.name} is currently "
-                f"{self.current_status.value.lower()}, waiting"
-            )
-            time.sleep(interval_seconds)
-            if time.time() > timeout_time:
-                raise TimeoutError(
-                    f"Excedeed timeout of {wait_timeout}s waiting for "
-                    f"an engine in {self.current_status.value.lower()} state"
-                )
-            logger.info(".[!n]")
-            self.refresh()
+    def _wait_for_start_stop(
+        self, wait_strategy: Optional[WaitStrategy] = None
+    ) -> None:
+        self._service.wait_for_engines([self], wait_strategy)
 
-    def start(self) -> Engine:
+    def start(self, wait_strategy: Optional[WaitStrategy] = None) -> Engine:
         """
         Start an engine. If it's already started, do nothing.
 
+        Args:
+            wait_strategy: Polling schedule used if the engine is stopping
+                or draining, default WaitStrategy() if None
+
         Returns:
             The updated engine instance.
         """
 
         self.refresh()
-        self._wait_for_start_stop()
+        self._wait_for_start_stop(wait_strategy)
+        return self._start()
+
+    def _start(self) -> Engine:
+        """Start an engine that isn't stopping or draining."""
         if self.current_status == EngineStatus.RUNNING:
             logger.info(f"Engine {self.name} is already running.")
             return self
-        if self.current_status in (EngineStatus.DRAINING,):
-            raise ValueError(
-                f"Unable to start engine {self.name} because it's "
-                f"in {self.current_status.value.lower()} state"
-            )
+        self._check_not_draining("start")
 
         logger.info(f"Starting engine {self.name}")
         with self._service._connection.cursor() as c:
@@ -152,22 +439,42 @@ class Engine(FireboltBaseModel):
         self.refresh()
         return self
 
-    def stop(self) -> Engine:
+    def start_async(
+        self, wait_strategy: Optional[WaitStrategy] = None
+    ) -> Future[Engine]:
+        """
+        Start an engine without blocking the calling thread.
+
+        The status of all engines started this way is checked by one
+        background thread, with one query per engine service. Once an
+        engine is no longer stopping or draining, it's started by a worker
+        pool shared by all engines.
+
+        Args:
+            wait_strategy: Polling schedule used if the engine is stopping
+                or draining, default WaitStrategy() if None
+
+        Returns:
+            Future resolving to the updated engine instance once it's started.
+        """
+        return _start_poller.start(self, wait_strategy)
+
+    def stop(self, wait_strategy: Optional[WaitStrategy] = None) -> Engine:
         """Stop an engine. If it's already stopped, do nothing.
 
+        Args:
+            wait_strategy: Polling schedule used if the engine is starting
+                or draining, default WaitStrategy() if None
+
         Returns:
             The updated engine instance.
         """
         self.refresh()
-        self._wait_for_start_stop()
+        self._wait_for_start_stop(wait_strategy)
         if self.current_status == EngineStatus.STOPPED:
             logger.info(f"Engine {self.name} is already stopped.")
             return self
-        if self.current_status in (EngineStatus.DRAINING,):
-            raise ValueError(
-                f"Unable to stop engine {self.name} because it's "
-                f"in {self.current_status.value.lower()} state"
-            )
+        self._check_not_draining("stop")
         logger.info(f"Stopping engine {self.name}")
         with self._service._connection.cursor() as c:
             c.execute(self.STOP_SQL.format(self.name))
@@ -187,54 +494,16 @@ class Engine(FireboltBaseModel):
         Updates the engine and returns an updated version of the engine. If all
         parameters are set to None, old engine parameter values remain.
         """
-        disallowed = [
-            name
-            for name, value in (("engine_type", engine_type), ("warmup", warmup))
-            if value
-        ]
-        if disallowed:
-            raise ValueError(
-                f"Parameters {disallowed} are not supported for this account"
-            )
-
-        if not any(x is not None for x in (name, scale, spec, auto_stop)):
-            # Nothing to be updated
+        if not self._check_update_parameters(
+            name, engine_type, scale, spec, auto_stop, warmup
+        ):
             return self
 
-        if name is not None and any(x is not None for x in (scale, spec, auto_stop)):
-            raise ValueError("Cannot update name and other parameters at the same time")
-
         self.refresh()
         self._wait_for_start_stop()
-        if self.current_status in (EngineStatus.DRAINING,):
-            raise ValueError(
-                f"Unable to update engine {self.name} because it's "
-                f"in {self.current_status.value.lower()} state"
-            )
-
-        sql = self.ALTER_PREFIX_SQL.format(self.name)
-        parameters: List[Union[str, int]] = []
-        if name is not None:
-            if not self._engine_name_re.match(name):
-                raise ValueError(
-                    f"Engine name {name} is invalid, "
-                    "it must only contain alphanumeric characters and underscores."
-                )
-            sql += f" RENAME TO {name}"
-        else:
-            sql += " SET "
-            parameters = []
-            for param, value in zip(
-                self.ALTER_PARAMETER_NAMES,
-                (scale, spec, auto_stop),
-            ):
-                if value is not None:
-                    sql_part, new_params = self._service._format_engine_attribute_sql(
-                        param, value
-                    )
-                    sql += sql_part
-                    parameters.extend(new_params)
+        self._check_not_draining("update")
 
+        sql, parameters = self._update_sql(name, scale, spec, auto_stop)
         with self._service._connection.cursor() as c:
             c.execute(sql, parameters)
         self.refresh(name)
@@ -247,3 +516,144 @@ class Engine(FireboltBaseModel):
             return
         with self._service._connection.cursor() as c:
             c.execute(self.DROP_SQL.format(self.name))
+
+
+@dataclass
+class AsyncEngine(BaseEngine):
+    """
+    A Firebolt engine managed with an async resource manager.
+
+    Provides the same operations as :py:class:`Engine` as coroutines.
+    """
+
+    _service: AsyncEngineService = field(repr=False, compare=False)
+
+    async def get_database(self) -> Optional[AsyncDatabase]:
+        """Get the database the engine is attached to, if any."""
+        if self._database_name:
+            try:
+                return await self._service.resource_manager.databases.get(
+                    self._database_name
+                )
+            except DatabaseNotFoundError:
+                pass
+        return None
+
+    async def refresh(self, name: Optional[str] = None) -> None:
+        """Update attributes of the instance from Firebolt."""
+        self._update(await self._service._get_dict(name or self.name))
+
+    async def attach_to_database(self, database: Union[AsyncDatabase, str]) -> None:
+        """
+        Attach this engine to a database.
+
+        Args:
+            database: Database to which the engine will be attached
+        """
+        await self._service.attach_to_database(self, database)
+
+    async def get_connection(self) -> AsyncConnection:
+        """Get a connection to the attached database for running queries.
+
+        Returns:
+            firebolt.async_db.connection.Connection: engine connection instance
+        """
+        connection = await self._service._get_connection()
+        return await async_connect(
+            database=self._database_name,
+            # we always have firebolt Auth as a client auth
+            auth=connection._client.auth,  # type: ignore
+            engine_name=self.name,
+            account_name=self._service.resource_manager.account_name,
+            api_endpoint=self._service.resource_manager.api_endpoint,
+            transport_options=self._service.resource_manager.transport_options,
+        )
+
+    async def _wait_for_start_stop(
+        self, wait_strategy: Optional[WaitStrategy] = None
+    ) -> None:
+        await self._service.wait_for_engines([self], wait_strategy)
+
+    async def _execute(self, sql: str, parameters: Optional[List] = None) -> None:
+        connection = await self._service._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+
+    async def start(self, wait_strategy: Optional[WaitStrategy] = None) -> AsyncEngine:
+        """
+        Start an engine. If it's already started, do nothing.
+
+        Args:
+            wait_strategy: Polling schedule used if the engine is stopping
+                or draining, default WaitStrategy() if None
+
+        Returns:
+            The updated engine instance.
+        """
+        await self.refresh()
+        await self._wait_for_start_stop(wait_strategy)
+        if self.current_status == EngineStatus.RUNNING:
+            logger.info(f"Engine {self.name} is already running.")
+            return self
+        self._check_not_draining("start")
+
+        logger.info(f"Starting engine {self.name}")
+        await self._execute(self.START_SQL.format(self.name))
+        await self.refresh()
+        return self
+
+    async def stop(self, wait_strategy: Optional[WaitStrategy] = None) -> AsyncEngine:
+        """Stop an engine. If it's already stopped, do nothing.
+
+        Args:
+            wait_strategy: Polling schedule used if the engine is starting
+                or draining, default WaitStrategy() if None
+
+        Returns:
+            The updated engine instance.
+        """
+        await self.refresh()
+        await self._wait_for_start_stop(wait_strategy)
+        if self.current_status == EngineStatus.STOPPED:
+            logger.info(f"Engine {self.name} is already stopped.")
+            return self
+        self._check_not_draining("stop")
+
+        logger.info(f"Stopping engine {self.name}")
+        await self._execute(self.STOP_SQL.format(self.name))
+        await self.refresh()
+        return self
+
+    async def update(
+        self,
+        name: Optional[str] = None,
+        engine_type: Optional[str] = None,
+        scale: Optional[int] = None,
+        spec: Union[InstanceType, str, None] = None,
+        auto_stop: Optional[int] = None,
+        warmup: Optional[str] = None,
+    ) -> AsyncEngine:
+        """
+        Updates the engine and returns an updated version of the engine. If all
+        parameters are set to None, old engine parameter values remain.
+        """
+        if not self._check_update_parameters(
+            name, engine_type, scale, spec, auto_stop, warmup
+        ):
+            return self
+
+        await self.refresh()
+        await self._wait_for_start_stop()
+        self._check_not_draining("update")
+
+        sql, parameters = self._update_sql(name, scale, spec, auto_stop)
+        await self._execute(sql, parameters)
+        await self.refresh(name)
+        return self
+
+    async def delete(self) -> None:
+        """Delete an engine."""
+        await self.refresh()
+        if self.current_status in [EngineStatus.DRAINING, EngineStatus.DELETING]:
+            return
+        await self._execute(self.DROP_SQL.format(self.name))
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING
 from firebolt.db import Connection
 
 if TYPE_CHECKING:
-    from firebolt.service.manager import ResourceManager
+    from firebolt.async_db import Connection as AsyncConnection
+    from firebolt.service.manager import AsyncResourceManager, ResourceManager
 
 
 class BaseService:
@@ -13,3 +14,11 @@ class BaseService:
     @property
     def _connection(self) -> Connection:
         return self.resource_manager._connection
+
+
+class AsyncBaseService:
+    def __init__(self, resource_manager: "AsyncResourceManager"):
+        self.resource_manager = resource_manager
+
+    async def _get_connection(self) -> "AsyncConnection":
+        return await self.resource_manager._get_connection()
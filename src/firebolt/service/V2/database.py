@@ -1,15 +1,17 @@
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
-from firebolt.model.V2.database import Database
-from firebolt.model.V2.engine import Engine
-from firebolt.service.V2.base import BaseService
+from firebolt.model.V2.database import AsyncDatabase, Database
+from firebolt.model.V2.engine import AsyncEngine, Engine
+from firebolt.service.V2.base import AsyncBaseService, BaseService
 from firebolt.utils.exception import DatabaseNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
-class DatabaseService(BaseService):
+class BaseDatabaseService:
+    """Database queries shared by the sync and async database services."""
+
     DB_FIELDS = (
         "catalog_name",
         "description",
@@ -28,6 +30,68 @@ class DatabaseService(BaseService):
         "attached_engine_name_contains",
     ]
 
+    def _get_many_sql(
+        self,
+        name_contains: Optional[str],
+        attached_engine_name_eq: Optional[str],
+        attached_engine_name_contains: Optional[str],
+        region_eq: Optional[str],
+    ) -> Tuple[str, List]:
+        sql = self.GET_SQL
+        parameters = []
+        disallowed_parameters = [
+            name
+            for name, value in (
+                ("attached_engine_name_eq", attached_engine_name_eq),
+                ("attached_engine_name_contains", attached_engine_name_contains),
+                ("region_eq", region_eq),
+            )
+            if value
+        ]
+        if disallowed_parameters:
+            raise ValueError(
+                f"Parameters {disallowed_parameters} are not supported for this account"
+            )
+
+        if name_contains:
+            sql += " WHERE catalog_name like ?"
+            parameters.append(f"%{name_contains}%")
+        return sql, parameters
+
+    def _create_sql(
+        self,
+        name: str,
+        region: Optional[str],
+        attached_engines: Union[List[str], List[Engine], List[AsyncEngine], None],
+        description: Optional[str],
+        fail_if_exists: bool,
+    ) -> Tuple[str, List]:
+        logger.info(f"Creating database {name}")
+
+        disallowed_parameters = [
+            name
+            for name, value in (
+                ("region", region),
+                (attached_engines, attached_engines),
+            )
+            if value is not None
+        ]
+        if disallowed_parameters:
+            raise ValueError(
+                f"Parameters {disallowed_parameters} are not supported for this account"
+            )
+
+        sql = self.CREATE_PREFIX_SQL.format(
+            ("" if fail_if_exists else self.IF_NOT_EXISTS_SQL), name
+        )
+        parameters = []
+        if description:
+            sql += " WITH DESCRIPTION = ? "
+            parameters.append(description)
+        return sql, parameters
+
+
+class DatabaseService(BaseDatabaseService, BaseService):
     def _get_dict(self, name: str) -> dict:
         with self._connection.cursor() as c:
             count = c.execute(self.GET_BY_NAME_SQL, (name,))
@@ -64,26 +128,12 @@ class DatabaseService(BaseService):
         Returns:
             A list of databases matching the filters
         """
-        sql = self.GET_SQL
-        parameters = []
-        disallowed_parameters = [
-            name
-            for name, value in (
-                ("attached_engine_name_eq", attached_engine_name_eq),
-                ("attached_engine_name_contains", attached_engine_name_contains),
-                ("region_eq", region_eq),
-            )
-            if value
-        ]
-        if disallowed_parameters:
-            raise ValueError(
-                f"Parameters {disallowed_parameters} are not supported for this account"
-            )
-
-        if name_contains:
-            sql += " WHERE catalog_name like ?"
-            parameters.append(f"%{name_contains}%")
-
+        sql, parameters = self._get_many_sql(
+            name_contains,
+            attached_engine_name_eq,
+            attached_engine_name_contains,
+            region_eq,
+        )
         with self._connection.cursor() as c:
             c.execute(sql, parameters)
             dicts = [
@@ -114,29 +164,94 @@ class DatabaseService(BaseService):
             The newly created database
         """
 
-        logger.info(f"Creating database {name}")
-
-        disallowed_parameters = [
-            name
-            for name, value in (
-                ("region", region),
-                (attached_engines, attached_engines),
-            )
-            if value is not None
-        ]
-        if disallowed_parameters:
-            raise ValueError(
-                f"Parameters {disallowed_parameters} are not supported for this account"
-            )
-
-        sql = self.CREATE_PREFIX_SQL.format(
-            ("" if fail_if_exists else self.IF_NOT_EXISTS_SQL), name
+        sql, parameters = self._create_sql(
+            name, region, attached_engines, description, fail_if_exists
         )
-        parameters = []
-        if description:
-            sql += " WITH DESCRIPTION = ? "
-            parameters.append(description)
-
         with self._connection.cursor() as c:
             c.execute(sql, parameters)
         return self.get(name)
+
+
+class AsyncDatabaseService(BaseDatabaseService, AsyncBaseService):
+    async def _get_dict(self, name: str) -> dict:
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            count = await c.execute(self.GET_BY_NAME_SQL, (name,))
+            if count == 0:
+                raise DatabaseNotFoundError(name)
+            row = await c.fetchone()
+            assert row is not None  # type check
+            return {column.name: value for column, value in zip(c.description, row)}
+
+    async def get(self, name: str) -> AsyncDatabase:
+        """Get a Database from Firebolt by its name."""
+        return AsyncDatabase._from_dict(await self._get_dict(name), self)
+
+    async def get_by_name(self, name: str) -> AsyncDatabase:
+        return await self.get(name)
+
+    async def get_many(
+        self,
+        name_contains: Optional[str] = None,
+        attached_engine_name_eq: Optional[str] = None,
+        attached_engine_name_contains: Optional[str] = None,
+        region_eq: Optional[str] = None,
+    ) -> List[AsyncDatabase]:
+        """
+        Get a list of databases on Firebolt.
+
+        Args:
+            name_contains: Filter for databases with a name containing this substring
+            attached_engine_name_eq: Filter for databases by an exact engine name
+            attached_engine_name_contains: Filter for databases by engines with a
+                name containing this substring
+            region_eq: Filter for database by region
+
+        Returns:
+            A list of databases matching the filters
+        """
+        sql, parameters = self._get_many_sql(
+            name_contains,
+            attached_engine_name_eq,
+            attached_engine_name_contains,
+            region_eq,
+        )
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+            return [
+                AsyncDatabase._from_dict(
+                    {column.name: value for column, value in zip(c.description, row)},
+                    self,
+                )
+                for row in await c.fetchall()
+            ]
+
+    async def create(
+        self,
+        name: str,
+        region: Optional[str] = None,
+        attached_engines: Union[List[str], List[AsyncEngine], None] = None,
+        description: Optional[str] = None,
+        fail_if_exists: bool = True,
+    ) -> AsyncDatabase:
+        """
+        Create a new Database on Firebolt.
+
+        Args:
+            name: Name of the database
+            region: Region name in which to create the database
+            attached_engines: List of engines to attach to the database
+            description: Description of the database
+            fail_if_exists: Fail is a database with provided name already exists
+
+        Returns:
+            The newly created database
+        """
+        sql, parameters = self._create_sql(
+            name, region, attached_engines, description, fail_if_exists
+        )
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+        return await self.get(name)
@@ -1,16 +1,38 @@
+import time
 from logging import getLogger
-from typing import List, Optional, Tuple, Union
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from firebolt.model.V2.engine import Database, Engine
+import anyio
+
+from firebolt.model.V2.engine import (
+    AsyncDatabase,
+    AsyncEngine,
+    BaseEngine,
+    Database,
+    Engine,
+)
 from firebolt.model.V2.instance_type import InstanceType
-from firebolt.service.V2.base import BaseService
-from firebolt.service.V2.types import EngineStatus
+from firebolt.service.V2.base import AsyncBaseService, BaseService
+from firebolt.service.V2.types import EngineStatus, WaitStrategy
 from firebolt.utils.exception import EngineNotFoundError
 
 logger = getLogger(__name__)
 
+EngineT = TypeVar("EngineT", bound=BaseEngine)
+
+
+class BaseEngineService:
+    """Engine queries shared by the sync and async engine services."""
 
-class EngineService(BaseService):
     DB_FIELDS = (
         "engine_name",
         "region",
@@ -27,6 +49,7 @@ class EngineService(BaseService):
 
     GET_SQL = "SELECT {} FROM information_schema.engines"
     GET_BY_NAME_SQL = GET_SQL + " WHERE engine_name=?"
+    GET_BY_NAMES_SQL = GET_SQL + " WHERE engine_name IN ({})"
     GET_WHERE_SQL = " WHERE "
 
     CREATE_PREFIX_SQL = 'CREATE ENGINE {}"{}"'
@@ -49,44 +72,28 @@ class EngineService(BaseService):
         "warmup",
     ]
 
-    def _get_dict(self, name: str) -> dict:
-        with self._connection.cursor() as c:
-            sql = self.GET_BY_NAME_SQL.format(", ".join(self.DB_FIELDS))
-            count = c.execute(sql, (name,))
-            if count == 0:
-                raise EngineNotFoundError(name)
-            return {
-                column.name: value for column, value in zip(c.description, c.fetchone())
-            }
+    def _get_by_name_sql(self) -> str:
+        return self.GET_BY_NAME_SQL.format(", ".join(self.DB_FIELDS))
 
-    def get(self, name: str) -> Engine:
-        """Get an engine from Firebolt by its name."""
-        return Engine._from_dict(self._get_dict(name), self)
+    def _get_by_names_sql(self, names: Sequence[str]) -> str:
+        return self.GET_BY_NAMES_SQL.format(
+            ", ".join(self.DB_FIELDS), ", ".join("?" * len(names))
+        )
 
-    def get_by_name(self, name: str) -> Engine:
-        return self.get(name)
+    @staticmethod
+    def _check_found(names: Sequence[str], dicts: Dict[str, dict]) -> None:
+        for name in names:
+            if name not in dicts:
+                raise EngineNotFoundError(name)
 
-    def get_many(
+    def _get_many_sql(
         self,
-        name_contains: Optional[str] = None,
-        current_status_eq: Union[str, EngineStatus, None] = None,
-        current_status_not_eq: Union[str, EngineStatus, None] = None,
-        region_eq: Optional[str] = None,
-        database_name: Optional[str] = None,
-    ) -> List[Engine]:
-        """
-        Get a list of engines on Firebolt.
-
-        Args:
-            name_contains: Filter for engines with a name containing this substring
-            current_status_eq: Filter for engines with this status
-            current_status_not_eq: Filter for engines that do not have this status
-            region_eq: Filter for engines by region
-
-        Returns:
-            A list of engines matching the filters
-        """
-
+        name_contains: Optional[str],
+        current_status_eq: Union[str, EngineStatus, None],
+        current_status_not_eq: Union[str, EngineStatus, None],
+        region_eq: Optional[str],
+        database_name: Optional[str],
+    ) -> Tuple[str, List]:
         if region_eq:
             raise ValueError(
                 "Parameter 'region_eq' is not supported in this version of Firebolt."
@@ -116,14 +123,7 @@ class EngineService(BaseService):
                 condition.append("default_database = ?")
                 parameters.append(database_name)
             sql += self.GET_WHERE_SQL + " AND ".join(condition)
-
-        with self._connection.cursor() as c:
-            c.execute(sql, parameters)
-            dicts = [
-                {column.name: value for column, value in zip(c.description, row)}
-                for row in c.fetchall()
-            ]
-            return [Engine._from_dict(_dict, self) for _dict in dicts]
+        return sql, parameters
 
     @staticmethod
     def _format_engine_parameter(
@@ -152,6 +152,202 @@ class EngineService(BaseService):
             return f"{param} = {self._format_engine_parameter(value)} ", []
         return f"{param} = ? ", [self._format_engine_parameter(value)]
 
+    def _create_sql(
+        self,
+        name: str,
+        region: Optional[str],
+        engine_type: Optional[str],
+        spec: Union[InstanceType, str, None],
+        scale: Optional[int],
+        auto_stop: Optional[int],
+        warmup: Optional[str],
+        fail_if_exists: bool,
+    ) -> Tuple[str, List]:
+        logger.info(f"Creating engine {name}")
+
+        disallowed_parameters = [
+            name
+            for name, value in (
+                ("region", region),
+                ("engine_type", engine_type),
+                ("warmup", warmup),
+            )
+            if value
+        ]
+        if disallowed_parameters:
+            raise ValueError(
+                f"Parameters {disallowed_parameters} are not supported for this account"
+            )
+
+        sql = self.CREATE_PREFIX_SQL.format(
+            ("" if fail_if_exists else self.IF_NOT_EXISTS_SQL), name
+        )
+        parameters = []
+        if any(x is not None for x in (spec, scale, auto_stop)):
+            sql += self.CREATE_WITH_SQL
+            for param, value in zip(
+                self.CREATE_PARAMETER_NAMES,
+                (region, engine_type, spec, scale, auto_stop, warmup),
+            ):
+                if value is not None:
+                    sql_part, new_params = self._format_engine_attribute_sql(
+                        param, value
+                    )
+                    sql += sql_part
+                    parameters.extend(new_params)
+        return sql, parameters
+
+    @staticmethod
+    def _waiting_engines(engines: Sequence[EngineT]) -> List[EngineT]:
+        waiting = [
+            engine
+            for engine in engines
+            if engine.current_status in BaseEngine.WAIT_STATUSES
+        ]
+        for engine in waiting:
+            logger.info(
+                f"Engine {engine.name} is currently "
+                f"{engine.current_status.value.lower()}, waiting"
+            )
+        return waiting
+
+    @staticmethod
+    def _next_wait_interval(
+        waiting: Sequence[BaseEngine],
+        wait_strategy: WaitStrategy,
+        intervals: Iterator[float],
+        timeout_time: float,
+    ) -> float:
+        """Get the seconds to wait before the next status check.
+
+        The interval is cut short at the timeout, so the last check is made
+        right when it expires.
+
+        Raises:
+            TimeoutError: The timeout has expired
+        """
+        remaining = timeout_time - time.time()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Exceeded timeout of {wait_strategy.timeout:g}s waiting for "
+                f"an engine in {waiting[0].current_status.value.lower()} state"
+            )
+        return min(next(intervals), remaining)
+
+
+class EngineService(BaseEngineService, BaseService):
+    def _get_dict(self, name: str) -> dict:
+        with self._connection.cursor() as c:
+            count = c.execute(self._get_by_name_sql(), (name,))
+            if count == 0:
+                raise EngineNotFoundError(name)
+            return {
+                column.name: value for column, value in zip(c.description, c.fetchone())
+            }
+
+    def _get_dicts(self, names: Sequence[str]) -> Dict[str, dict]:
+        with self._connection.cursor() as c:
+            c.execute(self._get_by_names_sql(names), names)
+            dicts = {
+                row_dict["engine_name"]: row_dict
+                for row_dict in (
+                    {column.name: value for column, value in zip(c.description, row)}
+                    for row in c.fetchall()
+                )
+            }
+        self._check_found(names, dicts)
+        return dicts
+
+    def get(self, name: str) -> Engine:
+        """Get an engine from Firebolt by its name."""
+        return Engine._from_dict(self._get_dict(name), self)
+
+    def get_by_name(self, name: str) -> Engine:
+        return self.get(name)
+
+    def get_many(
+        self,
+        name_contains: Optional[str] = None,
+        current_status_eq: Union[str, EngineStatus, None] = None,
+        current_status_not_eq: Union[str, EngineStatus, None] = None,
+        region_eq: Optional[str] = None,
+        database_name: Optional[str] = None,
+    ) -> List[Engine]:
+        """
+        Get a list of engines on Firebolt.
+
+        Args:
+            name_contains: Filter for engines with a name containing this substring
+            current_status_eq: Filter for engines with this status
+            current_status_not_eq: Filter for engines that do not have this status
+            region_eq: Filter for engines by region
+
+        Returns:
+            A list of engines matching the filters
+        """
+        sql, parameters = self._get_many_sql(
+            name_contains,
+            current_status_eq,
+            current_status_not_eq,
+            region_eq,
+            database_name,
+        )
+        with self._connection.cursor() as c:
+            c.execute(sql, parameters)
+            dicts = [
+                {column.name: value for column, value in zip(c.description, row)}
+                for row in c.fetchall()
+            ]
+            return [Engine._from_dict(_dict, self) for _dict in dicts]
+
+    def wait_for_engines(
+        self,
+        engines: Sequence[Union[Engine, str]],
+        wait_strategy: Optional[WaitStrategy] = None,
+    ) -> List[Engine]:
+        """
+        Wait for engines to finish starting, stopping or draining.
+
+        The status of all engines still in one of these states is checked with
+        a single query, at intervals given by the wait strategy. Engine
+        instances are updated in place.
+
+        Args:
+            engines: Engines or engine names to wait for
+            wait_strategy: Polling schedule, default WaitStrategy() if None
+
+        Returns:
+            The updated engines, in the order they were passed
+
+        Raises:
+            TimeoutError: An engine is still in one of these states
+                after the wait strategy timeout
+        """
+        wait_strategy = wait_strategy or WaitStrategy()
+        names = [engine for engine in engines if isinstance(engine, str)]
+        dicts = self._get_dicts(names) if names else {}
+        result = [
+            engine
+            if isinstance(engine, Engine)
+            else Engine._from_dict(dicts[engine], self)
+            for engine in engines
+        ]
+
+        timeout_time = time.time() + wait_strategy.timeout
+        intervals = wait_strategy.intervals()
+        while True:
+            waiting = self._waiting_engines(result)
+            if not waiting:
+                return result
+            time.sleep(
+                self._next_wait_interval(
+                    waiting, wait_strategy, intervals, timeout_time
+                )
+            )
+            dicts = self._get_dicts([engine.name for engine in waiting])
+            for engine in waiting:
+                engine._update(dicts[engine.name])
+
     def create(
         self,
         name: str,
@@ -189,39 +385,9 @@ class EngineService(BaseService):
         Returns:
             Engine with the specified settings
         """
-
-        logger.info(f"Creating engine {name}")
-
-        disallowed_parameters = [
-            name
-            for name, value in (
-                ("region", region),
-                ("engine_type", engine_type),
-                ("warmup", warmup),
-            )
-            if value
-        ]
-        if disallowed_parameters:
-            raise ValueError(
-                f"Parameters {disallowed_parameters} are not supported for this account"
-            )
-
-        sql = self.CREATE_PREFIX_SQL.format(
-            ("" if fail_if_exists else self.IF_NOT_EXISTS_SQL), name
+        sql, parameters = self._create_sql(
+            name, region, engine_type, spec, scale, auto_stop, warmup, fail_if_exists
         )
-        parameters = []
-        if any(x is not None for x in (spec, scale, auto_stop)):
-            sql += self.CREATE_WITH_SQL
-            for param, value in zip(
-                self.CREATE_PARAMETER_NAMES,
-                (region, engine_type, spec, scale, auto_stop, warmup),
-            ):
-                if value is not None:
-                    sql_part, new_params = self._format_engine_attribute_sql(
-                        param, value
-                    )
-                    sql += sql_part
-                    parameters.extend(new_params)
         with self._connection.cursor() as c:
             c.execute(sql, parameters)
         return self.get(name)
@@ -237,3 +403,173 @@ class EngineService(BaseService):
             engine._database_name = (
                 database.name if isinstance(database, Database) else database
             )
+
+
+class AsyncEngineService(BaseEngineService, AsyncBaseService):
+    async def _get_dict(self, name: str) -> dict:
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            count = await c.execute(self._get_by_name_sql(), (name,))
+            if count == 0:
+                raise EngineNotFoundError(name)
+            row = await c.fetchone()
+            assert row is not None  # type check
+            return {column.name: value for column, value in zip(c.description, row)}
+
+    async def _get_dicts(self, names: Sequence[str]) -> Dict[str, dict]:
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(self._get_by_names_sql(names), names)
+            dicts = {
+                row_dict["engine_name"]: row_dict
+                for row_dict in (
+                    {column.name: value for column, value in zip(c.description, row)}
+                    for row in await c.fetchall()
+                )
+            }
+        self._check_found(names, dicts)
+        return dicts
+
+    async def get(self, name: str) -> AsyncEngine:
+        """Get an engine from Firebolt by its name."""
+        return AsyncEngine._from_dict(await self._get_dict(name), self)
+
+    async def get_by_name(self, name: str) -> AsyncEngine:
+        return await self.get(name)
+
+    async def get_many(
+        self,
+        name_contains: Optional[str] = None,
+        current_status_eq: Union[str, EngineStatus, None] = None,
+        current_status_not_eq: Union[str, EngineStatus, None] = None,
+        region_eq: Optional[str] = None,
+        database_name: Optional[str] = None,
+    ) -> List[AsyncEngine]:
+        """
+        Get a list of engines on Firebolt.
+
+        Args:
+            name_contains: Filter for engines with a name containing this substring
+            current_status_eq: Filter for engines with this status
+            current_status_not_eq: Filter for engines that do not have this status
+            region_eq: Filter for engines by region
+
+        Returns:
+            A list of engines matching the filters
+        """
+        sql, parameters = self._get_many_sql(
+            name_contains,
+            current_status_eq,
+            current_status_not_eq,
+            region_eq,
+            database_name,
+        )
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+            return [
+                AsyncEngine._from_dict(
+                    {column.name: value for column, value in zip(c.description, row)},
+                    self,
+                )
+                for row in await c.fetchall()
+            ]
+
+    async def wait_for_engines(
+        self,
+        engines: Sequence[Union[AsyncEngine, str]],
+        wait_strategy: Optional[WaitStrategy] = None,
+    ) -> List[AsyncEngine]:
+        """
+        Wait for engines to finish starting, stopping or draining.
+
+        The status of all engines still in one of these states is checked with
+        a single query, at intervals given by the wait strategy. Engine
+        instances are updated in place.
+
+        Args:
+            engines: Engines or engine names to wait for
+            wait_strategy: Polling schedule, default WaitStrategy() if None
+
+        Returns:
+            The updated engines, in the order they were passed
+
+        Raises:
+            TimeoutError: An engine is still in one of these states
+                after the wait strategy timeout
+        """
+        wait_strategy = wait_strategy or WaitStrategy()
+        names = [engine for engine in engines if isinstance(engine, str)]
+        dicts = await self._get_dicts(names) if names else {}
+        result = [
+            engine
+            if isinstance(engine, AsyncEngine)
+            else AsyncEngine._from_dict(dicts[engine], self)
+            for engine in engines
+        ]
+
+        timeout_time = time.time() + wait_strategy.timeout
+        intervals = wait_strategy.intervals()
+        while True:
+            waiting = self._waiting_engines(result)
+            if not waiting:
+                return result
+            await anyio.sleep(
+                self._next_wait_interval(
+                    waiting, wait_strategy, intervals, timeout_time
+                )
+            )
+            dicts = await self._get_dicts([engine.name for engine in waiting])
+            for engine in waiting:
+                engine._update(dicts[engine.name])
+
+    async def create(
+        self,
+        name: str,
+        region: Optional[str] = None,
+        engine_type: Optional[str] = None,
+        spec: Union[InstanceType, str, None] = None,
+        scale: Optional[int] = None,
+        auto_stop: Optional[int] = None,
+        warmup: Optional[str] = None,
+        fail_if_exists: bool = True,
+    ) -> AsyncEngine:
+        """
+        Create a new engine.
+
+        Args:
+            name: An identifier that specifies the name of the engine
+            region: The AWS region in which the engine runs
+            engine_type: The engine type. GENERAL_PURPOSE or DATA_ANALYTICS
+            spec: Firebolt instance type. If not set, will default to
+                the cheapest instance.
+            scale: The number of compute instances on the engine.
+                The scale can be any int from 1 to 128.
+            auto_stop: The amount of time (in minutes)
+            after which the engine automatically stops
+            warmup: Not supported for this account
+            fail_if_exists: Fail is an engine with provided name already exists
+
+        Returns:
+            Engine with the specified settings
+        """
+        sql, parameters = self._create_sql(
+            name, region, engine_type, spec, scale, auto_stop, warmup, fail_if_exists
+        )
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(sql, parameters)
+        return await self.get(name)
+
+    async def attach_to_database(
+        self, engine: Union[AsyncEngine, str], database: Union[AsyncDatabase, str]
+    ) -> None:
+        engine_name = engine.name if isinstance(engine, AsyncEngine) else engine
+        database_name = (
+            database.name if isinstance(database, AsyncDatabase) else database
+        )
+        connection = await self._get_connection()
+        async with connection.cursor() as c:
+            await c.execute(self.ATTACH_TO_DB_SQL.format(engine_name, database_name))
+        if isinstance(engine, AsyncEngine):
+            engine._database_name = database_name
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Iterator
 
 
 class EngineStatus(Enum):
@@ -22,3 +23,37 @@ class EngineStatus(Enum):
 
     def __str__(self) -> str:
         return self.value
+
+
+@dataclass(frozen=True)
+class WaitStrategy:
+    """
+    Polling schedule used while waiting for engines to finish starting
+    or stopping.
+
+    Attributes:
+        initial_interval: Seconds to wait before the first status check
+        backoff: Factor the interval is multiplied by after every check
+        max_interval: Upper bound for the interval, in seconds
+        timeout: Seconds after which waiting fails with a TimeoutError
+    """
+
+    initial_interval: float = 5
+    backoff: float = 1.5
+    max_interval: float = 30
+    timeout: float = 3600
+
+    def __post_init__(self) -> None:
+        if self.initial_interval <= 0 or self.timeout <= 0:
+            raise ValueError("initial_interval and timeout must be positive")
+        if self.backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if self.max_interval < self.initial_interval:
+            raise ValueError("max_interval must not be less than initial_interval")
+
+    def intervals(self) -> Iterator[float]:
+        """Yield the seconds to wait before each status check."""
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_interval)
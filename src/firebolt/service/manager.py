@@ -1,12 +1,17 @@
 import logging
-from typing import Optional
+from types import TracebackType
+from typing import Optional, Type
 
+import anyio
 from httpx import Timeout
 
+from firebolt.async_db import Connection as AsyncConnection
+from firebolt.async_db import connect as async_connect
 from firebolt.client import (
     DEFAULT_API_URL,
     ClientV1,
     ClientV2,
+    TransportOptions,
     log_request,
     log_response,
     raise_on_4xx_5xx,
@@ -20,7 +25,9 @@ from firebolt.service.V1.database import DatabaseService as DatabaseServiceV1
 from firebolt.service.V1.engine import EngineService as EngineServiceV1
 from firebolt.service.V1.provider import get_provider_id
 from firebolt.service.V1.region import RegionService
+from firebolt.service.V2.database import AsyncDatabaseService
 from firebolt.service.V2.database import DatabaseService as DatabaseServiceV2
+from firebolt.service.V2.engine import AsyncEngineService
 from firebolt.service.V2.engine import EngineService as EngineServiceV2
 from firebolt.service.V2.instance_type import InstanceTypeService
 from firebolt.utils.util import fix_url_schema
@@ -47,12 +54,16 @@ class ResourceManager:
     Also provides listings of:
 
     - instance types (AWS instance types which engines can use)
+
+    ``transport_options`` configure the connection pool and socket settings of
+    the API client and of the connections created by the manager.
     """
 
     __slots__ = (
         "account_name",
         "account_id",
         "api_endpoint",
+        "transport_options",
         "_client",
         "_connection",
         "regions",
@@ -74,6 +85,7 @@ class ResourceManager:
         api_endpoint: str = DEFAULT_API_URL,
         # Legacy parameters
         default_region: Optional[str] = None,
+        transport_options: Optional[TransportOptions] = None,
     ):
         if settings:
             logger.warning(SETTINGS_DEPRECATION_MESSAGE)
@@ -113,6 +125,7 @@ class ResourceManager:
                 "request": [log_request],
                 "response": [raise_on_4xx_5xx, log_response],
             },
+            transport_options=transport_options,
         )
         # V1 does not use a DB connection
         if version != 1:
@@ -120,11 +133,13 @@ class ResourceManager:
                 auth=auth,
                 account_name=account_name,
                 api_endpoint=api_endpoint,
+                transport_options=transport_options,
             )
         else:
             self._connection = None  # type: ignore
         self.account_name = account_name
         self.api_endpoint = api_endpoint
+        self.transport_options = transport_options
         self.account_id = self._client.account_id
         self.default_region = default_region
         self.provider_id: Optional[str] = None
@@ -162,3 +177,88 @@ class ResourceManager:
             self._client.close()
         if hasattr(self, "_connection") and self._connection is not None:
             self._connection.close()
+
+
+class AsyncResourceManager:
+    """
+    Async ResourceManager to access Firebolt databases and engines.
+
+    Service and model methods are coroutines, so operations on many
+    databases and engines can run concurrently in one event loop. Only
+    accounts v2 are supported.
+
+    The system engine connection is opened on first use. Close it with
+    :py:meth:`aclose`, or use the manager as an async context manager.
+    """
+
+    __slots__ = (
+        "account_name",
+        "api_endpoint",
+        "transport_options",
+        "instance_types",
+        "databases",
+        "engines",
+        "_auth",
+        "_connection",
+        "_connection_lock",
+    )
+
+    def __init__(
+        self,
+        auth: Optional[Auth] = None,
+        account_name: Optional[str] = None,
+        api_endpoint: str = DEFAULT_API_URL,
+        transport_options: Optional[TransportOptions] = None,
+    ):
+        for param, name in ((auth, "auth"), (account_name, "account_name")):
+            if not param:
+                raise ValueError(f"Missing {name} value")
+
+        # type checks
+        assert auth is not None
+
+        version = auth.get_firebolt_version()
+        if version != FireboltAuthVersion.V2:
+            raise ValueError(f"Unsupported Firebolt version: {version}")
+
+        self._auth = auth
+        self.account_name = account_name
+        self.api_endpoint = api_endpoint
+        self.transport_options = transport_options
+        self._connection: Optional[AsyncConnection] = None
+        self._connection_lock = anyio.Lock()
+
+        self.instance_types = InstanceTypeService(
+            resource_manager=self  # type: ignore[arg-type]
+        )
+        self.databases = AsyncDatabaseService(resource_manager=self)
+        self.engines = AsyncEngineService(resource_manager=self)
+
+    async def _get_connection(self) -> AsyncConnection:
+        if self._connection is None:
+            async with self._connection_lock:
+                if self._connection is None:
+                    self._connection = await async_connect(
+                        auth=self._auth,
+                        account_name=self.account_name,
+                        api_endpoint=self.api_endpoint,
+                        transport_options=self.transport_options,
+                    )
+        return self._connection
+
+    async def aclose(self) -> None:
+        """Close the system engine connection."""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.aclose()
+
+    async def __aenter__(self) -> "AsyncResourceManager":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
@@ -1,7 +1,10 @@
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from threading import Lock
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -14,8 +17,14 @@ from typing import (
 
 T = TypeVar("T")
 
+if TYPE_CHECKING:
+    from firebolt.utils.cache_storage import ConnectionInfoFileStorage
+
 # Cache expiry configuration
 CACHE_EXPIRY_SECONDS = 3600  # 1 hour
+# Minimal interval between removals of all expired entries
+CACHE_PURGE_INTERVAL_SECONDS = 60
+DEFAULT_CACHE_MAX_SIZE = 4096
 
 
 class ReprCacheable(Protocol):
@@ -59,15 +68,46 @@ def noop_if_disabled(func: Callable) -> Callable:
     return wrapper
 
 
+class _CacheEntry(Generic[T]):
+    __slots__ = ("value", "expiry_time")
+
+    def __init__(self, value: T, expiry_time: Optional[int]):
+        self.value = value
+        self.expiry_time = expiry_time
+
+
 class UtilCache(Generic[T]):
     """
     Generic cache implementation to store key-value pairs.
     Created to abstract the cache implementation in case we find a better
     solution in the future.
+
+    The cache holds at most `max_size` entries, evicting the least recently
+    used ones. Reads don't take a lock, writes are serialized. Expired entries
+    are removed when read and periodically during writes. Hit, miss and
+    eviction counters are kept for monitoring; they are approximate when the
+    cache is read from many threads at once.
+
+    An optional persistent storage extends the cache beyond the process
+    lifetime: values are written through to it and read from it on a miss.
+
+    Args:
+        cache_name (str): Name of the cache, used in the environment variable
+            disabling it
+        max_size (int): Maximum number of entries
     """
 
-    def __init__(self, cache_name: str = "") -> None:
-        self._cache: Dict[str, T] = {}
+    def __init__(
+        self, cache_name: str = "", max_size: int = DEFAULT_CACHE_MAX_SIZE
+    ) -> None:
+        self._cache: OrderedDict[str, _CacheEntry[T]] = OrderedDict()
+        self._lock = Lock()
+        self._storage: Optional["ConnectionInfoFileStorage"] = None
+        self._next_purge = 0.0
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         # Allow disabling cache if we have no direct access to the constructor
         self.disabled = os.getenv("FIREBOLT_SDK_DISABLE_CACHE", False) or os.getenv(
             f"FIREBOLT_SDK_DISABLE_CACHE_${cache_name}", False
@@ -79,26 +119,38 @@ class UtilCache(Generic[T]):
     def enable(self) -> None:
         self.disabled = False
 
+    def set_storage(self, storage: Optional["ConnectionInfoFileStorage"]) -> None:
+        """Set persistent storage for the cache, None to keep it in memory only."""
+        self._storage = storage
+
     def get(self, key: ReprCacheable) -> Optional[T]:
         if self.disabled:
             return None
         s_key = self.create_key(key)
-        value = self._cache.get(s_key)
-
-        if value is not None and self._is_expired(value):
-            # Cache miss due to expiry - delete the expired item
-            del self._cache[s_key]
-            return None
-
-        return value
-
-    def _is_expired(self, value: T) -> bool:
-        """Check if a cached value has expired."""
-        # Only check expiry for ConnectionInfo objects that have expiry_time
-        if hasattr(value, "expiry_time") and value.expiry_time is not None:
-            current_time = int(time.time())
-            return current_time >= value.expiry_time
-        return False
+        entry = self._cache.get(s_key)
+
+        if entry is not None:
+            if entry.expiry_time is not None and time.time() >= entry.expiry_time:
+                # Cache miss due to expiry - delete the expired item
+                self._remove_entry(s_key, entry)
+            else:
+                try:
+                    # A single atomic operation, safe without a lock
+                    self._cache.move_to_end(s_key)
+                except KeyError:
+                    # Removed by another thread meanwhile
+                    pass
+                self.hits += 1
+                return entry.value
+
+        self.misses += 1
+        if self._storage and isinstance(key, SecureCacheKey):
+            # Storage only holds values that are not expired
+            value = self._storage.load(key)
+            if value is not None:
+                self._store(s_key, value)  # type: ignore[arg-type]
+                return value  # type: ignore[return-value]
+        return None
 
     @noop_if_disabled
     def set(self, key: ReprCacheable, value: T) -> None:
@@ -108,18 +160,53 @@ class UtilCache(Generic[T]):
                 current_time = int(time.time())
                 value.expiry_time = current_time + CACHE_EXPIRY_SECONDS
 
-            s_key = self.create_key(key)
-            self._cache[s_key] = value
+            self._store(self.create_key(key), value)
+            if self._storage and isinstance(key, SecureCacheKey):
+                self._storage.save(key, value)  # type: ignore[arg-type]
+
+    def _store(self, s_key: str, value: T) -> None:
+        entry = _CacheEntry(value, getattr(value, "expiry_time", None))
+        with self._lock:
+            self._cache[s_key] = entry
+            self._cache.move_to_end(s_key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+            now = time.time()
+            if now >= self._next_purge:
+                self._purge_expired(now)
+                self._next_purge = now + CACHE_PURGE_INTERVAL_SECONDS
+
+    def _purge_expired(self, now: float) -> None:
+        """Remove all expired entries. Must be called with the lock held."""
+        expired = [
+            s_key
+            for s_key, entry in list(self._cache.items())
+            if entry.expiry_time is not None and now >= entry.expiry_time
+        ]
+        for s_key in expired:
+            del self._cache[s_key]
+
+    def _remove_entry(self, s_key: str, entry: _CacheEntry[T]) -> None:
+        """Remove an entry, unless it has been replaced by another thread."""
+        with self._lock:
+            if self._cache.get(s_key) is entry:
+                del self._cache[s_key]
 
     @noop_if_disabled
     def delete(self, key: ReprCacheable) -> None:
         s_key = self.create_key(key)
-        if s_key in self._cache:
-            del self._cache[s_key]
+        with self._lock:
+            self._cache.pop(s_key, None)
+        if self._storage and isinstance(key, SecureCacheKey):
+            self._storage.delete(key)
 
     @noop_if_disabled
     def clear(self) -> None:
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+        if self._storage:
+            self._storage.clear()
 
     def create_key(self, obj: ReprCacheable) -> str:
         return repr(obj)
@@ -130,6 +217,9 @@ class UtilCache(Generic[T]):
             return False
         return key in self._cache
 
+    def __len__(self) -> int:
+        return len(self._cache)
+
 
 class SecureCacheKey(ReprCacheable):
     """A secure cache key that can be used for caching sensitive information."""
@@ -151,3 +241,27 @@ class SecureCacheKey(ReprCacheable):
 
 
 _firebolt_cache = UtilCache[ConnectionInfo](cache_name="connection_info")
+
+
+def enable_persistent_cache(directory: Optional[str] = None) -> None:
+    """Persist connection information on disk, to be reused by other processes.
+
+    Records are encrypted with a key derived from the credentials. Can also be
+    enabled with the FIREBOLT_SDK_PERSISTENT_CACHE environment variable.
+
+    Args:
+        directory (Optional[str]): Directory to store records in,
+            defaults to a directory inside the user data directory
+    """
+    from firebolt.utils.cache_storage import ConnectionInfoFileStorage
+
+    _firebolt_cache.set_storage(ConnectionInfoFileStorage(directory))
+
+
+def disable_persistent_cache() -> None:
+    """Keep connection information in process memory only."""
+    _firebolt_cache.set_storage(None)
+
+
+if os.getenv("FIREBOLT_SDK_PERSISTENT_CACHE", False):
+    enable_persistent_cache(os.getenv("FIREBOLT_SDK_PERSISTENT_CACHE_DIR"))
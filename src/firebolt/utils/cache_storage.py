@@ -0,0 +1,199 @@
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict
+from hashlib import sha256
+from hmac import new as hmac_new
+from json import JSONDecodeError
+from json import dumps as json_dumps
+from json import loads as json_loads
+from time import time
+from typing import Any, Dict, Iterator, Optional
+
+from appdirs import user_data_dir
+
+from firebolt.utils.cache import (
+    ConnectionInfo,
+    DatabaseInfo,
+    EngineInfo,
+    SecureCacheKey,
+)
+from firebolt.utils.token_storage import APPNAME, generate_salt, get_encrypter
+from firebolt.utils.util import write_atomic
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "connection_cache"
+# Random value, unique to a cache directory, that record file names are keyed with
+SALT_FILE_NAME = "salt"
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """Hold an exclusive lock on a file, shared with other processes."""
+    with open(lock_path, "a+") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _serialize(info: ConnectionInfo) -> str:
+    return json_dumps(asdict(info))
+
+
+def _deserialize(data: str) -> ConnectionInfo:
+    raw = json_loads(data)
+    system_engine = raw.get("system_engine")
+    return ConnectionInfo(
+        id=raw["id"],
+        expiry_time=raw.get("expiry_time"),
+        system_engine=EngineInfo(**system_engine) if system_engine else None,
+        databases={
+            name: DatabaseInfo(**value)
+            for name, value in raw.get("databases", {}).items()
+        },
+        engines={
+            name: EngineInfo(**value) for name, value in raw.get("engines", {}).items()
+        },
+    )
+
+
+class ConnectionInfoFileStorage:
+    """Encrypted file system storage for connection information.
+
+    Allows processes on the same machine to reuse resolved system engine,
+    database and engine information. Each record is stored in a separate file,
+    encrypted with a key derived from the credentials it belongs to, and named
+    after a hash of them keyed with a random salt of the cache directory.
+    Writes are serialized with a file lock and files are replaced atomically,
+    so readers never see a partially written record.
+
+    Storage errors, e.g. on a read-only file system, are logged and ignored.
+
+    Args:
+        directory (Optional[str]): Directory to store records in,
+            defaults to a directory inside the user data directory
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = directory or os.path.join(
+            user_data_dir(appname=APPNAME), CACHE_DIR_NAME
+        )
+        self._salt: Optional[bytes] = None
+
+    def _get_salt(self, create: bool) -> Optional[bytes]:
+        """Read the salt of the cache directory, creating it if requested."""
+        if self._salt is None:
+            path = os.path.join(self._directory, SALT_FILE_NAME)
+            salt = self._read_salt(path)
+            if salt is None and create:
+                with _file_lock(f"{path}.lock"):
+                    salt = self._read_salt(path)
+                    if salt is None:
+                        salt = generate_salt()
+                        write_atomic(self._directory, path, salt)
+            self._salt = salt.encode("ascii") if salt else None
+        return self._salt
+
+    @staticmethod
+    def _read_salt(path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _file_path(self, key: SecureCacheKey, create: bool = False) -> Optional[str]:
+        """Path of a record file, None if the directory has no salt yet."""
+        salt = self._get_salt(create)
+        if salt is None:
+            return None
+        name = hmac_new(salt, key.key.encode("utf-8"), sha256).hexdigest()
+        return os.path.join(self._directory, f"{name}.json")
+
+    def _read_file(self, path: str) -> Dict[str, Any]:
+        try:
+            with open(path) as f:
+                return json_loads(f.read())
+        except (OSError, JSONDecodeError):
+            return {}
+
+    def load(self, key: SecureCacheKey) -> Optional[ConnectionInfo]:
+        """Read a record, None if it's missing, expired or can't be decrypted."""
+        path = self._file_path(key)
+        if path is None:
+            return None
+        content = self._read_file(path)
+        if "data" not in content or "salt" not in content:
+            return None
+        data = get_encrypter(content["salt"], key.key, key.encryption_key).decrypt(
+            content["data"]
+        )
+        if data is None:
+            return None
+        try:
+            info = _deserialize(data)
+        except (JSONDecodeError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring invalid connection cache record: {e}")
+            return None
+        if info.expiry_time is not None and info.expiry_time <= int(time()):
+            self.delete(key)
+            return None
+        return info
+
+    def save(self, key: SecureCacheKey, info: ConnectionInfo) -> None:
+        """Encrypt and store a record, replacing the previous one."""
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            path = self._file_path(key, create=True)
+            assert path is not None
+            with _file_lock(f"{path}.lock"):
+                salt = self._read_file(path).get("salt") or generate_salt()
+                data = get_encrypter(salt, key.key, key.encryption_key).encrypt(
+                    _serialize(info)
+                )
+                write_atomic(
+                    self._directory, path, json_dumps({"salt": salt, "data": data})
+                )
+        except OSError as e:
+            logger.debug(f"Failed to store connection cache record: {e}")
+
+    def delete(self, key: SecureCacheKey) -> None:
+        """Remove a record if it exists."""
+        path = self._file_path(key)
+        if path is None:
+            return
+        try:
+            with _file_lock(f"{path}.lock"):
+                os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all records."""
+        try:
+            names = os.listdir(self._directory)
+        except OSError:
+            return
+        for name in names:
+            # Keep the salt, other processes may still be using it
+            if name.startswith(SALT_FILE_NAME):
+                continue
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except OSError:
+                pass
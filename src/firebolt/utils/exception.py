@@ -125,6 +125,14 @@ class ConnectionClosedError(ConnectionError):
     """Connection operations are unavailable since it's closed."""
 
 
+class PoolClosedError(ConnectionClosedError):
+    """Connection pool operations are unavailable since it's closed."""
+
+
+class PoolTimeoutError(ConnectionError, TimeoutError):
+    """No connection became available in the pool within the checkout timeout."""
+
+
 class CursorError(FireboltError):
     """Base class for cursor related errors."""
 
@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 from ssl import (
     PROTOCOL_TLS_CLIENT,
     Purpose,
@@ -13,13 +14,27 @@ from urllib.parse import ParseResult, urlparse
 from firebolt.utils.exception import ConfigurationError
 
 
-def get_core_certificate_context() -> Union[SSLContext, bool]:
-    """Get the SSL context for Firebolt Core connections."""
+def get_core_certificate_context(http2: bool = False) -> Union[SSLContext, bool]:
+    """Get the SSL context for Firebolt Core connections.
+
+    Loading certificates is slow, so a context is created once per process for
+    each certificate file.
+
+    Args:
+        http2 (bool): Whether the context is used for HTTP/2 connections. The
+            HTTP client sets the negotiated protocols on the context, so HTTP/1.1
+            and HTTP/2 clients don't share one.
+    """
+    return _create_core_certificate_context(os.getenv("SSL_CERT_FILE"), http2)
+
+
+@lru_cache(maxsize=None)
+def _create_core_certificate_context(
+    cert_file: Optional[str], http2: bool
+) -> Union[SSLContext, bool]:
     ctx: Union[SSLContext, bool] = True  # Default context for SSL verification
-    if os.getenv("SSL_CERT_FILE"):
-        ctx = create_default_context(
-            Purpose.SERVER_AUTH, cafile=os.getenv("SSL_CERT_FILE")
-        )
+    if cert_file:
+        ctx = create_default_context(Purpose.SERVER_AUTH, cafile=cert_file)
         ctx.minimum_version = TLSVersion.TLSv1_2
     elif sys.version_info >= (3, 10):
         # Can import truststore only if python is 3.10 or higher
@@ -0,0 +1,52 @@
+"""Lazy attributes for package modules.
+
+Package ``__init__`` modules export names that pull in heavy dependencies
+(httpx, trio, sqlparse, cryptography, pydantic). Instead of importing them
+eagerly, packages define a module ``__getattr__`` with
+:py:func:`lazy_getattr`, so the defining module is only imported on first
+access to one of its names.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable
+
+
+def lazy_getattr(module_name: str, attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """Create a module ``__getattr__`` importing attributes on first access.
+
+    Args:
+        module_name (str): Name of the module exporting the attributes
+        attributes (Dict[str, str]): Attribute name to the name of the module
+            that defines it
+
+    Returns:
+        Callable[[str], Any]: Module ``__getattr__`` function
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(import_module(source), name)
+        # Store the attribute, so __getattr__ isn't called for it again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+def lazy_attributes(module: str, names: Iterable[str]) -> Dict[str, str]:
+    """Map each of the names to the module that defines it.
+
+    Args:
+        module (str): Name of the module that defines the attributes
+        names (Iterable[str]): Attribute names
+
+    Returns:
+        Dict[str, str]: Attribute name to module name
+    """
+    return {name: module for name in names}
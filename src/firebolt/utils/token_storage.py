@@ -1,11 +1,13 @@
 from base64 import b64decode, b64encode, urlsafe_b64encode
+from collections import OrderedDict
 from hashlib import sha256
 from json import JSONDecodeError
-from json import dump as json_dump
+from json import dumps as json_dumps
 from json import load as json_load
-from os import makedirs, path, urandom
+from os import makedirs, path, stat, urandom
+from threading import Lock
 from time import time
-from typing import Optional
+from typing import Dict, NamedTuple, Optional, Tuple
 
 from appdirs import user_data_dir
 from cryptography.fernet import Fernet, InvalidToken
@@ -15,7 +17,10 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import (
     PBKDF2HMAC,  # type: ignore
 )
 
+from firebolt.utils.util import write_atomic
+
 APPNAME = "firebolt"
+ENCRYPTER_CACHE_SIZE = 128
 
 
 def generate_salt() -> str:
@@ -46,10 +51,62 @@ def generate_file_name(username: str, password: str) -> str:
     return f"{username_hash}{password_hash}.json"
 
 
+class _TokenFile(NamedTuple):
+    """Decrypted contents of a token file, as of its last read or write."""
+
+    signature: Optional[Tuple[int, int, int]]
+    salt: str
+    token: Optional[str]
+    expiration: Optional[int]
+
+
+# Derived keys and decrypted token files are shared by all storages in the
+# process, so key derivation and file reads only happen once per credentials
+_cache_lock = Lock()
+_encrypters: "OrderedDict[Tuple[str, str], FernetEncrypter]" = OrderedDict()
+_token_files: Dict[str, _TokenFile] = {}
+
+
+def get_encrypter(salt: str, username: str, password: str) -> "FernetEncrypter":
+    """Get an encrypter for the credentials, reusing previously derived keys.
+
+    Args:
+        salt (str): Salt value for encryption
+        username (str): Username for key
+        password (str): Password for key
+
+    Returns:
+        FernetEncrypter: Encrypter
+    """
+    key = (salt, sha256(f"{username}{password}".encode("utf-8")).hexdigest())
+    with _cache_lock:
+        encrypter = _encrypters.get(key)
+        if encrypter is not None:
+            _encrypters.move_to_end(key)
+    if encrypter is None:
+        encrypter = FernetEncrypter(salt, username, password)
+        with _cache_lock:
+            encrypter = _encrypters.setdefault(key, encrypter)
+            # Keep only the most recently used keys
+            while len(_encrypters) > ENCRYPTER_CACHE_SIZE:
+                _encrypters.popitem(last=False)
+    return encrypter
+
+
+def _file_signature(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Identify the file version, None if the file doesn't exist."""
+    try:
+        st = stat(file_path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
 class TokenSecureStorage:
     """File system storage for token.
 
-    Token is encrypted using username and password.
+    Token is encrypted using username and password. Decrypted tokens are
+    kept in memory and the file is only read again if it has changed.
 
     Args:
         username (str): Username
@@ -58,23 +115,21 @@ class TokenSecureStorage:
 
     def __init__(self, username: str, password: str):
         self._data_dir = user_data_dir(appname=APPNAME)
-        makedirs(self._data_dir, exist_ok=True)
-
         self._token_file = path.join(
             self._data_dir, generate_file_name(username, password)
         )
+        self._username = username
+        self._password = password
 
-        self.salt = self._get_salt()
-        self.encrypter = FernetEncrypter(self.salt, username, password)
+    @property
+    def salt(self) -> str:
+        """Salt of the token file, generated if the file doesn't exist."""
+        return self._load().salt
 
-    def _get_salt(self) -> str:
-        """Get salt from the file if exists, or generate a new one.
-
-        Returns:
-            str: Salt
-        """
-        res = self._read_data_json()
-        return res.get("salt", generate_salt())
+    @property
+    def encrypter(self) -> "FernetEncrypter":
+        """Encrypter for the token file."""
+        return get_encrypter(self.salt, self._username, self._password)
 
     def _read_data_json(self) -> dict:
         """Read json token file.
@@ -91,6 +146,30 @@ class TokenSecureStorage:
             except JSONDecodeError:
                 return {}
 
+    def _load(self) -> _TokenFile:
+        """Get token file contents, reading the file only if it has changed.
+
+        Returns:
+            _TokenFile: Token file contents
+        """
+        signature = _file_signature(self._token_file)
+        with _cache_lock:
+            cached = _token_files.get(self._token_file)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        res = self._read_data_json() if signature is not None else {}
+        salt = res.get("salt", generate_salt())
+        token = None
+        if "token" in res:
+            token = get_encrypter(salt, self._username, self._password).decrypt(
+                res["token"]
+            )
+        loaded = _TokenFile(signature, salt, token, res.get("expiration"))
+        with _cache_lock:
+            _token_files[self._token_file] = loaded
+        return loaded
+
     def get_cached_token(self) -> Optional[str]:
         """Get decrypted token.
 
@@ -100,32 +179,46 @@ class TokenSecureStorage:
         Returns:
             Optional[str]: Decrypted token or None
         """
-        res = self._read_data_json()
-        if "token" not in res:
-            return None
+        loaded = self._load()
 
         # Ignore expired tokens
-        if "expiration" in res and res["expiration"] <= int(time()):
+        if loaded.expiration is not None and loaded.expiration <= int(time()):
             return None
 
-        return self.encrypter.decrypt(res["token"])
+        return loaded.token
 
     def cache_token(self, token: str, expiration_ts: int) -> None:
         """Encrypt and store token in file system.
 
         Expiration timestamp is also stored with token in order to later
-        be able to check if it's expired.
+        be able to check if it's expired. The file is replaced atomically,
+        and isn't written at all if it already holds the same token.
 
         Args:
             token (str): Token to store
             expiration_ts (int): Token expiration timestamp
         """
-        token = self.encrypter.encrypt(token)
+        loaded = self._load()
+        if loaded.token == token and loaded.expiration == expiration_ts:
+            return
 
-        with open(self._token_file, "w") as f:
-            json_dump(
-                {"token": token, "salt": self.salt, "expiration": expiration_ts}, f
-            )
+        encrypted = get_encrypter(loaded.salt, self._username, self._password).encrypt(
+            token
+        )
+        makedirs(self._data_dir, exist_ok=True)
+        write_atomic(
+            self._data_dir,
+            self._token_file,
+            json_dumps(
+                {"token": encrypted, "salt": loaded.salt, "expiration": expiration_ts}
+            ),
+        )
+
+        stored = _TokenFile(
+            _file_signature(self._token_file), loaded.salt, token, expiration_ts
+        )
+        with _cache_lock:
+            _token_files[self._token_file] = stored
 
 
 class FernetEncrypter:
@@ -1,11 +1,13 @@
-import inspect
 import logging
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from platform import python_version, release, system
 from sys import modules
-from typing import Dict, List, Optional, Tuple
+from types import FrameType
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from firebolt import __version__
 from firebolt.utils.cache import ConnectionInfo, ReprCacheable, _firebolt_cache
@@ -132,6 +134,67 @@ def get_sdk_properties() -> Tuple[str, str, str, str]:
     return (py_version, sdk_version, os_version, ciso)
 
 
+def _stack_locations() -> List[Tuple[str, str]]:
+    """
+    File and function names of the frames in the current call stack.
+
+    Walks the frames directly, which is much cheaper than ``inspect.stack``,
+    since source files aren't read.
+    """
+    locations = []
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        locations.append((frame.f_code.co_filename, frame.f_code.co_name))
+        frame = frame.f_back
+    return locations
+
+
+ConnectorMap = Tuple[Tuple[str, str, Path, str], ...]
+LocationMatcher = Callable[[str, str], Optional[Tuple[str, str]]]
+
+
+@lru_cache(maxsize=None)
+def _location_matcher(connector_map: ConnectorMap) -> LocationMatcher:
+    """
+    Get a function that finds the connector running the code at a stack location.
+
+    Results are cached, as the same locations show up on every call.
+    """
+
+    @lru_cache(maxsize=4096)
+    def match(filename: str, function: str) -> Optional[Tuple[str, str]]:
+        for name, func, path, version_path in connector_map:
+            if (not func or function == func) and _os_compare(Path(filename), path):
+                # Connector name and the module to get its version from
+                return name, version_path
+        return None
+
+    return match
+
+
+def _detect_in_stack(
+    locations: Iterable[Tuple[str, str]],
+    connector_map: Sequence[Tuple[str, str, Path, str]],
+) -> Dict[str, str]:
+    connectors: Dict[str, str] = {}
+    match_location = _location_matcher(tuple(connector_map))
+    for filename, function in locations:
+        try:
+            match = match_location(filename, function)
+            if match is None:
+                continue
+            name, version_path = match
+            if version_path:
+                m = import_module(version_path)
+                connectors[name] = m.__version__  # type: ignore
+            else:
+                # Some connectors don't have versions specified
+                connectors[name] = ""
+        except Exception:
+            logger.debug("Failed to extract version from %s in %s", function, filename)
+    return connectors
+
+
 def detect_connectors(
     connector_map: List[Tuple[str, str, Path, str]]
 ) -> Dict[str, str]:
@@ -139,27 +202,7 @@ def detect_connectors(
     Detect which connectors are running the code by parsing the stack.
     Exceptions are ignored since this is intended for logging only.
     """
-    connectors: Dict[str, str] = {}
-    stack = inspect.stack()
-    for f in stack:
-        try:
-            for name, func, path, version_path in connector_map:
-                if (not func or f.function == func) and _os_compare(
-                    Path(f.filename), path
-                ):
-                    if version_path:
-                        m = import_module(version_path)
-                        connectors[name] = m.__version__  # type: ignore
-                    else:
-                        # Some connectors don't have versions specified
-                        connectors[name] = ""
-                    # No need to carry on if connector is detected
-                    break
-        except Exception:
-            logger.debug(
-                "Failed to extract version from %s in %s", f.function, f.filename
-            )
-    return connectors
+    return _detect_in_stack(_stack_locations(), connector_map)
 
 
 def format_as_user_agent(
@@ -176,7 +219,22 @@ def format_as_user_agent(
     Returns:
         String of the current detected connector stack.
     """
-    py, sdk, os, ciso = get_sdk_properties()
+    return _format_user_agent(
+        tuple(drivers.items()),
+        tuple(clients.items()),
+        tuple((key, value) for key, value in additional_properties),
+        get_sdk_properties(),
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_user_agent(
+    drivers: Tuple[Tuple[str, str], ...],
+    clients: Tuple[Tuple[str, str], ...],
+    additional_properties: Tuple[Tuple[str, str], ...],
+    sdk_properties: Tuple[str, str, str, str],
+) -> str:
+    py, sdk, os, ciso = sdk_properties
     formatted_properties = "; ".join(
         [f"{key}:{value}" for key, value in (additional_properties)]
     )
@@ -184,10 +242,10 @@ def format_as_user_agent(
         formatted_properties = f"; {formatted_properties}"
     sdk_format = f"PythonSDK/{sdk} (Python {py}; {os}; {ciso}{formatted_properties})"
     driver_format = "".join(
-        [f" {connector}/{version}" for connector, version in drivers.items()]
+        [f" {connector}/{version}" for connector, version in drivers]
     )
     client_format = "".join(
-        [f"{connector}/{version} " for connector, version in clients.items()]
+        [f"{connector}/{version} " for connector, version in clients]
     )
     return client_format + sdk_format + driver_format
 
@@ -213,8 +271,9 @@ def get_user_agent_header(
     Returns:
         String representation of a user-agent tracking information
     """
-    drivers = detect_connectors(DRIVER_MAP)
-    clients = detect_connectors(CLIENT_MAP)
+    locations = _stack_locations()
+    drivers = _detect_in_stack(locations, DRIVER_MAP)
+    clients = _detect_in_stack(locations, CLIENT_MAP)
     logger.debug(
         "Detected running with drivers: %s and clients %s ", str(drivers), str(clients)
     )
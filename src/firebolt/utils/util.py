@@ -1,17 +1,22 @@
 import logging
-from functools import lru_cache
+import os
 from os import environ
+from tempfile import NamedTemporaryFile
 from time import time
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
+    Generic,
     List,
     Optional,
     Tuple,
     Type,
     TypeVar,
+    Union,
+    overload,
 )
 from urllib.parse import parse_qs, urljoin, urlparse
 
@@ -27,16 +32,67 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
-def cached_property(func: Callable[..., T]) -> T:
-    """cached_property implementation for 3.7 backward compatibility.
+class cached_property(Generic[T]):
+    """Property computed on first access and cached on the instance.
+
+    The value is stored in the instance ``__dict__``, so subsequent lookups
+    don't call the descriptor at all and the value is released together with
+    the instance. Instances of ``__slots__`` classes without a ``__dict__``
+    must declare a ``_cached_<name>`` slot to hold the value.
+
+    Unlike ``functools.cached_property`` no lock is taken, so concurrent first
+    accesses may compute the value more than once.
 
     Args:
         func (Callable): Property getter
-
-    Returns:
-        T: Property of type, returned by getter
     """
-    return property(lru_cache()(func))  # type: ignore
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.name = func.__name__
+        self.slot = f"_cached_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.slot = f"_cached_{name}"
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> "cached_property[T]":
+        ...  # pragma: no cover
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T:
+        ...  # pragma: no cover
+
+    def __get__(
+        self, instance: Optional[object], owner: Optional[type] = None
+    ) -> Union[T, "cached_property[T]"]:
+        if instance is None:
+            return self
+        try:
+            cache = instance.__dict__
+        except AttributeError:
+            return self._get_slot(instance)
+        value = cache[self.name] = self.func(instance)
+        return value
+
+    def _get_slot(self, instance: object) -> T:
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            pass
+        value = self.func(instance)
+        try:
+            setattr(instance, self.slot, value)
+        except AttributeError:
+            raise TypeError(
+                f"{type(instance).__name__} has no __dict__ or {self.slot} slot "
+                f"to cache {self.name}"
+            ) from None
+        return value
 
 
 def prune_dict(d: dict) -> dict:
@@ -77,6 +133,29 @@ def mixin_for(baseclass: Type[TMix]) -> Type[TMix]:
     return object
 
 
+def write_atomic(directory: str, path: str, content: str) -> None:
+    """Write a file through a temporary one, so it's replaced atomically.
+
+    The temporary file is removed if writing or replacing fails.
+
+    Args:
+        directory (str): Directory to create the temporary file in
+        path (str): Path of the file to write
+        content (str): File content
+    """
+    f = NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False)
+    try:
+        with f:
+            f.write(content)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except OSError:
+            pass
+        raise
+
+
 def fix_url_schema(url: str) -> str:
     """Add schema to URL if it's missing.
 
@@ -0,0 +1,145 @@
+"""Benchmarks for client-side formatting of bulk insert parameters.
+
+Run explicitly with ``pytest -s tests/benchmarks``.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from time import perf_counter
+from typing import Iterator, List, Sequence
+
+from pytest import fixture, importorskip
+from sqlparse import parse
+
+from firebolt.common._types import ParameterType
+from firebolt.common.cursor.bulk_load import iter_bulk_batches
+from firebolt.common.cursor.columnar import (
+    ArrowTableSource,
+    iter_columnar_batches,
+)
+from firebolt.common.cursor.statement_planners import QmarkStatementPlanner
+from firebolt.common.statement_formatter import (
+    StatementFormatter,
+    create_statement_formatter,
+)
+
+ROW_COUNT = 1_000_000
+DISTINCT_ROWS = 1_000
+QUERY = "INSERT INTO t VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+@fixture
+def formatter() -> StatementFormatter:
+    return create_statement_formatter(version=2)
+
+
+@fixture(scope="module")
+def sample_rows() -> List[Sequence[ParameterType]]:
+    start = datetime(2024, 1, 1)
+    return [
+        (
+            i,
+            i * 0.5,
+            f"name '{i}'\0",
+            i % 2 == 0,
+            start + timedelta(seconds=i),
+            start.date() + timedelta(days=i),
+            i.to_bytes(4, "big"),
+            None if i % 10 == 0 else Decimal(i) / 100,
+        )
+        for i in range(DISTINCT_ROWS)
+    ]
+
+
+def _rows(
+    sample_rows: List[Sequence[ParameterType]], count: int
+) -> Iterator[Sequence[ParameterType]]:
+    for i in range(count):
+        yield sample_rows[i % DISTINCT_ROWS]
+
+
+def _report(name: str, rows: int, elapsed: float) -> None:
+    print(f"\n{name}: {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)")
+
+
+def test_bulk_rows_formatting(
+    formatter: StatementFormatter, sample_rows: List[Sequence[ParameterType]]
+) -> None:
+    """Format 1M mixed-type rows into bulk insert batches."""
+    builder = QmarkStatementPlanner(formatter).create_bulk_batch_builder(QUERY)
+
+    start = perf_counter()
+    loaded = sum(
+        batch.row_count
+        for batch in iter_bulk_batches(
+            builder, _rows(sample_rows, ROW_COUNT), 10_000, 16 * 1024 * 1024
+        )
+    )
+    elapsed = perf_counter() - start
+
+    assert loaded == ROW_COUNT
+    _report("load_rows formatting", ROW_COUNT, elapsed)
+
+
+def test_bulk_rows_formatting_speedup(
+    formatter: StatementFormatter, sample_rows: List[Sequence[ParameterType]]
+) -> None:
+    """Compare compiled per-column formatters to per-value formatting."""
+    count = 20_000
+    statement = parse(QUERY)[0]
+
+    start = perf_counter()
+    expected = [
+        formatter.format_statement(statement, row) for row in _rows(sample_rows, count)
+    ]
+    baseline = perf_counter() - start
+
+    template = formatter.compile_statement(statement)
+    start = perf_counter()
+    formatted = [template.format_row(row) for row in _rows(sample_rows, count)]
+    compiled = perf_counter() - start
+
+    assert formatted == expected
+    _report("format_statement", count, baseline)
+    _report("compiled statement", count, compiled)
+    # Timings are only reported, they vary too much between machines to gate on
+    print(f"compiled statement speedup: {baseline / compiled:.1f}x")
+
+
+def test_arrow_formatting(
+    formatter: StatementFormatter, sample_rows: List[Sequence[ParameterType]]
+) -> None:
+    """Format a 1M-row mixed-type Arrow table into insert batches."""
+    pa = importorskip("pyarrow")
+    columns = list(zip(*_rows(sample_rows, ROW_COUNT)))
+    table = pa.table(
+        {
+            name: pa.array(values, type=type_)
+            for name, values, type_ in zip(
+                "abcdefgh",
+                columns,
+                [
+                    pa.int64(),
+                    pa.float64(),
+                    pa.string(),
+                    pa.bool_(),
+                    pa.timestamp("s"),
+                    pa.date32(),
+                    pa.binary(),
+                    pa.decimal128(12, 2),
+                ],
+            )
+        }
+    )
+
+    start = perf_counter()
+    loaded = sum(
+        batch.row_count
+        for batch in iter_columnar_batches(
+            "t", ArrowTableSource(table), formatter, 10_000, 16 * 1024 * 1024
+        )
+    )
+    elapsed = perf_counter() - start
+
+    assert loaded == ROW_COUNT
+    _report("insert_arrow formatting", ROW_COUNT, elapsed)
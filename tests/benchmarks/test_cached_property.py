@@ -0,0 +1,45 @@
+"""Benchmark for cached property access.
+
+Run explicitly with ``pytest -s tests/benchmarks``.
+"""
+
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable
+
+from firebolt.utils.util import cached_property
+
+ACCESSES = 1_000_000
+
+
+def _lru_cached_property(func: Callable) -> Any:
+    # Previous implementation, shared cache keyed by instance
+    return property(lru_cache()(func))
+
+
+class _Instance:
+    @cached_property
+    def value(self) -> int:
+        return 1
+
+    @_lru_cached_property
+    def lru_value(self) -> int:
+        return 1
+
+
+def _access_time(instance: _Instance, name: str) -> float:
+    start = perf_counter()
+    for _ in range(ACCESSES):
+        getattr(instance, name)
+    return perf_counter() - start
+
+
+def test_cached_property_access() -> None:
+    instance = _Instance()
+    cached = _access_time(instance, "value")
+    lru = _access_time(instance, "lru_value")
+    print(
+        f"\n{ACCESSES} accesses: cached_property {cached:.3f}s, "
+        f"lru_cache property {lru:.3f}s"
+    )
+    assert cached < lru
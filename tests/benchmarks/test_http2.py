@@ -0,0 +1,243 @@
+"""Benchmarks for concurrent queries over HTTP/1.1 and HTTP/2.
+
+A local TLS server answers every query after a fixed delay, the way an engine
+would, and counts the TCP connections opened by the client.
+
+Run explicitly with ``pytest -s tests/benchmarks``.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from ipaddress import ip_address
+from json import dumps
+from pathlib import Path
+from ssl import Purpose, create_default_context
+from threading import Event, Thread
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
+
+import h11
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import DataReceived, RequestReceived, StreamEnded
+from pytest import MonkeyPatch, fixture, mark
+from trio import open_nursery
+
+from firebolt.async_db import connect
+from firebolt.client.auth import FireboltCore
+
+QUERY_COUNT = 200
+QUERY_DELAY = 0.05
+RESPONSE = dumps(
+    {
+        "meta": [{"name": "one", "type": "int"}],
+        "data": [[1]],
+        "rows": 1,
+        "statistics": {"elapsed": QUERY_DELAY, "rows_read": 1, "bytes_read": 1},
+    }
+).encode()
+RESPONSE_HEADERS = [
+    ("content-type", "application/json"),
+    ("content-length", str(len(RESPONSE))),
+]
+
+
+def _create_certificate(directory: Path) -> Tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.DNSName("localhost"), x509.IPAddress(ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+class _QueryProtocol(asyncio.Protocol):
+    """Answers each request after a delay, over HTTP/2 or HTTP/1.1."""
+
+    def __init__(self, server: "_QueryServer"):
+        self._server = server
+        self._transport: Optional[asyncio.Transport] = None
+        self._h2: Optional[H2Connection] = None
+        self._h11: Optional[h11.Connection] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        self._server.connections += 1
+        ssl_object = transport.get_extra_info("ssl_object")
+        if ssl_object.selected_alpn_protocol() == "h2":
+            self._h2 = H2Connection(H2Configuration(client_side=False))
+            self._h2.initiate_connection()
+            self._flush()
+        else:
+            self._h11 = h11.Connection(h11.SERVER)
+
+    def data_received(self, data: bytes) -> None:
+        if self._h2 is not None:
+            for event in self._h2.receive_data(data):
+                if isinstance(event, DataReceived):
+                    self._h2.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, StreamEnded):
+                    asyncio.ensure_future(self._respond_h2(event.stream_id))
+                elif isinstance(event, RequestReceived):
+                    self._server.requests += 1
+            self._flush()
+            return
+
+        assert self._h11 is not None
+        self._h11.receive_data(data)
+        self._handle_h11_events()
+
+    def _handle_h11_events(self) -> None:
+        assert self._h11 is not None
+        while True:
+            event = self._h11.next_event()
+            if isinstance(event, h11.Request):
+                self._server.requests += 1
+            elif isinstance(event, h11.Data):
+                continue
+            else:
+                if isinstance(event, h11.EndOfMessage):
+                    asyncio.ensure_future(self._respond_h11())
+                # Need more data, wait for the response or connection closed
+                return
+
+    async def _respond_h2(self, stream_id: int) -> None:
+        await asyncio.sleep(QUERY_DELAY)
+        assert self._h2 is not None
+        self._h2.send_headers(stream_id, [(":status", "200"), *RESPONSE_HEADERS])
+        self._h2.send_data(stream_id, RESPONSE, end_stream=True)
+        self._flush()
+
+    async def _respond_h11(self) -> None:
+        await asyncio.sleep(QUERY_DELAY)
+        assert self._h11 is not None and self._transport is not None
+        for event in (
+            h11.Response(status_code=200, headers=RESPONSE_HEADERS),
+            h11.Data(data=RESPONSE),
+            h11.EndOfMessage(),
+        ):
+            self._transport.write(self._h11.send(event))
+        self._h11.start_next_cycle()
+        # Process a request that arrived before the response was sent
+        self._handle_h11_events()
+
+    def _flush(self) -> None:
+        assert self._h2 is not None and self._transport is not None
+        self._transport.write(self._h2.data_to_send())
+
+
+class _QueryServer:
+    def __init__(self, cert_path: Path, key_path: Path):
+        self._ssl = create_default_context(Purpose.CLIENT_AUTH)
+        self._ssl.load_cert_chain(cert_path, key_path)
+        self._ssl.set_alpn_protocols(["h2", "http/1.1"])
+        self._loop = asyncio.new_event_loop()
+        self._started = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+        self.port = 0
+        self.connections = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"https://localhost:{self.port}"
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.requests = 0
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            self._loop.create_server(
+                lambda: _QueryProtocol(self), "127.0.0.1", 0, ssl=self._ssl
+            )
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._started.set()
+        self._loop.run_forever()
+        server.close()
+        self._loop.run_until_complete(server.wait_closed())
+        self._loop.close()
+
+    def start(self) -> None:
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+@fixture(scope="module")
+def query_server(tmp_path_factory) -> Iterator[_QueryServer]:
+    cert_path, key_path = _create_certificate(tmp_path_factory.mktemp("h2"))
+    server = _QueryServer(cert_path, key_path)
+    server.start()
+    with MonkeyPatch.context() as mp:
+        # The client trusts the self-signed certificate of the server
+        mp.setenv("SSL_CERT_FILE", str(cert_path))
+        yield server
+    server.stop()
+
+
+@mark.parametrize("http2", [False, True], ids=["http1.1", "http2"])
+async def test_concurrent_queries(query_server: _QueryServer, http2: bool) -> None:
+    query_server.reset()
+    durations: List[float] = []
+
+    async def run_query() -> None:
+        start = perf_counter()
+        await connection.cursor().execute("SELECT 1")
+        durations.append(perf_counter() - start)
+
+    async with await connect(
+        auth=FireboltCore(), url=query_server.url, http2=http2
+    ) as connection:
+        start = perf_counter()
+        async with open_nursery() as nursery:
+            for _ in range(QUERY_COUNT):
+                nursery.start_soon(run_query)
+        elapsed = perf_counter() - start
+
+    durations.sort()
+    print(
+        f"\n{'HTTP/2' if http2 else 'HTTP/1.1'}: {QUERY_COUNT} concurrent queries "
+        f"in {elapsed:.3f}s, {query_server.connections} TCP+TLS connections, "
+        f"p50 {durations[len(durations) // 2] * 1000:.1f}ms, "
+        f"p99 {durations[int(len(durations) * 0.99)] * 1000:.1f}ms"
+    )
+    assert query_server.requests == QUERY_COUNT
+    if http2:
+        assert query_server.connections == 1
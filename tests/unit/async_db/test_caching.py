@@ -187,6 +187,14 @@ async def test_connect_db_switching_caching(
         match_content=f'USE ENGINE "{engine_name}"'.encode("utf-8"),
         is_reusable=True,
     )
+    # The engine is resolved concurrently, in the context of the second database
+    httpx_mock.add_callback(
+        use_engine_callback_counter,
+        url=f"{system_engine_no_db_query_url}&database={second_db_name}",
+        match_content=f'USE ENGINE "{engine_name}"'.encode("utf-8"),
+        is_reusable=True,
+        is_optional=True,
+    )
     httpx_mock.add_callback(
         query_callback,
         url=query_url,
@@ -2,13 +2,17 @@ from typing import Callable, Dict, Generator, List, Optional, Tuple
 from unittest.mock import ANY as AnyValue
 from unittest.mock import MagicMock, patch
 
+from anyio import Event, fail_after
+from httpx import Request
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.async_db.connection import Connection, connect
+from firebolt.async_db.cursor import CursorV2
 from firebolt.client.auth import Auth, ClientCredentials
 from firebolt.common._types import ColType
+from firebolt.common.constants import UPDATE_ENDPOINT_HEADER
 from firebolt.utils.cache import _firebolt_cache
 from firebolt.utils.exception import (
     AccountNotFoundOrNoAccessError,
@@ -17,6 +21,7 @@ from firebolt.utils.exception import (
     FireboltError,
 )
 from firebolt.utils.token_storage import TokenSecureStorage
+from tests.unit.response import Response
 
 
 @mark.skip("__slots__ is broken on Connection class")
@@ -108,6 +113,67 @@ async def test_connect(
         assert await connection.cursor().execute("select *") == len(python_query_data)
 
 
+async def test_connect_http2(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    """The http2 option is passed to the connection client."""
+    mock_connection_flow()
+
+    async with await connect(
+        engine_name=engine_name,
+        database=db_name,
+        auth=auth,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        http2=True,
+    ) as connection:
+        assert connection._client._transport._pool._http2
+
+
+async def test_connect_prewarm(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    httpx_mock: HTTPXMock,
+    mock_connection_flow: Callable,
+):
+    """prewarm opens connections to the engine in the background."""
+    mock_connection_flow()
+    warmed, head_allowed = Event(), Event()
+
+    async def head_callback(request: Request) -> Response:
+        if len(httpx_mock.get_requests(method="HEAD")) == 2:
+            warmed.set()
+        await head_allowed.wait()
+        return Response(status_code=200)
+
+    httpx_mock.add_callback(head_callback, method="HEAD", is_reusable=True)
+
+    # connect doesn't wait for the slow HEAD requests
+    with fail_after(5):
+        connection = await connect(
+            engine_name=engine_name,
+            database=db_name,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+            prewarm=2,
+        )
+    async with connection:
+        with fail_after(5):
+            await warmed.wait()
+        head_allowed.set()
+        requests = httpx_mock.get_requests(method="HEAD")
+        assert all(str(r.url).startswith(connection.engine_url) for r in requests)
+
+
 async def test_connect_database_failed(
     db_name: str,
     account_name: str,
@@ -144,6 +210,121 @@ async def test_connect_database_failed(
     httpx_mock.reset()
 
 
+async def test_connect_resolves_database_and_engine_concurrently(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    httpx_mock: HTTPXMock,
+    system_engine_no_db_query_url: str,
+    system_engine_query_url: str,
+    use_database_callback: Callable,
+    use_engine_callback: Callable,
+    mock_system_engine_connection_flow: Callable,
+):
+    """USE DATABASE and USE ENGINE are in flight at the same time."""
+    mock_system_engine_connection_flow()
+    engine_requested = Event()
+
+    async def use_database(request: Request, **kwargs) -> Response:
+        # Would time out if USE ENGINE waited for this response
+        with fail_after(5):
+            await engine_requested.wait()
+        return use_database_callback(request, **kwargs)
+
+    async def use_engine(request: Request, **kwargs) -> Response:
+        engine_requested.set()
+        return use_engine_callback(request, **kwargs)
+
+    httpx_mock.add_callback(
+        use_database,
+        url=system_engine_no_db_query_url,
+        match_content=f'USE DATABASE "{db_name}"'.encode("utf-8"),
+    )
+    httpx_mock.add_callback(
+        use_engine,
+        url=system_engine_query_url,
+        match_content=f'USE ENGINE "{engine_name}"'.encode("utf-8"),
+    )
+
+    async with await connect(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+    ) as connection:
+        cursor = connection.cursor()
+        assert cursor.database == db_name
+        assert cursor.engine_name == engine_name
+
+        timings = connection.connect_timings
+        assert timings.use_database > 0
+        assert timings.use_engine > 0
+        assert timings.total >= timings.system_engine + timings.use_database
+
+
+async def test_connect_engine_default_database(
+    account_name: str,
+    engine_name: str,
+    engine_url: str,
+    auth: Auth,
+    api_endpoint: str,
+    httpx_mock: HTTPXMock,
+    system_engine_no_db_query_url: str,
+    query_statistics: Dict,
+    mock_system_engine_connection_flow: Callable,
+):
+    """Without a database, the one returned by USE ENGINE is used."""
+    mock_system_engine_connection_flow()
+    httpx_mock.add_response(
+        url=system_engine_no_db_query_url,
+        match_content=f'USE ENGINE "{engine_name}"'.encode("utf-8"),
+        json={"meta": [], "data": [], "rows": 0, "statistics": query_statistics},
+        headers={UPDATE_ENDPOINT_HEADER: f"{engine_url}?database=engine_db"},
+    )
+
+    async with await connect(
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+    ) as connection:
+        assert connection.init_parameters["database"] == "engine_db"
+        assert connection.cursor().database == "engine_db"
+
+
+async def test_connect_stores_cache_record_once(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+    enable_cache,
+):
+    """Database and engine resolved concurrently are stored in one write."""
+    mock_connection_flow()
+    _firebolt_cache.clear()
+    set_cache_record = CursorV2.set_cache_record
+    with patch.object(
+        CursorV2, "set_cache_record", autospec=True, side_effect=set_cache_record
+    ) as cache_set:
+        async with await connect(
+            database=db_name,
+            auth=auth,
+            engine_name=engine_name,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+        ) as connection:
+            record = connection.cursor().get_cache_record()
+    assert cache_set.call_count == 1
+    assert db_name in record.databases
+    assert engine_name in record.engines
+    _firebolt_cache.clear()
+
+
 @mark.parametrize("cache_enabled", [True, False])
 async def test_connect_system_engine_caching(
     db_name: str,
@@ -7,7 +7,7 @@ from typing import Any, Callable, Dict, List
 from unittest.mock import patch
 
 from httpx import URL, HTTPStatusError, Request, StreamError, codes
-from pytest import LogCaptureFixture, mark, raises
+from pytest import LogCaptureFixture, importorskip, mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.async_db import Connection, Cursor
@@ -71,6 +71,10 @@ async def test_closed_cursor(cursor: Cursor):
         ("fetchmany", ()),
         ("fetchall", ()),
         ("nextset", ()),
+        ("load_rows", ("insert into t values (?)", [])),
+        # The file doesn't exist, closed cursor check goes first
+        ("load_csv", ("insert into t values (?)", "missing.csv")),
+        ("load_json_lines", ("insert into t values (?)", "missing.jsonl")),
     )
     methods = ("setinputsizes", "setoutputsize")
 
@@ -1938,3 +1942,245 @@ async def test_cursor_plaintext_error(
     assert "Plaintext error message" in str(
         excinfo.value
     ), "Invalid error message for plaintext error response"
+
+
+def _empty_insert_response() -> Response:
+    return Response(
+        status_code=200,
+        content=json.dumps(
+            {
+                "meta": [],
+                "data": [],
+                "rows": 0,
+                "statistics": {"elapsed": 0.0, "rows_read": 0, "bytes_read": 0},
+            }
+        ),
+    )
+
+
+async def test_cursor_load_rows(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """load_rows consumes an async generator lazily and sends it in batches."""
+    bodies = []
+
+    async def bulk_insert_callback(request: Request) -> Response:
+        assert request.headers.get("Transfer-Encoding") == "chunked"
+        bodies.append((await request.aread()).decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    async def rows():
+        for i in range(5):
+            yield (i, f"name{i}")
+
+    loaded = await cursor.load_rows("INSERT INTO t VALUES (?, ?)", rows(), batch_rows=2)
+
+    assert loaded == 5
+    assert len(bodies) == 3
+    assert bodies[0] == (
+        "INSERT INTO t VALUES (0, 'name0'); INSERT INTO t VALUES (1, 'name1')"
+    )
+    assert bodies[2] == "INSERT INTO t VALUES (4, 'name4')"
+    assert cursor._state == CursorState.DONE
+
+
+async def test_cursor_load_rows_fb_numeric(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    fb_numeric_query_url: re.Pattern,
+    fb_numeric_paramstyle,
+):
+    """fb_numeric batches are split so their parameters fit in the url."""
+    loaded_rows = []
+
+    async def bulk_insert_callback(request: Request) -> Response:
+        parameters = json.loads(request.url.params["query_parameters"])
+        assert len(str(request.url)) < 64 * 1024
+        loaded_rows.extend(p["value"] for p in parameters[::2])
+        return _empty_insert_response()
+
+    httpx_mock.add_callback(
+        bulk_insert_callback, url=fb_numeric_query_url, is_reusable=True
+    )
+
+    rows = ((i, f"name{i}") for i in range(5000))
+    assert await cursor.load_rows("INSERT INTO t VALUES ($1, $2)", rows) == 5000
+    assert loaded_rows == list(range(5000))
+    assert len(httpx_mock.get_requests()) > 1
+
+
+async def test_cursor_load_json_lines(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+    fs,
+):
+    """load_json_lines reads a local file and loads typed values."""
+    fs.create_file("/data.jsonl", contents='[1, "a"]\n{"id": 2, "name": null}\n')
+    bodies = []
+
+    async def bulk_insert_callback(request: Request) -> Response:
+        bodies.append((await request.aread()).decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern)
+
+    assert (
+        await cursor.load_json_lines("INSERT INTO t VALUES (?, ?)", "/data.jsonl") == 2
+    )
+    assert bodies == ["INSERT INTO t VALUES (1, 'a'); INSERT INTO t VALUES (2, NULL)"]
+
+
+async def test_cursor_insert_dataframe(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """insert_dataframe sends multi-row INSERT batches."""
+    pd = importorskip("pandas")
+    bodies = []
+
+    async def bulk_insert_callback(request: Request) -> Response:
+        bodies.append((await request.aread()).decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", None, "c"]})
+    assert await cursor.insert_dataframe("t", df, batch_rows=2) == 3
+    assert bodies == [
+        'INSERT INTO t ("id", "name") VALUES (1, \'a\'), (2, NULL)',
+        'INSERT INTO t ("id", "name") VALUES (3, \'c\')',
+    ]
+    assert cursor._state == CursorState.DONE
+
+
+async def test_cursor_insert_arrow_concurrent(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """insert_arrow can send several batches concurrently."""
+    pa = importorskip("pyarrow")
+    bodies, databases = [], set()
+
+    async def bulk_insert_callback(request: Request) -> Response:
+        bodies.append((await request.aread()).decode())
+        databases.add(request.url.params.get("database"))
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    cursors = list(cursor.connection._cursors)
+    table = pa.table({"x": list(range(10))})
+    assert await cursor.insert_arrow("t", table, batch_rows=3, concurrency=3) == 10
+    assert sorted(bodies) == sorted(
+        f'INSERT INTO t ("x") VALUES '
+        + ", ".join(f"({i})" for i in range(start, min(start + 3, 10)))
+        for start in range(0, 10, 3)
+    )
+    # Batches are sent through short-lived cursors sharing this one's parameters
+    assert databases == {cursor.database}
+    assert cursor.connection._cursors == cursors
+
+
+async def test_cursor_insert_arrow_error(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """A failed batch stops the insert and moves the cursor to the error state."""
+    pa = importorskip("pyarrow")
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(
+        lambda _: Response(status_code=codes.BAD_REQUEST, content=b"bad batch"),
+        url=url_pattern,
+        is_reusable=True,
+    )
+
+    with raises(HTTPStatusError):
+        await cursor.insert_arrow(
+            "t", pa.table({"x": [1, 2]}), batch_rows=1, concurrency=2
+        )
+    assert cursor._state == CursorState.ERROR
+    with raises(ConfigurationError):
+        await cursor.insert_arrow("t", pa.table({"x": [1]}), concurrency=0)
+
+
+async def test_cursor_prepare(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_callback: Callable,
+    query_url: str,
+    python_query_data: List[List[ColType]],
+):
+    """Prepared statement can be executed multiple times with new parameters."""
+    bodies = []
+
+    def prepared_query_callback(request: Request) -> Response:
+        bodies.append(request.read().decode())
+        return query_callback(request)
+
+    httpx_mock.add_callback(prepared_query_callback, url=query_url, is_reusable=True)
+
+    stmt = cursor.prepare("SELECT * FROM t WHERE id = ? AND name = ?;")
+    assert stmt.cursor is cursor
+    assert await stmt.execute([1, "a"]) == len(python_query_data)
+    assert await cursor.fetchall() == python_query_data
+    await stmt.execute((2, "it's"))
+    await stmt.executemany([[3, None], [4, "b"]])
+
+    assert bodies == [
+        "SELECT * FROM t WHERE id = 1 AND name = 'a'",
+        "SELECT * FROM t WHERE id = 2 AND name = 'it''s'",
+        "SELECT * FROM t WHERE id = 3 AND name = NULL",
+        "SELECT * FROM t WHERE id = 4 AND name = 'b'",
+    ]
+
+    with raises(DataError):
+        await stmt.execute([1])
+    assert cursor._state == CursorState.ERROR
+
+    stmt = cursor.connection.prepare("INSERT INTO t VALUES (?, ?)")
+    assert stmt.cursor is not cursor
+    await stmt.executemany([[1, "a"], [2, "b"]], bulk_insert=True)
+    assert bodies[-1] == "INSERT INTO t VALUES (1, 'a'); INSERT INTO t VALUES (2, 'b')"
+
+
+async def test_cursor_prepare_fb_numeric(
+    cursor: Cursor,
+    httpx_mock: HTTPXMock,
+    fb_numeric_query_url: re.Pattern,
+    fb_numeric_callback_factory: Callable,
+    fb_numeric_paramstyle,
+):
+    """Prepared fb_numeric statements send parameters as query_parameters."""
+    query = "SELECT * FROM t WHERE id = $1 AND name = $2"
+    stmt = cursor.prepare(query)
+    for params in ([1, "a"], [2.5, None]):
+        httpx_mock.add_callback(
+            fb_numeric_callback_factory(
+                [{"name": f"${i + 1}", "value": v} for i, v in enumerate(params)],
+                query,
+            ),
+            url=fb_numeric_query_url,
+        )
+        await stmt.execute(params)
+
+
+async def test_cursor_prepare_closed(cursor: Cursor):
+    stmt = cursor.prepare("SELECT ?")
+    await cursor.aclose()
+    assert stmt.closed
+    with raises(CursorClosedError):
+        await stmt.execute([1])
+    with raises(CursorClosedError):
+        cursor.prepare("SELECT 1")
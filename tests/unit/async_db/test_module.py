@@ -1,7 +1,34 @@
+from pytest import mark, raises
+
 import firebolt.async_db
+from firebolt.async_db.connection import connect
+from firebolt.common._types import ARRAY
+from tests.unit.util import IMPORT_TIME_BUDGET_RATIO, profile_import
 
 
 def test_has_exceptions(db_api_exceptions):
     """Verify async module has top-level dbapi exceptions exposed."""
     for ex_name, ex_class in db_api_exceptions.items():
         assert issubclass(getattr(firebolt.async_db, ex_name), ex_class)
+
+
+def test_lazy_attributes():
+    """Connection and type names are imported on first access."""
+    assert firebolt.async_db.connect is connect
+    assert firebolt.async_db.ARRAY is ARRAY
+    with raises(AttributeError):
+        firebolt.async_db.missing
+
+
+def test_all_attributes():
+    """Every name exported with a star import is available."""
+    for name in firebolt.async_db.__all__:
+        assert getattr(firebolt.async_db, name) is not None
+
+
+@mark.nofakefs
+def test_import_time():
+    """Importing the module doesn't import heavy dependencies."""
+    import_time, heavy_modules = profile_import("firebolt.async_db")
+    assert heavy_modules == []
+    assert import_time < IMPORT_TIME_BUDGET_RATIO
@@ -0,0 +1,301 @@
+from typing import Any, Awaitable, Callable, Dict, List
+
+from anyio import create_task_group, fail_after, move_on_after, sleep
+from pytest import fixture, raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.async_db import Connection, connect
+from firebolt.async_db.pool import ConnectionPool
+from firebolt.client.auth import Auth
+from firebolt.utils.exception import (
+    ConfigurationError,
+    InterfaceError,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+
+
+@fixture
+def connection_factory(
+    api_endpoint: str,
+    db_name: str,
+    auth: Auth,
+    engine_name: str,
+    account_name: str,
+    mock_connection_flow: Callable,
+) -> Callable[[], Awaitable[Connection]]:
+    mock_connection_flow()
+
+    async def factory() -> Connection:
+        return await connect(
+            engine_name=engine_name,
+            database=db_name,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+        )
+
+    return factory
+
+
+@fixture
+def connect_kwargs(
+    api_endpoint: str,
+    db_name: str,
+    auth: Auth,
+    engine_name: str,
+    account_name: str,
+    mock_connection_flow: Callable,
+) -> Dict[str, Any]:
+    mock_connection_flow()
+    return dict(
+        engine_name=engine_name,
+        database=db_name,
+        auth=auth,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+    )
+
+
+async def test_pool_reuses_connections(
+    httpx_mock: HTTPXMock,
+    connection_factory: Callable[[], Awaitable[Connection]],
+    mock_query: Callable,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+):
+    """Returned connections are reused and their state is reset."""
+    mock_query()
+    httpx_mock.add_callback(
+        select_one_query_callback, url=f"{set_query_url}&param=1", is_reusable=True
+    )
+    async with ConnectionPool(connection_factory, max_size=2) as pool:
+        async with pool.connection() as connection:
+            cursor = connection.cursor()
+            await cursor.execute("SET param=1")
+            assert cursor._set_parameters == {"param": "1"}
+        assert cursor.closed, "Cursor should be closed on release."
+
+        async with pool.connection() as connection2:
+            assert connection2 is connection
+            assert connection2.cursor()._set_parameters == {}
+            assert await connection2.cursor().execute("select * from t") == 10
+
+        metrics = pool.metrics
+        assert metrics.size == metrics.idle == 1
+        assert metrics.checkouts == 2
+        assert metrics.connections_created == 1
+
+    assert connection.closed, "Idle connections should be closed with the pool."
+    with raises(PoolClosedError):
+        await pool.acquire()
+
+
+async def test_pool_shares_transport(connect_kwargs: Dict[str, Any]):
+    """Connections use one transport, closed with the last of them."""
+    async with ConnectionPool(**connect_kwargs) as pool:
+        connection1 = await pool.acquire()
+        connection2 = await pool.acquire()
+        transport = connection1._client._transport._transport
+        assert connection2._client._transport._transport is transport
+        assert len(pool._transports) == 1
+
+        await connection1.aclose()
+        await pool.release(connection1)
+        assert len(pool._transports) == 1, "Transport is still used."
+        await connection2.aclose()
+        await pool.release(connection2)
+        assert len(pool._transports) == 0, "Unused transport should be closed."
+
+        async with pool.connection() as connection3:
+            transport3 = connection3._client._transport._transport
+            assert transport3 is not transport
+    assert len(pool._transports) == 0, "Transport should be closed with the pool."
+
+
+async def test_pool_factory_transport(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    """Connections from a custom factory keep their own transports."""
+    async with ConnectionPool(connection_factory) as pool:
+        connection1 = await pool.acquire()
+        connection2 = await pool.acquire()
+        assert connection1._client._transport is not connection2._client._transport
+        assert len(pool._transports) == 0
+        await pool.release(connection1)
+        await pool.release(connection2)
+
+
+async def test_pool_error_in_block(connect_kwargs: Dict[str, Any]):
+    """An error raised in the pool block propagates unwrapped."""
+    with raises(ValueError):
+        async with ConnectionPool(min_size=1, **connect_kwargs) as pool:
+            with fail_after(5):
+                while not pool.metrics.idle:
+                    await sleep(0.01)
+            raise ValueError("error")
+    assert pool.closed
+    assert pool.metrics.size == 0
+
+
+async def test_pool_not_open(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    pool = ConnectionPool(connection_factory)
+    with raises(InterfaceError):
+        await pool.acquire()
+    # Unused connection flow mocks
+    await (await connection_factory()).aclose()
+
+
+async def test_pool_checkout_timeout(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    async with ConnectionPool(connection_factory, max_size=1) as pool:
+        connection = await pool.acquire()
+        with raises(PoolTimeoutError):
+            await pool.acquire(timeout=0.01)
+        assert pool.metrics.checkout_timeouts == 1
+        assert pool.metrics.waiters == 0
+
+        await pool.release(connection)
+        assert await pool.acquire(timeout=0) is connection
+        await pool.release(connection)
+
+        with raises(InterfaceError):
+            await pool.release(connection)
+
+
+async def test_pool_fair_waiters(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    """Waiters get connections in the order they arrived."""
+    order: List[int] = []
+
+    async with ConnectionPool(connection_factory, max_size=1) as pool:
+        connection = await pool.acquire()
+
+        async def worker(i: int) -> None:
+            async with pool.connection():
+                order.append(i)
+                await sleep(0.01)
+
+        async with create_task_group() as tg:
+            for i in range(3):
+                tg.start_soon(worker, i)
+                await sleep(0.01)
+            assert pool.metrics.waiters == 3
+            await pool.release(connection)
+
+    assert order == [0, 1, 2]
+
+
+async def test_pool_cancelled_checkout(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    """A cancelled waiter doesn't hold up the queue or leak a connection."""
+    async with ConnectionPool(connection_factory, max_size=1) as pool:
+        connection = await pool.acquire()
+        with move_on_after(0.01):
+            await pool.acquire(timeout=None)
+        assert pool.metrics.waiters == 0
+
+        await pool.release(connection)
+        assert pool.metrics.idle == 1
+        async with pool.connection(timeout=0) as connection2:
+            assert connection2 is connection
+
+
+async def test_pool_replenish(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    """Connections are opened in the background to keep min_size."""
+
+    async def wait_for_idle(pool: ConnectionPool, count: int) -> None:
+        with fail_after(5):
+            while pool.metrics.idle < count:
+                await sleep(0.01)
+
+    async with ConnectionPool(connection_factory, min_size=2, max_size=3) as pool:
+        await wait_for_idle(pool, 2)
+
+        connection = await pool.acquire()
+        await connection.aclose()
+        await pool.release(connection)
+        await wait_for_idle(pool, 2)
+        assert pool.metrics.connections_created == 3
+        assert pool.metrics.connections_closed == 1
+
+
+async def test_pool_health_check(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    """Idle connections failing a health check are discarded before checkout."""
+    checked: List[Connection] = []
+
+    async def health_check(connection: Connection) -> bool:
+        checked.append(connection)
+        return len(checked) > 1
+
+    async with ConnectionPool(
+        connection_factory, health_check=health_check, health_check_interval=0
+    ) as pool:
+        async with pool.connection() as connection:
+            pass
+        async with pool.connection() as connection2:
+            pass
+        assert checked == [connection]
+        assert connection.closed
+        assert connection2 is not connection
+
+
+async def test_pool_close_wakes_waiters(
+    connection_factory: Callable[[], Awaitable[Connection]],
+):
+    errors: List[Exception] = []
+    pool = ConnectionPool(connection_factory, max_size=1)
+    async with pool:
+        connection = await pool.acquire()
+
+        async def waiter() -> None:
+            try:
+                await pool.acquire(timeout=None)
+            except PoolClosedError as e:
+                errors.append(e)
+
+        async with create_task_group() as tg:
+            tg.start_soon(waiter)
+            await sleep(0.01)
+            await pool.aclose()
+        await pool.release(connection)
+
+    assert len(errors) == 1
+    assert connection.closed
+    assert pool.metrics.size == 0
+
+
+async def test_pool_prewarm(
+    httpx_mock: HTTPXMock,
+    connect_kwargs: Dict[str, Any],
+):
+    """Connections to an engine are prewarmed once, on the shared transport."""
+    httpx_mock.add_response(method="HEAD", is_reusable=True)
+    async with ConnectionPool(prewarm=2, **connect_kwargs) as pool:
+        connection1 = await pool.acquire()
+        connection2 = await pool.acquire()
+        with fail_after(5):
+            while len(httpx_mock.get_requests(method="HEAD")) < 2:
+                await sleep(0.01)
+        await sleep(0.05)
+        assert len(httpx_mock.get_requests(method="HEAD")) == 2
+        await pool.release(connection1)
+        await pool.release(connection2)
+
+
+def test_pool_invalid_config():
+    with raises(ConfigurationError):
+        ConnectionPool(max_size=0)
+    with raises(ConfigurationError):
+        ConnectionPool(lambda: None, database="db")
+    with raises(ConfigurationError):
+        ConnectionPool(lambda: None, prewarm=-1)
@@ -3,10 +3,11 @@ from unittest.mock import PropertyMock, patch
 
 from httpx import Request, codes
 from pyfakefs.fake_filesystem_unittest import Patcher
-from pytest import mark
+from pytest import mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.client.auth import Auth
+from firebolt.utils.exception import ConfigurationError
 from firebolt.utils.token_storage import TokenSecureStorage
 from tests.unit.util import execute_generator_requests
 
@@ -127,3 +128,29 @@ def test_auth_token_storage(
         assert (
             st.get_cached_token() is None
         ), "Token cached even though caching is disabled"
+
+
+def test_auth_refresh_ahead_schedule() -> None:
+    """Background refresh is scheduled within the token lifetime and claimed once."""
+    with raises(ConfigurationError):
+        Auth(use_token_cache=False, refresh_ahead=1)
+
+    auth = Auth(use_token_cache=False, refresh_ahead=0.5)
+    assert auth.copy()._refresh_ahead == 0.5
+    assert not auth._claim_refresh()
+
+    with patch("firebolt.client.auth.base.time", return_value=1000):
+        auth._expires = 1100
+        auth._schedule_refresh()
+        assert 1045 <= auth._refresh_at <= 1050
+        assert not auth._claim_refresh()
+
+    with patch("firebolt.client.auth.base.time", return_value=1050):
+        assert auth._claim_refresh()
+        assert not auth._claim_refresh()
+
+    # Refresh ahead is disabled by default
+    auth = Auth(use_token_cache=False)
+    auth._expires = 2**32
+    auth._schedule_refresh()
+    assert auth._refresh_at is None
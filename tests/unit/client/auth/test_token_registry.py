@@ -0,0 +1,92 @@
+from typing import Callable
+
+from httpx import codes
+from pytest_httpx import HTTPXMock
+
+from firebolt.client import ClientV2 as Client
+from firebolt.client.auth import ClientCredentials
+from firebolt.client.auth.token_registry import TokenRegistry, token_registry
+
+
+def test_token_registry_shares_tokens(
+    httpx_mock: HTTPXMock,
+    check_credentials_callback: Callable,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+    access_token: str,
+) -> None:
+    """Auth objects with the same credentials and endpoint share a token."""
+    httpx_mock.add_callback(check_credentials_callback, url=auth_url)
+    httpx_mock.add_response(url="https://url", is_reusable=True)
+
+    for _ in range(3):
+        auth = ClientCredentials(client_id, client_secret, use_token_cache=False)
+        with Client(
+            account_name=account_name, auth=auth, api_endpoint=api_endpoint
+        ) as client:
+            client.get("https://url")
+        assert auth.token == access_token
+
+    assert len(httpx_mock.get_requests(url=auth_url)) == 1
+    assert len(token_registry) == 1
+
+
+def test_token_registry_separates_credentials(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+) -> None:
+    """Tokens aren't shared with another secret or another auth endpoint."""
+    httpx_mock.add_response(
+        url=auth_url,
+        json={"access_token": "token", "expires_in": 2**30},
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url="https://id.other.firebolt.io/oauth/token",
+        json={"access_token": "other_token", "expires_in": 2**30},
+    )
+    httpx_mock.add_response(url="https://url", is_reusable=True)
+
+    auths = [
+        (ClientCredentials(client_id, client_secret, False), api_endpoint),
+        (ClientCredentials(client_id, "wrong_secret", False), api_endpoint),
+        (ClientCredentials(client_id, client_secret, False), "api.other.firebolt.io"),
+    ]
+    for auth, endpoint in auths:
+        with Client(account_name=account_name, auth=auth, api_endpoint=endpoint) as c:
+            assert c.get("https://url").status_code == codes.OK
+
+    assert [auth.token for auth, _ in auths] == ["token", "token", "other_token"]
+    assert len(httpx_mock.get_requests(url=auth_url)) == 2
+    assert len(token_registry) == 3
+
+
+def test_token_registry_evicts_unused_entries() -> None:
+    """Unused entries are evicted periodically, once their token expires."""
+    registry = TokenRegistry(eviction_interval=4)
+    keys = [("auth", "principal", str(i), "endpoint") for i in range(3)]
+
+    registry.entry(keys[0]).publish("expired", 0)
+    registry.entry(keys[1]).publish("token", 2**32)
+    used = registry.entry(keys[2])
+    assert len(registry) == 3
+
+    registry.entry(keys[1])
+    # Expired entry isn't used, others have a token or an auth
+    assert len(registry) == 2
+    assert registry.entry(keys[1]).valid_token() == ("token", 2**32)
+    assert registry.entry(keys[2]) is used
+
+    del used
+    registry.entry(keys[1]).publish("expired", 0)
+    assert len(registry) == 2
+    # Fourth lookup since the last check
+    registry.entry(keys[1])
+    assert len(registry) == 0
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+from time import sleep, time
 from typing import Callable
 
 from httpx import Request, Timeout, codes
@@ -6,7 +9,9 @@ from pytest import raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.client import ClientV2 as Client
+from firebolt.client import TransportOptions
 from firebolt.client.auth import Auth, ClientCredentials
+from firebolt.client.http_backend import KeepaliveTransport
 from firebolt.client.resource_manager_hooks import raise_on_4xx_5xx
 from firebolt.utils.token_storage import TokenSecureStorage
 from firebolt.utils.urls import AUTH_SERVICE_ACCOUNT_URL
@@ -181,3 +186,171 @@ def test_client_clone(
 
         # not sure how to test the timeout, but at least make sure it's the same
         assert c2._timeout == timeout
+
+
+def test_client_http2(auth: Auth, account_name: str):
+    """HTTP/2 is enabled on the keepalive transport and preserved by clone."""
+    with Client(account_name=account_name, auth=auth) as c:
+        assert not c._transport._pool._http2
+
+    with Client(account_name=account_name, auth=auth, http2=True) as c:
+        assert isinstance(c._transport, KeepaliveTransport)
+        assert c._transport._pool._http2
+        with c.clone() as c2:
+            assert c2._transport._pool._http2
+
+
+def test_client_transport_options(auth: Auth, account_name: str):
+    """Transport options configure the pool and are preserved by clone."""
+    options = TransportOptions(
+        max_connections=300,
+        max_keepalive_connections=50,
+        keepalive_expiry=30.0,
+        local_address="0.0.0.0",
+    )
+    with Client(account_name=account_name, auth=auth, transport_options=options) as c:
+        for client in (c, c.clone()):
+            pool = client._transport._pool
+            assert pool._max_connections == 300
+            assert pool._max_keepalive_connections == 50
+            assert pool._keepalive_expiry == 30.0
+            assert pool._local_address == "0.0.0.0"
+            assert pool._network_backend._options is options
+
+
+def test_client_refresh_token_ahead(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+):
+    """The token is refreshed in the background, without blocking requests."""
+    tokens = iter(["token_1", "token_2"])
+    refresh_started, refresh_allowed = Event(), Event()
+
+    def auth_callback(request: Request) -> Response:
+        token = next(tokens)
+        if token == "token_2":
+            refresh_started.set()
+            assert refresh_allowed.wait(5)
+        # Only the first token is refreshed ahead of expiry
+        expires_in = 2 if token == "token_1" else 2**30
+        return Response(
+            status_code=codes.OK,
+            json={"access_token": token, "expires_in": expires_in},
+        )
+
+    used_tokens = []
+
+    def query_callback(request: Request) -> Response:
+        used_tokens.append(request.headers["Authorization"])
+        return Response(status_code=codes.OK)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url, is_reusable=True)
+    httpx_mock.add_callback(query_callback, url="https://url", is_reusable=True)
+
+    auth = ClientCredentials(
+        client_id, client_secret, use_token_cache=False, refresh_ahead=0.01
+    )
+    with Client(
+        account_name=account_name, auth=auth, api_endpoint=api_endpoint
+    ) as client:
+        client.get("https://url")
+        sleep(0.05)
+        # Refresh is due, the request doesn't wait for it
+        client.get("https://url")
+        assert refresh_started.wait(5)
+        refresh_allowed.set()
+        while auth.token != "token_2":
+            sleep(0.01)
+        client.get("https://url")
+
+    assert used_tokens == ["Bearer token_1", "Bearer token_1", "Bearer token_2"]
+    assert len(httpx_mock.get_requests(url=auth_url)) == 2
+
+
+def test_client_refresh_token_ahead_locked(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+):
+    """Background refresh uses a token another thread got while it waited."""
+    httpx_mock.add_callback(
+        lambda _: Response(
+            status_code=codes.OK, json={"access_token": "token_1", "expires_in": 2}
+        ),
+        url=auth_url,
+    )
+    httpx_mock.add_callback(
+        lambda _: Response(status_code=codes.OK), url="https://url", is_reusable=True
+    )
+
+    auth = ClientCredentials(
+        client_id, client_secret, use_token_cache=False, refresh_ahead=0.01
+    )
+    with Client(
+        account_name=account_name, auth=auth, api_endpoint=api_endpoint
+    ) as client:
+        client.get("https://url")
+        sleep(0.05)
+        with auth._shared.lock:
+            # Refresh is due, but waits for the token being requested
+            client.get("https://url")
+            auth._shared.publish("token_2", int(time()) + 2**30)
+        while auth.token != "token_2":
+            sleep(0.01)
+        assert auth._expires > int(time()) + 2**29
+
+    assert len(httpx_mock.get_requests(url=auth_url)) == 1
+
+
+def test_client_concurrent_token_refresh(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+    access_token: str,
+):
+    """Threads using an auth object and its copies request a new token once."""
+    thread_count = 32
+
+    def auth_callback(request: Request) -> Response:
+        # Slow identity service, so all threads find the token missing
+        sleep(0.1)
+        return Response(
+            status_code=codes.OK,
+            json={"access_token": access_token, "expires_in": 2**30},
+        )
+
+    httpx_mock.add_callback(auth_callback, url=auth_url, is_reusable=True)
+    httpx_mock.add_response(
+        url="https://url",
+        match_headers={"Authorization": f"Bearer {access_token}"},
+        is_reusable=True,
+    )
+
+    auth = ClientCredentials(client_id, client_secret, use_token_cache=False)
+    auths = [auth, auth.copy(), auth.copy().copy()]
+    barrier = Barrier(thread_count)
+
+    def run_query(index: int) -> int:
+        with Client(
+            account_name=account_name,
+            auth=auths[index % len(auths)],
+            api_endpoint=api_endpoint,
+        ) as client:
+            barrier.wait()
+            return client.get("https://url").status_code
+
+    with ThreadPoolExecutor(thread_count) as executor:
+        assert set(executor.map(run_query, range(thread_count))) == {codes.OK}
+
+    assert len(httpx_mock.get_requests(url=auth_url)) == 1
+    assert all(a.token == access_token for a in auths)
@@ -1,16 +1,18 @@
 import random
 from queue import Queue
 from re import compile
+from time import time
 from types import MethodType
 from typing import Any, Callable
 
 from httpx import Request, Timeout, codes
 from pytest import raises
 from pytest_httpx import HTTPXMock
-from trio import open_nursery, sleep
+from trio import Event, fail_after, open_nursery, sleep
 
 from firebolt.client import AsyncClientV2 as AsyncClient
 from firebolt.client.auth import Auth, ClientCredentials
+from firebolt.client.http_backend import AsyncKeepaliveTransport
 from firebolt.utils.urls import AUTH_SERVICE_ACCOUNT_URL
 from tests.unit.conftest import Response, retry_if_failed
 
@@ -252,3 +254,117 @@ async def test_client_clone(
 
         # not sure how to test the timeout, but at least make sure it's the same
         assert c2._timeout == timeout
+
+
+async def test_client_http2(auth: Auth, account_name: str):
+    """HTTP/2 is enabled on the keepalive transport and preserved by clone."""
+    async with AsyncClient(account_name=account_name, auth=auth) as c:
+        assert not c._transport._pool._http2
+
+    async with AsyncClient(account_name=account_name, auth=auth, http2=True) as c:
+        assert isinstance(c._transport, AsyncKeepaliveTransport)
+        assert c._transport._pool._http2
+        async with c.clone() as c2:
+            assert c2._transport._pool._http2
+
+
+async def test_client_refresh_token_ahead(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+):
+    """The token is refreshed in a background task, without blocking requests."""
+    tokens = iter(["token_1", "token_2"])
+    refresh_started, refresh_allowed = Event(), Event()
+
+    async def auth_callback(request: Request) -> Response:
+        token = next(tokens)
+        if token == "token_2":
+            refresh_started.set()
+            await refresh_allowed.wait()
+        # Only the first token is refreshed ahead of expiry
+        expires_in = 2 if token == "token_1" else 2**30
+        return Response(
+            status_code=codes.OK,
+            json={"access_token": token, "expires_in": expires_in},
+        )
+
+    used_tokens = []
+
+    def query_callback(request: Request) -> Response:
+        used_tokens.append(request.headers["Authorization"])
+        return Response(status_code=codes.OK)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url, is_reusable=True)
+    httpx_mock.add_callback(query_callback, url="https://url", is_reusable=True)
+
+    auth = ClientCredentials(
+        client_id, client_secret, use_token_cache=False, refresh_ahead=0.01
+    )
+    async with AsyncClient(
+        account_name=account_name, auth=auth, api_endpoint=api_endpoint
+    ) as client:
+        await client.get("https://url")
+        await sleep(0.05)
+        # Refresh is due, the request doesn't wait for it
+        await client.get("https://url")
+        with fail_after(5):
+            await refresh_started.wait()
+        refresh_allowed.set()
+        while auth.token != "token_2":
+            await sleep(0.01)
+        await client.get("https://url")
+
+    assert used_tokens == ["Bearer token_1", "Bearer token_1", "Bearer token_2"]
+    assert len(httpx_mock.get_requests(url=auth_url)) == 2
+
+
+async def test_client_refresh_token_ahead_locked(
+    httpx_mock: HTTPXMock,
+    client_id: str,
+    client_secret: str,
+    account_name: str,
+    api_endpoint: str,
+    auth_url: str,
+):
+    """Background refresh uses a token another task got while it waited."""
+    httpx_mock.add_callback(
+        lambda _: Response(
+            status_code=codes.OK, json={"access_token": "token_1", "expires_in": 2}
+        ),
+        url=auth_url,
+    )
+    httpx_mock.add_callback(
+        lambda _: Response(status_code=codes.OK), url="https://url", is_reusable=True
+    )
+
+    auth = ClientCredentials(
+        client_id, client_secret, use_token_cache=False, refresh_ahead=0.01
+    )
+    async with AsyncClient(
+        account_name=account_name, auth=auth, api_endpoint=api_endpoint
+    ) as client:
+        await client.get("https://url")
+        await sleep(0.05)
+        locked, requested = Event(), Event()
+
+        async def request_token() -> None:
+            async with auth._lock:
+                locked.set()
+                await requested.wait()
+                auth._shared.publish("token_2", int(time()) + 2**30)
+
+        async with open_nursery() as nursery:
+            nursery.start_soon(request_token)
+            await locked.wait()
+            # Refresh is due, but waits for the token being requested
+            await client.get("https://url")
+            requested.set()
+        while auth.token != "token_2":
+            await sleep(0.01)
+        assert auth._expires > int(time()) + 2**29
+
+    assert len(httpx_mock.get_requests(url=auth_url)) == 1
@@ -0,0 +1,71 @@
+import socket
+from ssl import SSLContext, create_default_context
+from typing import Iterator
+from unittest.mock import MagicMock
+
+from pytest import fixture, mark
+
+from firebolt.client import ClientV2
+from firebolt.client.auth import Auth
+from firebolt.client.http_backend import (
+    TransportOptions,
+    get_ssl_context,
+    override_stream,
+)
+from firebolt.common.constants import KEEPIDLE_RATE
+
+KEEPIDLE = getattr(socket, "TCP_KEEPIDLE", 0x10)
+
+
+@fixture
+def stream() -> Iterator[MagicMock]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        yield MagicMock(spec=["sock"], sock=sock)
+
+
+def test_override_stream_defaults(stream: MagicMock):
+    assert override_stream(stream) is stream
+
+    sock = stream.sock
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    assert sock.getsockopt(socket.IPPROTO_TCP, KEEPIDLE) == KEEPIDLE_RATE
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
+@mark.skipif(
+    not hasattr(socket, "TCP_KEEPINTVL") or not hasattr(socket, "TCP_KEEPCNT"),
+    reason="Keepalive interval and count are not configurable on this platform",
+)
+def test_override_stream_options(stream: MagicMock):
+    options = TransportOptions(
+        tcp_nodelay=False, keepalive_idle=30, keepalive_interval=5, keepalive_count=3
+    )
+    override_stream(stream, options)
+
+    sock = stream.sock
+    assert sock.getsockopt(socket.IPPROTO_TCP, KEEPIDLE) == 30
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL) == 5
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 3
+    assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
+def test_get_ssl_context_shared():
+    context = get_ssl_context()
+    assert isinstance(context, SSLContext)
+    assert get_ssl_context(True) is context
+    # ALPN protocols are set on the context, so HTTP/2 clients get their own
+    assert get_ssl_context(True, http2=True) is not context
+    assert get_ssl_context(False) is not context
+    assert get_ssl_context(False) is get_ssl_context(False)
+
+    custom = create_default_context()
+    assert get_ssl_context(custom) is custom
+
+
+def test_clients_share_ssl_context(auth: Auth, account_name: str):
+    with ClientV2(auth=auth, account_name=account_name) as c1, ClientV2(
+        auth=auth, account_name=account_name
+    ) as c2:
+        assert c1._transport._pool._ssl_context is c2._transport._pool._ssl_context
+        assert c1._transport._pool._ssl_context is get_ssl_context()
@@ -0,0 +1,111 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
+from firebolt.async_db import connect as async_connect
+from firebolt.client import ClientV2
+from firebolt.client.auth import Auth, ClientCredentials
+from firebolt.client.transport_registry import (
+    TransportRegistry,
+    async_transport_registry,
+    transport_registry,
+    use_shared_transport,
+)
+from firebolt.db import connect
+
+ENGINE_URL = "https://engine.firebolt.io"
+
+
+def test_registry_reference_counting():
+    registry = TransportRegistry()
+    factory = MagicMock(side_effect=lambda: object())
+
+    transport = registry.acquire(("key",), factory)
+    assert registry.acquire(("key",), factory) is transport
+    assert registry.acquire(("other",), factory) is not transport
+    assert factory.call_count == 2
+
+    assert registry.release(("key",)) is None
+    assert registry.release(("key",)) is transport
+    assert len(registry) == 1
+
+
+def test_shared_transport_key(auth: Auth, account_name: str):
+    """Clients share a transport only for the same engine and principal."""
+    other_auth = ClientCredentials("other_id", "other_secret")
+    clients = [
+        ClientV2(auth=auth, account_name=account_name),
+        ClientV2(auth=auth, account_name=account_name),
+        ClientV2(auth=auth, account_name=account_name, http2=True),
+        ClientV2(auth=other_auth, account_name=account_name),
+        ClientV2(auth=auth, account_name=account_name),
+    ]
+    for client in clients[:4]:
+        use_shared_transport(client, ENGINE_URL)
+    use_shared_transport(clients[4], "https://other-engine.firebolt.io")
+
+    transports = [client._transport._transport for client in clients]
+    assert transports[0] is transports[1]
+    assert len({id(t) for t in transports}) == 4
+    assert len(transport_registry) == 4
+
+    for client in clients:
+        client.close()
+    assert len(transport_registry) == 0
+
+
+def test_connect_share_transport(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    """Connections to the same engine share a transport until the last is closed."""
+    mock_connection_flow()
+    kwargs = dict(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        share_transport=True,
+    )
+    connection1 = connect(**kwargs)
+    connection2 = connect(**kwargs)
+    shared = connection1._client._transport._transport
+    assert connection2._client._transport._transport is shared
+    assert connection1._client.headers is not connection2._client.headers
+
+    connection1.close()
+    assert len(transport_registry) == 1
+    connection2.close()
+    assert len(transport_registry) == 0
+
+
+async def test_async_connect_share_transport(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    mock_connection_flow()
+    kwargs = dict(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        share_transport=True,
+    )
+    connection1 = await async_connect(**kwargs)
+    connection2 = await async_connect(**kwargs)
+    shared = connection1._client._transport._transport
+    assert connection2._client._transport._transport is shared
+
+    await connection1.aclose()
+    assert len(async_transport_registry) == 1
+    await connection2.aclose()
+    assert len(async_transport_registry) == 0
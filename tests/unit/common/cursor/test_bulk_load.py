@@ -0,0 +1,116 @@
+"""Unit tests for streaming bulk load helpers."""
+
+import json
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from firebolt.common.cursor.bulk_load import (
+    aiter_bulk_batches,
+    iter_bulk_batches,
+    read_csv_rows,
+    read_json_lines_rows,
+)
+from firebolt.common.cursor.statement_planners import QmarkStatementPlanner
+from firebolt.common.statement_formatter import create_statement_formatter
+from firebolt.utils.exception import ConfigurationError, DataError
+
+
+@pytest.fixture
+def builder():
+    planner = QmarkStatementPlanner(create_statement_formatter(version=2))
+    return planner.create_bulk_batch_builder("INSERT INTO t VALUES (?)")
+
+
+def test_iter_bulk_batches_by_rows(builder):
+    """Batches are split by row count and the last partial batch is kept."""
+    batches = list(iter_bulk_batches(builder, ([i] for i in range(5)), 2, 10**6))
+    assert [b.row_count for b in batches] == [2, 2, 1]
+
+
+def test_iter_bulk_batches_by_bytes(builder):
+    """Batches are split once the accumulated size reaches the limit."""
+    statement_size = len("INSERT INTO t VALUES (1)") + 2
+    batches = list(
+        iter_bulk_batches(builder, ([1] for _ in range(5)), 100, statement_size * 2)
+    )
+    assert [b.row_count for b in batches] == [2, 2, 1]
+
+
+def test_iter_bulk_batches_is_lazy(builder):
+    """Rows are consumed only as batches are requested."""
+    consumed = []
+
+    def rows():
+        for i in range(10):
+            consumed.append(i)
+            yield [i]
+
+    batches = iter_bulk_batches(builder, rows(), 3, 10**6)
+    next(batches)
+    assert consumed == [0, 1, 2]
+
+
+def test_iter_bulk_batches_invalid_limits(builder):
+    with pytest.raises(ConfigurationError):
+        list(iter_bulk_batches(builder, [[1]], 0, 10))
+    with pytest.raises(ConfigurationError):
+        list(iter_bulk_batches(builder, [[1]], 10, 0))
+
+
+async def test_aiter_bulk_batches(builder):
+    """Async batching accepts both sync and async iterables."""
+
+    async def rows():
+        for i in range(5):
+            yield [i]
+
+    batches = [b async for b in aiter_bulk_batches(builder, rows(), 2, 10**6)]
+    assert [b.row_count for b in batches] == [2, 2, 1]
+
+    batches = [
+        b async for b in aiter_bulk_batches(builder, [[1], [2], [3]], 2, 10**6)
+    ]
+    assert [b.row_count for b in batches] == [2, 1]
+
+
+def test_read_csv_rows(fs: FakeFilesystem):
+    path = "/data.csv"
+    fs.create_file(path, contents='id,name\n1,"a, b"\n2,\n')
+
+    assert list(read_csv_rows(path)) == [["1", "a, b"], ["2", None]]
+    assert list(read_csv_rows(path, header=False, null_value=None)) == [
+        ["id", "name"],
+        ["1", "a, b"],
+        ["2", ""],
+    ]
+
+
+def test_read_json_lines_rows(fs: FakeFilesystem):
+    path = "/data.jsonl"
+    fs.create_file(
+        path,
+        contents="\n".join(
+            [
+                json.dumps([1, "a"]),
+                "",
+                json.dumps({"name": "b", "id": 2}),
+            ]
+        ),
+    )
+
+    assert list(read_json_lines_rows(path)) == [[1, "a"], ["b", 2]]
+    assert list(read_json_lines_rows(path, columns=["id", "name"])) == [
+        [1, "a"],
+        [2, "b"],
+    ]
+
+
+def test_read_json_lines_rows_invalid(fs: FakeFilesystem):
+    fs.create_file("/scalar.jsonl", contents="1\n")
+    with pytest.raises(DataError):
+        list(read_json_lines_rows("/scalar.jsonl"))
+
+    fs.create_file("/broken.jsonl", contents="{broken\n")
+    with pytest.raises(DataError):
+        list(read_json_lines_rows("/broken.jsonl"))
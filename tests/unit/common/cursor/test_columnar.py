@@ -0,0 +1,122 @@
+"""Unit tests for columnar (DataFrame/Arrow) insert helpers."""
+
+from datetime import date
+
+import pytest
+
+from firebolt.common.cursor.columnar import (
+    ArrowTableSource,
+    DataFrameSource,
+    iter_columnar_batches,
+    validate_table_name,
+)
+from firebolt.common.statement_formatter import create_statement_formatter
+from firebolt.utils.exception import ConfigurationError, DataError
+
+HEADER = 'INSERT INTO t ("id", "name", "day") VALUES '
+
+
+@pytest.fixture
+def formatter():
+    return create_statement_formatter(version=2)
+
+
+def _bodies(batches):
+    return [b"".join(batch.content()).decode() for batch in batches]
+
+
+def test_iter_columnar_batches_dataframe(formatter):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", None, "it's"],
+            "day": [date(2024, 1, 1), None, date(2024, 1, 3)],
+        }
+    )
+
+    batches = list(
+        iter_columnar_batches("t", DataFrameSource(df), formatter, 2, 10**6)
+    )
+
+    assert [b.row_count for b in batches] == [2, 1]
+    assert _bodies(batches) == [
+        HEADER + "(1, 'a', '2024-01-01'), (2, NULL, NULL)",
+        HEADER + "(3, 'it''s', '2024-01-03')",
+    ]
+
+
+def test_iter_columnar_batches_dataframe_nan(formatter):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"x": [1.5, float("nan")]})
+
+    batches = list(
+        iter_columnar_batches("t", DataFrameSource(df), formatter, 10, 10**6)
+    )
+
+    assert _bodies(batches) == ['INSERT INTO t ("x") VALUES (1.5), (NULL)']
+
+
+def test_iter_columnar_batches_arrow(formatter):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", "b", None],
+            "day": [date(2024, 1, 1), date(2024, 1, 2), None],
+        }
+    )
+
+    batches = list(
+        iter_columnar_batches("t", ArrowTableSource(table), formatter, 10, 10**6)
+    )
+
+    assert _bodies(batches) == [
+        HEADER + "(1, 'a', '2024-01-01'), (2, 'b', '2024-01-02'), (3, NULL, NULL)"
+    ]
+
+
+def test_iter_columnar_batches_by_bytes(formatter):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"x": list(range(10))})
+    header_size = len('INSERT INTO t ("x") VALUES ')
+
+    batches = list(
+        iter_columnar_batches(
+            "t", ArrowTableSource(table), formatter, 100, header_size + 4 * 3
+        )
+    )
+
+    assert [b.row_count for b in batches] == [3, 3, 3, 1]
+
+
+def test_iter_columnar_batches_errors(formatter):
+    pa = pytest.importorskip("pyarrow")
+    with pytest.raises(DataError):
+        list(
+            iter_columnar_batches("t", ArrowTableSource(pa.table({})), formatter, 1, 1)
+        )
+    with pytest.raises(ConfigurationError):
+        list(
+            iter_columnar_batches(
+                "t", ArrowTableSource(pa.table({"x": [1]})), formatter, 0, 1
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "table", ["t", "_t1", "db.t$1", '"My Table"', 'public."a""b"', '"a".b']
+)
+def test_validate_table_name(table):
+    assert validate_table_name(table) == table
+
+
+@pytest.mark.parametrize(
+    "table", ["", "1t", "t; DROP TABLE x", "t (a)", "a..b", '"unclosed', '""', "t."]
+)
+def test_validate_table_name_invalid(table, formatter):
+    with pytest.raises(DataError):
+        validate_table_name(table)
+    source = DataFrameSource(pytest.importorskip("pandas").DataFrame({"x": [1]}))
+    with pytest.raises(DataError):
+        list(iter_columnar_batches(table, source, formatter, 10, 10**6))
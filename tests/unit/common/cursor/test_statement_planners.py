@@ -18,7 +18,12 @@ from firebolt.common.cursor.statement_planners import (
     StatementPlannerFactory,
 )
 from firebolt.common.statement_formatter import create_statement_formatter
-from firebolt.utils.exception import FireboltError, ProgrammingError
+from firebolt.utils.exception import (
+    ConfigurationError,
+    FireboltError,
+    NotSupportedError,
+    ProgrammingError,
+)
 
 
 # Fixtures
@@ -384,3 +389,117 @@ def test_execution_plan_immutability():
 
     assert plan.queries != plan2.queries
     assert plan.is_multi_statement != plan2.is_multi_statement
+
+
+# Streaming bulk batch builder tests
+def test_qmark_bulk_batch_builder(qmark_planner):
+    """Qmark builder formats rows client-side, one statement per row."""
+    builder = qmark_planner.create_bulk_batch_builder("INSERT INTO t VALUES (?, ?)")
+    builder.add_row([1, "a"])
+    builder.add_row([2, "b'c"])
+    assert builder.row_count == 2
+    assert builder.size > 0
+
+    plan = builder.build()
+    assert plan.row_count == 2
+    assert plan.query_params == {"output_format": JSON_OUTPUT_FORMAT}
+    assert b"".join(plan.content()) == (
+        b"INSERT INTO t VALUES (1, 'a'); INSERT INTO t VALUES (2, 'b''c')"
+    )
+    # Body can be replayed
+    assert b"".join(plan.content()) == b"".join(plan.content())
+
+    # Builder is reset after build
+    assert builder.row_count == 0
+    assert builder.size == 0
+
+
+def test_fb_numeric_bulk_batch_builder(fb_numeric_planner):
+    """fb_numeric builder renumbers placeholders and resets them per batch."""
+    builder = fb_numeric_planner.create_bulk_batch_builder(
+        "INSERT INTO t VALUES ($1, $2)"
+    )
+    builder.add_row([1, "a"])
+    builder.add_row([2, "b"])
+    plan = builder.build()
+
+    assert plan.statements == [
+        "INSERT INTO t VALUES ($1, $2)",
+        "INSERT INTO t VALUES ($3, $4)",
+    ]
+    params = json.loads(plan.query_params["query_parameters"])
+    assert [p["name"] for p in params] == ["$1", "$2", "$3", "$4"]
+    assert [p["value"] for p in params] == [1, "a", 2, "b"]
+
+    builder.add_row([3, "c"])
+    plan = builder.build()
+    assert plan.statements == ["INSERT INTO t VALUES ($1, $2)"]
+    params = json.loads(plan.query_params["query_parameters"])
+    assert [p["name"] for p in params] == ["$1", "$2"]
+
+
+def test_bulk_batch_builder_validates_query(qmark_planner):
+    """Streaming bulk builders only accept single INSERT statements."""
+    with pytest.raises(ConfigurationError):
+        qmark_planner.create_bulk_batch_builder("SELECT * FROM t")
+    with pytest.raises(ProgrammingError):
+        qmark_planner.create_bulk_batch_builder(
+            "INSERT INTO t VALUES (?); INSERT INTO t VALUES (?)"
+        )
+
+
+@pytest.mark.parametrize(
+    "query,parameters,bulk_insert",
+    [
+        ("SELECT * FROM t WHERE id = ? AND name = ?", [[1, "a'b"]], False),
+        ("SELECT 1;", [], False),
+        ("SELECT ?", [[1], [None], ["x"]], False),
+        ("INSERT INTO t VALUES (?, ?)", [[1, "a"], [2, None]], True),
+    ],
+)
+def test_qmark_prepared_query(qmark_planner, query, parameters, bulk_insert):
+    """Prepared query plans are the same as plans created from scratch."""
+    prepared = qmark_planner.prepare(query)
+    for _ in range(2):
+        assert prepared.create_execution_plan(
+            parameters, bulk_insert
+        ) == qmark_planner.create_execution_plan(
+            query, parameters, bulk_insert=bulk_insert
+        )
+
+
+@pytest.mark.parametrize(
+    "query,parameters,bulk_insert",
+    [
+        ("SELECT * FROM t WHERE id = $1 AND name = $2", [[1, 'a"b']], False),
+        ("SELECT 1", [], False),
+        ("SELECT $1", [[[1, 2]]], False),
+        ("INSERT INTO t VALUES ($1, $2)", [[1, "a"], [2.5, None], [3, True]], True),
+    ],
+)
+def test_fb_numeric_prepared_query(fb_numeric_planner, query, parameters, bulk_insert):
+    """Prepared query plans are the same as plans created from scratch."""
+    prepared = fb_numeric_planner.prepare(query)
+    for _ in range(2):
+        assert prepared.create_execution_plan(
+            parameters, bulk_insert
+        ) == fb_numeric_planner.create_execution_plan(
+            query, parameters, bulk_insert=bulk_insert
+        )
+
+
+def test_prepared_query_errors(qmark_planner, fb_numeric_planner):
+    with pytest.raises(NotSupportedError):
+        qmark_planner.prepare("SELECT 1; SELECT 2")
+    with pytest.raises(NotSupportedError):
+        qmark_planner.prepare("SET a = b")
+    for planner, query in (
+        (qmark_planner, "SELECT ?"),
+        (fb_numeric_planner, "SELECT $1"),
+    ):
+        with pytest.raises(ConfigurationError):
+            planner.prepare(query).create_execution_plan([[1]], bulk_insert=True)
+    with pytest.raises(ProgrammingError):
+        qmark_planner.prepare("INSERT INTO t VALUES (?)").create_execution_plan(
+            [], bulk_insert=True
+        )
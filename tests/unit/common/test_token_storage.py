@@ -1,13 +1,17 @@
+import json
 import os
-from unittest.mock import patch
+from tempfile import NamedTemporaryFile
+from unittest.mock import Mock, patch
 
 from appdirs import user_config_dir
 from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest import raises
 
 from firebolt.utils.token_storage import (
     FernetEncrypter,
     TokenSecureStorage,
     generate_salt,
+    get_encrypter,
 )
 
 
@@ -144,3 +148,113 @@ def test_expired_token(fs: FakeFilesystem) -> None:
     tss.cache_token("token", 0)
 
     assert tss.get_cached_token() is None
+
+
+@patch("firebolt.utils.token_storage.time", return_value=0)
+def test_token_storage_reuses_derived_key(fs: FakeFilesystem) -> None:
+    """
+    Check that keys are derived once per credentials and salt.
+    """
+    settings = {"username": "key_user", "password": "key_password"}
+    TokenSecureStorage(**settings).cache_token("token", 1)
+
+    with patch("firebolt.utils.token_storage.PBKDF2HMAC") as kdf_mock:
+        storage = TokenSecureStorage(**settings)
+        assert storage.get_cached_token() == "token"
+        storage.cache_token("new token", 1)
+        assert TokenSecureStorage(**settings).get_cached_token() == "new token"
+    kdf_mock.assert_not_called()
+
+
+@patch("firebolt.utils.token_storage.time", return_value=0)
+def test_token_storage_reads_file_once(fs: FakeFilesystem) -> None:
+    """
+    Check that the token file is only read again after it has changed.
+    """
+    settings = {"username": "username", "password": "password"}
+    storage = TokenSecureStorage(**settings)
+    storage.cache_token("token", 1)
+
+    with patch.object(
+        TokenSecureStorage, "_read_data_json", autospec=True
+    ) as read_mock:
+        assert TokenSecureStorage(**settings).get_cached_token() == "token"
+        assert storage.get_cached_token() == "token"
+    read_mock.assert_not_called()
+
+    # A token written by another process is picked up
+    other = {"token": storage.encrypter.encrypt("other"), "salt": storage.salt}
+    with open(storage._token_file, "w") as f:
+        json.dump({**other, "expiration": 2}, f)
+    assert storage.get_cached_token() == "other"
+
+    os.remove(storage._token_file)
+    assert storage.get_cached_token() is None
+
+
+@patch("firebolt.utils.token_storage.time", return_value=0)
+def test_token_storage_atomic_write(fs: FakeFilesystem) -> None:
+    """
+    Check that the token file is replaced atomically and not rewritten
+    if the token hasn't changed.
+    """
+    storage = TokenSecureStorage(username="username", password="password")
+    with patch("os.replace", wraps=os.replace) as replace:
+        storage.cache_token("token", 1)
+        storage.cache_token("token", 1)
+        assert replace.call_count == 1
+        storage.cache_token("token", 2)
+        assert replace.call_count == 2
+
+    assert os.listdir(os.path.dirname(storage._token_file)) == [
+        os.path.basename(storage._token_file)
+    ]
+    with open(storage._token_file) as f:
+        assert json.load(f)["expiration"] == 2
+
+
+@patch("firebolt.utils.token_storage.time", return_value=0)
+def test_token_storage_failed_write(fs: FakeFilesystem) -> None:
+    """
+    Check that a failed write keeps the stored token and doesn't leave
+    temporary files behind.
+    """
+    storage = TokenSecureStorage(username="username", password="password")
+    storage.cache_token("token", 1)
+    names = os.listdir(os.path.dirname(storage._token_file))
+
+    def failing_temp_file(*args, **kwargs):
+        f = NamedTemporaryFile(*args, **kwargs)
+        f.write = Mock(side_effect=OSError("No space left on device"))
+        return f
+
+    with patch("firebolt.utils.util.NamedTemporaryFile", failing_temp_file):
+        with raises(OSError):
+            storage.cache_token("new token", 2)
+    with patch("os.replace", side_effect=PermissionError):
+        with raises(PermissionError):
+            storage.cache_token("new token", 2)
+
+    assert os.listdir(os.path.dirname(storage._token_file)) == names
+    assert TokenSecureStorage("username", "password").get_cached_token() == "token"
+
+
+def test_encrypter_cache_bounded() -> None:
+    """
+    Check that only the most recently used derived keys are kept.
+    """
+    salt = generate_salt()
+    with patch("firebolt.utils.token_storage.ENCRYPTER_CACHE_SIZE", 2):
+        first = get_encrypter(salt, "user1", "password")
+        get_encrypter(salt, "user2", "password")
+        assert get_encrypter(salt, "user1", "password") is first
+        get_encrypter(salt, "user3", "password")
+
+        with patch(
+            "firebolt.utils.token_storage.FernetEncrypter", wraps=FernetEncrypter
+        ) as encrypter_mock:
+            assert get_encrypter(salt, "user1", "password") is first
+            get_encrypter(salt, "user3", "password")
+            encrypter_mock.assert_not_called()
+            get_encrypter(salt, "user2", "password")
+            encrypter_mock.assert_called_once()
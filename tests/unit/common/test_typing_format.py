@@ -52,6 +52,10 @@ def formatter_v1() -> StatementFormatter:
             datetime(2022, 1, 10, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
             "'2022-01-10 00:01:01'",
         ),
+        (
+            datetime(999, 1, 2, 3, 4, 5),
+            f"'{datetime(999, 1, 2, 3, 4, 5).strftime('%Y-%m-%d %H:%M:%S')}'",
+        ),
         # List, tuple
         ([], "[]"),
         ([1, 2, 3], "[1, 2, 3]"),
@@ -60,6 +64,7 @@ def formatter_v1() -> StatementFormatter:
         (None, "NULL"),
         # Bytea
         (b"abc", "E'\\x61\\x62\\x63'"),
+        (b"", "E''"),
     ],
 )
 def test_format_value(formatter: StatementFormatter, value: str, result: str) -> None:
@@ -105,7 +110,26 @@ def test_format_value_v1(
     assert formatter_v1.format_value(value) == result, "Invalid format_value result"
 
 
-def test_format_value_errors(formatter: StatementFormatter) -> None:
+@mark.parametrize(
+    "sample,values",
+    [
+        ("a", ["", "don't", "test\\", None, 1]),
+        (1, [0, -5, None, 1.5, True]),
+        (True, [False, None, 1]),
+        (date(2022, 1, 10), [date(2023, 2, 1), datetime(2022, 1, 10, 1, 1, 1)]),
+        (datetime(2022, 1, 10), [datetime(2022, 1, 10, 1, 1, 1), None]),
+        (b"abc", [b"", b"\x00", None]),
+        ([1], [[1, 2], None]),
+    ],
+)
+def test_column_formatter(
+    formatter: StatementFormatter, sample: object, values: List[object]
+) -> None:
+    """Column formatters produce the same output as format_value for any value."""
+    format_column_value = formatter.column_formatter(sample)
+    for value in [sample] + values:
+        assert format_column_value(value) == formatter.format_value(value)
+
     with raises(DataError) as exc_info:
         formatter.format_value(Exception())
 
@@ -153,6 +177,9 @@ def test_format_statement(
     assert (
         formatter.format_statement(statement, params) == result
     ), "Invalid format sql result"
+    assert (
+        formatter.compile_statement(statement).format_row(params) == result
+    ), "Invalid compiled statement result"
 
 
 def test_format_statement_errors(formatter: StatementFormatter) -> None:
@@ -170,6 +197,29 @@ def test_format_statement_errors(formatter: StatementFormatter) -> None:
         == "too many parameters provided for substitution: given 2, used only 1"
     ), "Invalid not enought parameters error"
 
+    template = formatter.compile_statement(to_statement("?"))
+    with raises(DataError):
+        template.format_row([])
+    with raises(DataError):
+        template.format_row((1, 2))
+
+
+def test_compile_statement_mixed_types(formatter: StatementFormatter) -> None:
+    """Column formatters handle values of a different type than the first one."""
+    template = formatter.compile_statement(
+        to_statement("insert into t values (?, ?, ?);")
+    )
+    rows = [
+        (None, 1, b"\x00\xff"),
+        ("a'b", True, b""),
+        (1.5, Decimal("2.5"), None),
+        (date(2022, 1, 10), None, [1, 2]),
+    ]
+    for row in rows:
+        assert template.format_row(row) == formatter.format_statement(
+            to_statement("insert into t values (?, ?, ?);"), row
+        )
+
 
 @mark.parametrize(
     "query,params,result",
@@ -10,8 +10,10 @@ from firebolt.common._types import (
     DECIMAL,
     STRUCT,
     DateFromTicks,
+    ExtendedType,
     TimeFromTicks,
     TimestampFromTicks,
+    _intern_type,
     parse_type,
     parse_value,
     split_struct_fields,
@@ -42,6 +44,37 @@ def test_parse_struct_type_with_spaces() -> None:
     ), f"Error parsing struct type with spaces"
 
 
+def test_parse_type_interned() -> None:
+    """Equal parsed types are the same immutable object."""
+    raw = "array(struct(a int, b array(text null)))"
+    parsed = parse_type(raw)
+    assert parse_type(raw) is parsed, "Parsed type wasn't cached"
+    assert (
+        parse_type("array(struct(a integer, b array(text)))") is parsed
+    ), "Equal types parsed from different strings weren't interned"
+    assert parse_type("array(text)") is parsed.subtype.fields["b"]
+    assert parse_type("numeric(38, 2)") is parse_type("Decimal(38, 2)")
+
+    with raises(AttributeError):
+        parsed.subtype = int
+    with raises(TypeError):
+        parsed.subtype.fields["a"] = str
+    assert parsed == ARRAY(STRUCT({"a": int, "b": ARRAY(str)}))
+
+
+def test_extended_type_intern_key() -> None:
+    """Subclasses without an intern key can be created and aren't shared."""
+
+    class CustomType(ExtendedType):
+        def __str__(self) -> str:
+            return "custom"
+
+    first, second = CustomType(), CustomType()
+    assert _intern_type(first) is first
+    assert _intern_type(second) is second
+    assert _intern_type(ARRAY(str)) is _intern_type(ARRAY(str))
+
+
 @mark.parametrize(
     "value,expected,error",
     [
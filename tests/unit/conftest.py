@@ -7,6 +7,7 @@ from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import fixture
 
 from firebolt.client.auth import Auth, ClientCredentials
+from firebolt.client.auth.token_registry import token_registry
 from firebolt.client.client import ClientV2
 from firebolt.common.settings import Settings
 from firebolt.utils.cache import _firebolt_cache
@@ -46,6 +47,11 @@ def clear_cache() -> None:
     _firebolt_cache.clear()
 
 
+@fixture(autouse=True)
+def clear_token_registry() -> None:
+    token_registry.clear()
+
+
 @fixture(autouse=True)
 def disable_cache() -> None:
     _firebolt_cache.disable()
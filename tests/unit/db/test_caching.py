@@ -7,8 +7,10 @@ from pytest import fixture, mark
 from pytest_httpx import HTTPXMock
 
 from firebolt.client.auth import Auth
+from firebolt.common.constants import UPDATE_ENDPOINT_HEADER
 from firebolt.db import connect
 from firebolt.utils.cache import CACHE_EXPIRY_SECONDS, _firebolt_cache
+from tests.unit.response import Response
 
 
 @fixture(autouse=True)
@@ -874,3 +876,42 @@ def test_engine_cache_does_not_contain_database_parameter(
             f"Engine parameters should be separate from database context. "
             f"Full engine params: {cached_engine.params}"
         )
+
+
+def test_endpoint_update_invalidates_cached_engine(
+    db_name: str,
+    engine_name: str,
+    engine_url: str,
+    httpx_mock: HTTPXMock,
+    query_url: str,
+    query_statistics: Dict,
+    mock_connection_flow: Callable,
+    api_endpoint: str,
+    auth: Auth,
+    account_name: str,
+):
+    """An engine moved to a new url is removed from the cache."""
+    mock_connection_flow()
+
+    def moved_engine_callback(request, **kwargs) -> Response:
+        return Response(
+            status_code=200,
+            json={"meta": [], "data": [], "rows": 0, "statistics": query_statistics},
+            headers={UPDATE_ENDPOINT_HEADER: "https://new-engine.url?engine=new"},
+        )
+
+    httpx_mock.add_callback(moved_engine_callback, url=query_url)
+
+    with connect(
+        database=db_name,
+        engine_name=engine_name,
+        auth=auth,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+    ) as connection:
+        cursor = connection.cursor()
+        assert engine_name in cursor.get_cache_record().engines
+
+        cursor.execute("SELECT 1")
+        assert cursor.engine_url == "https://new-engine.url"
+        assert engine_name not in cursor.get_cache_record().engines
@@ -1,5 +1,6 @@
 import gc
 import warnings
+from time import monotonic, sleep
 from typing import Callable, Dict, Generator, List, Optional, Tuple
 from unittest.mock import ANY as AnyValue
 from unittest.mock import MagicMock, patch
@@ -8,6 +9,7 @@ from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark, raises, warns
 from pytest_httpx import HTTPXMock
 
+from firebolt.client import TransportOptions
 from firebolt.client.auth import Auth, ClientCredentials
 from firebolt.client.client import ClientV2
 from firebolt.common._types import ColType
@@ -112,6 +114,114 @@ def test_connect(
         assert connection.cursor().execute("select *") == len(python_query_data)
 
 
+def test_connect_reuses_client(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    """One client serves the gateway, the system engine and the user engine."""
+    mock_connection_flow()
+
+    with patch("firebolt.db.connection.ClientV2", wraps=ClientV2) as client_class:
+        with connect(
+            database=db_name,
+            auth=auth,
+            engine_name=engine_name,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+        ) as connection:
+            assert client_class.call_count == 1
+            assert not connection._client.is_closed
+
+            timings = connection.connect_timings
+            assert timings.system_engine > 0
+            assert timings.use_database > 0
+            assert timings.use_engine > 0
+            assert timings.total >= (
+                timings.system_engine + timings.use_database + timings.use_engine
+            )
+
+
+def test_connect_http2(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    """The http2 option is passed to the connection client."""
+    mock_connection_flow()
+
+    with connect(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        http2=True,
+    ) as connection:
+        assert connection._client._transport._pool._http2
+
+
+def test_connect_transport_options(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    mock_connection_flow: Callable,
+):
+    """Transport options are passed to the connection client."""
+    mock_connection_flow()
+    options = TransportOptions(max_connections=300)
+
+    with connect(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        transport_options=options,
+    ) as connection:
+        assert connection._client._transport._pool._max_connections == 300
+
+
+def test_connect_prewarm(
+    db_name: str,
+    account_name: str,
+    engine_name: str,
+    auth: Auth,
+    api_endpoint: str,
+    httpx_mock: HTTPXMock,
+    mock_connection_flow: Callable,
+):
+    """prewarm opens connections to the engine in background threads."""
+    mock_connection_flow()
+    httpx_mock.add_response(method="HEAD", is_reusable=True)
+
+    with connect(
+        database=db_name,
+        auth=auth,
+        engine_name=engine_name,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        prewarm=2,
+    ) as connection:
+        deadline = monotonic() + 5
+        while len(httpx_mock.get_requests(method="HEAD")) < 2:
+            assert monotonic() < deadline, "Connections were not prewarmed."
+            sleep(0.01)
+        for request in httpx_mock.get_requests(method="HEAD"):
+            assert str(request.url).startswith(connection.engine_url)
+
+    with raises(ConfigurationError):
+        connect(auth=auth, account_name=account_name, prewarm=-1)
+
+
 def test_connect_database_failed(
     db_name: str,
     account_name: str,
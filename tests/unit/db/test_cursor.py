@@ -8,7 +8,7 @@ from unittest.mock import patch
 from urllib.parse import parse_qs
 
 from httpx import URL, HTTPStatusError, Request, StreamError, codes
-from pytest import LogCaptureFixture, mark, raises
+from pytest import LogCaptureFixture, importorskip, mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.common.constants import CursorState
@@ -74,6 +74,10 @@ def test_closed_cursor(cursor: Cursor):
         ("setinputsizes", (cursor, [0])),
         ("setoutputsize", (cursor, 0)),
         ("nextset", ()),
+        ("load_rows", ("insert into t values (?)", [])),
+        # The file doesn't exist, closed cursor check goes first
+        ("load_csv", ("insert into t values (?)", "missing.csv")),
+        ("load_json_lines", ("insert into t values (?)", "missing.jsonl")),
     )
 
     cursor.close()
@@ -1826,3 +1830,257 @@ def test_cursor_plaintext_error(
     assert "Plaintext error message" in str(
         excinfo.value
     ), "Invalid error message for plaintext error response"
+
+
+def _empty_insert_response() -> Response:
+    return Response(
+        status_code=200,
+        content=json.dumps(
+            {
+                "meta": [],
+                "data": [],
+                "rows": 0,
+                "statistics": {"elapsed": 0.0, "rows_read": 0, "bytes_read": 0},
+            }
+        ),
+    )
+
+
+def test_cursor_load_rows(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """load_rows consumes a generator lazily and sends it in batches."""
+    bodies = []
+
+    def bulk_insert_callback(request: Request) -> Response:
+        assert request.headers.get("Transfer-Encoding") == "chunked"
+        bodies.append(request.read().decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    rows = ((i, f"name{i}") for i in range(5))
+    loaded = cursor.load_rows("INSERT INTO t VALUES (?, ?)", rows, batch_rows=2)
+
+    assert loaded == 5
+    assert len(bodies) == 3
+    assert bodies[0] == (
+        "INSERT INTO t VALUES (0, 'name0'); INSERT INTO t VALUES (1, 'name1')"
+    )
+    assert bodies[2] == "INSERT INTO t VALUES (4, 'name4')"
+    assert cursor._state == CursorState.DONE
+
+
+def test_cursor_load_rows_fb_numeric(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    fb_numeric_query_url: re.Pattern,
+    fb_numeric_paramstyle,
+):
+    """fb_numeric batches are split so their parameters fit in the url."""
+    loaded_rows = []
+
+    def bulk_insert_callback(request: Request) -> Response:
+        parameters = json.loads(request.url.params["query_parameters"])
+        assert len(str(request.url)) < 64 * 1024
+        loaded_rows.extend(p["value"] for p in parameters[::2])
+        return _empty_insert_response()
+
+    httpx_mock.add_callback(
+        bulk_insert_callback, url=fb_numeric_query_url, is_reusable=True
+    )
+
+    rows = ((i, f"name{i}") for i in range(5000))
+    assert cursor.load_rows("INSERT INTO t VALUES ($1, $2)", rows) == 5000
+    assert loaded_rows == list(range(5000))
+    assert len(httpx_mock.get_requests()) > 1
+
+
+def test_cursor_load_rows_empty(cursor: Cursor):
+    """load_rows with no rows doesn't send any requests."""
+    assert cursor.load_rows("INSERT INTO t VALUES (?)", iter([])) == 0
+    assert cursor._state == CursorState.DONE
+
+
+def test_cursor_load_rows_non_insert_fails(cursor: Cursor):
+    with raises(ConfigurationError):
+        cursor.load_rows("SELECT ?", [[1]])
+    assert cursor._state == CursorState.ERROR
+
+
+def test_cursor_load_csv(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+    fs,
+):
+    """load_csv reads a local file and loads it as strings."""
+    fs.create_file("/data.csv", contents="id,name\n1,a\n2,\n")
+    bodies = []
+
+    def bulk_insert_callback(request: Request) -> Response:
+        bodies.append(request.read().decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern)
+
+    assert cursor.load_csv("INSERT INTO t VALUES (?, ?)", "/data.csv") == 2
+    assert bodies == [
+        "INSERT INTO t VALUES ('1', 'a'); INSERT INTO t VALUES ('2', NULL)"
+    ]
+
+
+def test_cursor_insert_dataframe(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """insert_dataframe sends multi-row INSERT batches."""
+    pd = importorskip("pandas")
+    bodies = []
+
+    def bulk_insert_callback(request: Request) -> Response:
+        bodies.append(request.read().decode())
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", None, "c"]})
+    assert cursor.insert_dataframe("t", df, batch_rows=2) == 3
+    assert bodies == [
+        'INSERT INTO t ("id", "name") VALUES (1, \'a\'), (2, NULL)',
+        'INSERT INTO t ("id", "name") VALUES (3, \'c\')',
+    ]
+    assert cursor._state == CursorState.DONE
+
+
+def test_cursor_insert_arrow_concurrent(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """insert_arrow can send several batches concurrently."""
+    pa = importorskip("pyarrow")
+    bodies, databases = [], set()
+
+    def bulk_insert_callback(request: Request) -> Response:
+        bodies.append(request.read().decode())
+        databases.add(request.url.params.get("database"))
+        return _empty_insert_response()
+
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(bulk_insert_callback, url=url_pattern, is_reusable=True)
+
+    cursors = list(cursor.connection._cursors)
+    table = pa.table({"x": list(range(10))})
+    assert cursor.insert_arrow("t", table, batch_rows=3, concurrency=3) == 10
+    assert sorted(bodies) == sorted(
+        f'INSERT INTO t ("x") VALUES '
+        + ", ".join(f"({i})" for i in range(start, min(start + 3, 10)))
+        for start in range(0, 10, 3)
+    )
+    # Batches are sent through short-lived cursors sharing this one's parameters
+    assert databases == {cursor.database}
+    assert cursor.connection._cursors == cursors
+
+
+def test_cursor_insert_arrow_error(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_url: str,
+):
+    """A failed batch stops the insert and moves the cursor to the error state."""
+    pa = importorskip("pyarrow")
+    url_pattern = re.compile(re.escape(str(query_url).split("?")[0]))
+    httpx_mock.add_callback(
+        lambda _: Response(status_code=codes.BAD_REQUEST, content=b"bad batch"),
+        url=url_pattern,
+        is_reusable=True,
+    )
+
+    with raises(HTTPStatusError):
+        cursor.insert_arrow("t", pa.table({"x": [1, 2]}), batch_rows=1, concurrency=2)
+    assert cursor._state == CursorState.ERROR
+    with raises(ConfigurationError):
+        cursor.insert_arrow("t", pa.table({"x": [1]}), concurrency=0)
+
+
+def test_cursor_prepare(
+    httpx_mock: HTTPXMock,
+    cursor: Cursor,
+    query_callback: Callable,
+    query_url: str,
+    python_query_data: List[List[ColType]],
+):
+    """Prepared statement can be executed multiple times with new parameters."""
+    bodies = []
+
+    def prepared_query_callback(request: Request) -> Response:
+        bodies.append(request.read().decode())
+        return query_callback(request)
+
+    httpx_mock.add_callback(prepared_query_callback, url=query_url, is_reusable=True)
+
+    stmt = cursor.prepare("SELECT * FROM t WHERE id = ? AND name = ?;")
+    assert stmt.cursor is cursor
+    assert stmt.execute([1, "a"]) == len(python_query_data)
+    assert cursor.fetchall() == python_query_data
+    stmt.execute((2, "it's"))
+    stmt.executemany([[3, None], [4, "b"]])
+
+    assert bodies == [
+        "SELECT * FROM t WHERE id = 1 AND name = 'a'",
+        "SELECT * FROM t WHERE id = 2 AND name = 'it''s'",
+        "SELECT * FROM t WHERE id = 3 AND name = NULL",
+        "SELECT * FROM t WHERE id = 4 AND name = 'b'",
+    ]
+
+    with raises(DataError):
+        stmt.execute([1])
+    assert cursor._state == CursorState.ERROR
+
+    with raises(ConfigurationError):
+        stmt.executemany([[1, "a"]], bulk_insert=True)
+
+    stmt = cursor.connection.prepare("INSERT INTO t VALUES (?, ?)")
+    assert stmt.cursor is not cursor
+    stmt.executemany([[1, "a"], [2, "b"]], bulk_insert=True)
+    assert bodies[-1] == "INSERT INTO t VALUES (1, 'a'); INSERT INTO t VALUES (2, 'b')"
+
+
+def test_cursor_prepare_fb_numeric(
+    cursor: Cursor,
+    httpx_mock: HTTPXMock,
+    fb_numeric_query_url: re.Pattern,
+    fb_numeric_callback_factory: Callable,
+    fb_numeric_paramstyle,
+):
+    """Prepared fb_numeric statements send parameters as query_parameters."""
+    query = "SELECT * FROM t WHERE id = $1 AND name = $2"
+    stmt = cursor.prepare(query)
+    for params in ([1, "a"], [2.5, None]):
+        httpx_mock.add_callback(
+            fb_numeric_callback_factory(
+                [{"name": f"${i + 1}", "value": v} for i, v in enumerate(params)],
+                query,
+            ),
+            url=fb_numeric_query_url,
+        )
+        stmt.execute(params)
+
+
+def test_cursor_prepare_closed(cursor: Cursor):
+    stmt = cursor.prepare("SELECT ?")
+    cursor.close()
+    assert stmt.closed
+    with raises(CursorClosedError):
+        stmt.execute([1])
+    with raises(CursorClosedError):
+        stmt.executemany([[1]])
+    with raises(CursorClosedError):
+        cursor.prepare("SELECT 1")
@@ -1,7 +1,34 @@
+from pytest import mark, raises
+
 import firebolt.db
+from firebolt.common._types import ARRAY
+from firebolt.db.connection import connect
+from tests.unit.util import IMPORT_TIME_BUDGET_RATIO, profile_import
 
 
 def test_has_exceptions(db_api_exceptions):
     """Verify sync module has top-level dbapi exceptions exposed."""
     for ex_name, ex_class in db_api_exceptions.items():
         assert issubclass(getattr(firebolt.db, ex_name), ex_class)
+
+
+def test_lazy_attributes():
+    """Connection and type names are imported on first access."""
+    assert firebolt.db.connect is connect
+    assert firebolt.db.ARRAY is ARRAY
+    with raises(AttributeError):
+        firebolt.db.missing
+
+
+def test_all_attributes():
+    """Every name exported with a star import is available."""
+    for name in firebolt.db.__all__:
+        assert getattr(firebolt.db, name) is not None
+
+
+@mark.nofakefs
+def test_import_time():
+    """Importing the module doesn't import heavy dependencies."""
+    import_time, heavy_modules = profile_import("firebolt.db")
+    assert heavy_modules == []
+    assert import_time < IMPORT_TIME_BUDGET_RATIO
@@ -0,0 +1,251 @@
+from threading import Barrier, Thread
+from time import monotonic, sleep
+from typing import Callable, List
+from unittest.mock import patch
+
+from pytest import fixture, raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.client.auth import Auth
+from firebolt.db import Connection, connect
+from firebolt.db.pool import ConnectionPool
+from firebolt.utils.exception import (
+    ConfigurationError,
+    InterfaceError,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+
+
+@fixture
+def connection_factory(
+    api_endpoint: str,
+    db_name: str,
+    auth: Auth,
+    engine_name: str,
+    account_name: str,
+    mock_connection_flow: Callable,
+) -> Callable[[], Connection]:
+    mock_connection_flow()
+
+    def factory() -> Connection:
+        return connect(
+            engine_name=engine_name,
+            database=db_name,
+            auth=auth,
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+        )
+
+    return factory
+
+
+def test_pool_reuses_connections(
+    httpx_mock: HTTPXMock,
+    connection_factory: Callable[[], Connection],
+    mock_query: Callable,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+):
+    """Returned connections are reused and their state is reset."""
+    mock_query()
+    httpx_mock.add_callback(
+        select_one_query_callback, url=f"{set_query_url}&param=1", is_reusable=True
+    )
+    with ConnectionPool(connection_factory, max_size=2) as pool:
+        with pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("SET param=1")
+            assert cursor._set_parameters == {"param": "1"}
+        assert cursor.closed, "Cursor should be closed on release."
+
+        with pool.connection() as connection2:
+            assert connection2 is connection
+            assert connection2.cursor()._set_parameters == {}
+            assert connection2.cursor().execute("select * from t") == 10
+
+        metrics = pool.metrics
+        assert metrics.size == metrics.idle == 1
+        assert metrics.in_use == 0
+        assert metrics.checkouts == 2
+        assert metrics.connections_created == 1
+
+    assert pool.closed
+    assert connection.closed, "Idle connections should be closed with the pool."
+    with raises(PoolClosedError):
+        pool.acquire()
+
+
+def test_pool_min_size(connection_factory: Callable[[], Connection]):
+    with ConnectionPool(connection_factory, min_size=2, max_size=3) as pool:
+        assert pool.metrics.idle == 2
+        assert pool.metrics.connections_created == 2
+
+
+def test_pool_min_size_error(connection_factory: Callable[[], Connection]):
+    """Connections opened before a failing one are closed."""
+    opened: List[Connection] = []
+
+    def factory() -> Connection:
+        if len(opened) == 2:
+            raise ConnectionError("Can't connect")
+        opened.append(connection_factory())
+        return opened[-1]
+
+    with raises(ConnectionError):
+        ConnectionPool(factory, min_size=3)
+    assert len(opened) == 2
+    assert all(connection.closed for connection in opened)
+
+
+def test_pool_checkout_timeout(connection_factory: Callable[[], Connection]):
+    with ConnectionPool(connection_factory, max_size=1) as pool:
+        connection = pool.acquire()
+        with raises(PoolTimeoutError):
+            pool.acquire(timeout=0.01)
+        assert pool.metrics.checkout_timeouts == 1
+
+        pool.release(connection)
+        assert pool.acquire(timeout=0) is connection
+        pool.release(connection)
+
+        with raises(InterfaceError):
+            pool.release(connection)
+
+
+def test_pool_expiry(connection_factory: Callable[[], Connection]):
+    """Connections over the idle timeout or lifetime are replaced."""
+    with ConnectionPool(connection_factory, idle_timeout=10, max_lifetime=100) as pool:
+        with patch("firebolt.db.pool.monotonic", return_value=0):
+            with pool.connection() as connection:
+                pass
+        with patch("firebolt.db.pool.monotonic", return_value=11):
+            with pool.connection() as connection2:
+                pass
+        assert connection.closed, "Idle connection should have been closed."
+        assert connection2 is not connection
+
+        with patch("firebolt.db.pool.monotonic", return_value=101):
+            with pool.connection() as connection3:
+                pass
+        assert connection2.closed, "Expired connection should have been closed."
+        assert not connection3.closed
+        assert pool.metrics.connections_closed == 2
+
+
+def test_pool_health_check(connection_factory: Callable[[], Connection]):
+    """Idle connections failing a health check are discarded before checkout."""
+    checked: List[Connection] = []
+
+    def health_check(connection: Connection) -> bool:
+        checked.append(connection)
+        return len(checked) > 1
+
+    with ConnectionPool(
+        connection_factory, health_check=health_check, health_check_interval=5
+    ) as pool:
+        with patch("firebolt.db.pool.monotonic", return_value=0):
+            with pool.connection() as connection:
+                pass
+            with pool.connection() as connection2:
+                assert connection2 is connection, "Recently used, not checked."
+        assert checked == []
+
+        with patch("firebolt.db.pool.monotonic", return_value=6):
+            with pool.connection() as connection3:
+                pass
+        assert checked == [connection]
+        assert connection.closed
+        assert connection3 is not connection
+
+
+def test_pool_default_health_check(
+    connection_factory: Callable[[], Connection], mock_query: Callable
+):
+    mock_query()
+    with ConnectionPool(connection_factory, health_check_interval=0) as pool:
+        with pool.connection() as connection:
+            pass
+        with pool.connection() as connection2:
+            assert connection2 is connection
+
+
+def test_pool_rollback_on_release(
+    connection_factory: Callable[[], Connection],
+):
+    with ConnectionPool(connection_factory) as pool:
+        with pool.connection() as connection:
+            with patch.object(Connection, "in_transaction", True), patch.object(
+                Connection, "rollback"
+            ) as rollback:
+                pass
+        rollback.assert_not_called()
+
+        connection = pool.acquire()
+        with patch.object(Connection, "in_transaction", True), patch.object(
+            Connection, "rollback"
+        ) as rollback:
+            pool.release(connection)
+        rollback.assert_called_once()
+
+
+def test_pool_threads(
+    connection_factory: Callable[[], Connection], mock_query: Callable
+):
+    """Concurrent threads never share a connection or exceed max_size."""
+    mock_query()
+    threads_count, max_size = 8, 3
+    pool = ConnectionPool(connection_factory, max_size=max_size)
+    barrier = Barrier(threads_count)
+    in_use: List[Connection] = []
+    errors: List[Exception] = []
+
+    def worker() -> None:
+        try:
+            barrier.wait()
+            for _ in range(5):
+                with pool.connection() as connection:
+                    assert connection not in in_use
+                    in_use.append(connection)
+                    assert len(in_use) <= max_size
+                    connection.cursor().execute("select * from t")
+                    in_use.remove(connection)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    metrics = pool.metrics
+    assert metrics.checkouts == threads_count * 5
+    assert metrics.connections_created <= max_size
+    assert metrics.in_use == metrics.waiters == 0
+    pool.close()
+
+
+def test_pool_prewarm(
+    httpx_mock: HTTPXMock, connection_factory: Callable[[], Connection]
+):
+    """Each new pooled connection prewarms connections to its engine."""
+    httpx_mock.add_response(method="HEAD", is_reusable=True)
+    with ConnectionPool(connection_factory, min_size=2, prewarm=1) as pool:
+        deadline = monotonic() + 5
+        while len(httpx_mock.get_requests(method="HEAD")) < 2:
+            assert monotonic() < deadline, "Connections were not prewarmed."
+            sleep(0.01)
+        assert pool.prewarm == 1
+
+
+def test_pool_invalid_config():
+    with raises(ConfigurationError):
+        ConnectionPool(max_size=0)
+    with raises(ConfigurationError):
+        ConnectionPool(min_size=2, max_size=1)
+    with raises(ConfigurationError):
+        ConnectionPool(lambda: None, database="db")
+    with raises(ConfigurationError):
+        ConnectionPool(lambda: None, prewarm=-1)
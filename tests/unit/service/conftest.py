@@ -10,7 +10,7 @@ from firebolt.common._types import _InternalType
 from firebolt.model.V2.database import Database
 from firebolt.model.V2.engine import Engine
 from firebolt.model.V2.instance_type import InstanceType
-from firebolt.service.manager import ResourceManager
+from firebolt.service.manager import AsyncResourceManager, ResourceManager
 from firebolt.service.V2.types import EngineStatus
 from tests.unit.response import Response
 
@@ -282,3 +282,16 @@ def resource_manager(
     return ResourceManager(
         auth=auth, account_name=account_name, api_endpoint=api_endpoint
     )
+
+
+@fixture
+def async_resource_manager(
+    auth: Auth,
+    account_name: str,
+    api_endpoint: str,
+    mock_system_engine_connection_flow: Callable,
+) -> AsyncResourceManager:
+    mock_system_engine_connection_flow()
+    return AsyncResourceManager(
+        auth=auth, account_name=account_name, api_endpoint=api_endpoint
+    )
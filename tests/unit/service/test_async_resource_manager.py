@@ -0,0 +1,216 @@
+from dataclasses import replace
+from typing import Callable
+from unittest.mock import patch
+
+import trio
+from httpx import Request
+from pytest import raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.client.auth import Auth, UsernamePassword
+from firebolt.model.V2.database import AsyncDatabase, Database
+from firebolt.model.V2.engine import AsyncEngine, Engine
+from firebolt.service.manager import AsyncResourceManager
+from firebolt.service.V2.types import EngineStatus, WaitStrategy
+from firebolt.utils.exception import (
+    AttachedEngineInUseError,
+    EngineNotFoundError,
+)
+from tests.unit.response import Response
+from tests.unit.service.conftest import get_objects_from_db_callback
+
+
+def test_async_rm_requires_v2(auth: Auth, account_name: str, api_endpoint: str):
+    with raises(ValueError, match="Unsupported Firebolt version"):
+        AsyncResourceManager(
+            auth=UsernamePassword("user", "password"),
+            account_name=account_name,
+            api_endpoint=api_endpoint,
+        )
+    with raises(ValueError, match="Missing account_name value"):
+        AsyncResourceManager(auth=auth, api_endpoint=api_endpoint)
+
+
+async def test_async_engine_get_and_create(
+    httpx_mock: HTTPXMock,
+    async_resource_manager: AsyncResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    queries = []
+
+    def callback(request: Request) -> Response:
+        queries.append(request.content.decode())
+        return get_objects_from_db_callback([mock_engine])(request)
+
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+
+    async with async_resource_manager as rm:
+        engine = await rm.engines.get(mock_engine.name)
+        assert isinstance(engine, AsyncEngine)
+        assert (engine.name, engine.spec, engine.scale, engine.current_status) == (
+            mock_engine.name,
+            mock_engine.spec,
+            mock_engine.scale,
+            mock_engine.current_status,
+        )
+        assert await rm.engines.get_many(name_contains="engine") == [engine]
+
+        created = await rm.engines.create(
+            name=mock_engine.name, spec=mock_engine.spec, scale=2
+        )
+        assert created == engine
+        assert f'CREATE ENGINE "{mock_engine.name}" WITH TYPE = M NODES = 2' in (
+            queries[-2]
+        )
+    assert rm._connection is None
+
+
+async def test_async_engine_not_found(
+    httpx_mock: HTTPXMock,
+    async_resource_manager: AsyncResourceManager,
+    get_engine_not_found_callback: Callable,
+    system_engine_no_db_query_url: str,
+):
+    httpx_mock.add_callback(
+        get_engine_not_found_callback,
+        url=system_engine_no_db_query_url,
+        is_reusable=True,
+    )
+    async with async_resource_manager as rm:
+        with raises(EngineNotFoundError):
+            await rm.engines.get("missing")
+
+
+async def test_async_engines_start_stop_concurrently(
+    httpx_mock: HTTPXMock,
+    async_resource_manager: AsyncResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    """Many engines are started and stopped concurrently in one event loop."""
+    statuses = {}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def callback(request: Request) -> Response:
+        nonlocal in_flight, max_in_flight
+        query = request.content.decode()
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await trio.sleep(0.01)
+        in_flight -= 1
+        for action, status in (
+            ("START", EngineStatus.RUNNING),
+            ("STOP", EngineStatus.STOPPING),
+        ):
+            if query.startswith(f"{action} ENGINE"):
+                statuses[query.split('"')[1]] = status
+                return get_objects_from_db_callback([mock_engine])(request)
+        names = [name for name in statuses if f"'{name}'" in query]
+        engines = [
+            replace(mock_engine, name=n, current_status=statuses[n]) for n in names
+        ]
+        for name in names:
+            if statuses[name] == EngineStatus.STOPPING:
+                # Stopped on the next status check
+                statuses[name] = EngineStatus.STOPPED
+        return get_objects_from_db_callback(engines)(request)
+
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+    names = [f"engine_{i}" for i in range(10)]
+    statuses.update((name, EngineStatus.STOPPED) for name in names)
+
+    async with async_resource_manager as rm:
+        engines = await rm.engines.wait_for_engines(names)
+
+        async with trio.open_nursery() as nursery:
+            for engine in engines:
+                nursery.start_soon(engine.start)
+        assert max_in_flight > 1, "Engines weren't started concurrently"
+        assert all(e.current_status == EngineStatus.RUNNING for e in engines)
+
+        async with trio.open_nursery() as nursery:
+            for engine in engines:
+                nursery.start_soon(engine.stop)
+        assert all(e.current_status == EngineStatus.STOPPING for e in engines)
+
+        with patch("anyio.sleep") as mock_sleep:
+            await rm.engines.wait_for_engines(
+                engines, WaitStrategy(initial_interval=0.1)
+            )
+        mock_sleep.assert_awaited_once_with(0.1)
+        assert all(e.current_status == EngineStatus.STOPPED for e in engines)
+
+
+async def test_async_engine_update_and_delete(
+    httpx_mock: HTTPXMock,
+    async_resource_manager: AsyncResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    queries = []
+
+    def callback(request: Request) -> Response:
+        queries.append(request.content.decode())
+        return get_objects_from_db_callback([mock_engine])(request)
+
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+
+    async with async_resource_manager as rm:
+        engine = await rm.engines.get(mock_engine.name)
+        assert await engine.update() is engine
+        with raises(ValueError, match="Cannot update name"):
+            await engine.update(name="new_name", scale=1)
+
+        await engine.update(scale=4, auto_stop=60)
+        assert queries[-2].startswith(f'ALTER ENGINE "{mock_engine.name}"  SET NODES')
+
+        await engine.delete()
+        assert queries[-1] == f'DROP ENGINE "{mock_engine.name}"'
+
+
+async def test_async_database(
+    httpx_mock: HTTPXMock,
+    async_resource_manager: AsyncResourceManager,
+    mock_database: Database,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    engine_status = EngineStatus.STARTING
+    queries = []
+
+    def callback(request: Request) -> Response:
+        query = request.content.decode()
+        queries.append(query)
+        if "information_schema.engines" in query:
+            engine = replace(mock_engine, current_status=engine_status)
+            return get_objects_from_db_callback([engine])(request)
+        return get_objects_from_db_callback([mock_database])(request)
+
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+
+    async with async_resource_manager as rm:
+        database = await rm.databases.create(
+            name=mock_database.name, description="description"
+        )
+        assert isinstance(database, AsyncDatabase)
+        assert database.name == mock_database.name
+
+        with raises(AttachedEngineInUseError):
+            await database.delete()
+        engine_status = EngineStatus.STOPPED
+
+        await database.update(description="new description")
+        assert database.description == "new description"
+
+        await database.delete()
+        assert queries[-1] == f'DROP DATABASE "{mock_database.name}"'
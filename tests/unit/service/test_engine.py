@@ -1,3 +1,6 @@
+import re
+from dataclasses import replace
+from itertools import islice
 from typing import Callable, Union
 from unittest.mock import MagicMock, patch
 
@@ -6,9 +9,16 @@ from pytest import mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.model.V2.database import Database
-from firebolt.model.V2.engine import Engine, EngineStatus
+from firebolt.model.V2.engine import (
+    Engine,
+    EngineStatus,
+    _EngineStartPoller,
+    _start_poller,
+)
 from firebolt.model.V2.instance_type import InstanceType
 from firebolt.service.manager import ResourceManager
+from firebolt.service.V2.engine import EngineService
+from firebolt.service.V2.types import WaitStrategy
 from firebolt.utils.exception import EngineNotFoundError
 from tests.unit.response import Response
 from tests.unit.service.conftest import get_objects_from_db_callback
@@ -501,7 +511,7 @@ def test_engine_wait_for_start_stop_timeout(
     mock_engine._service = resource_manager.engines
 
     # Call start method and expect TimeoutError
-    with raises(TimeoutError, match="Excedeed timeout of 3600s waiting for.*starting"):
+    with raises(TimeoutError, match="Exceeded timeout of 3600s waiting for.*starting"):
         mock_engine.start()
 
 
@@ -554,3 +564,201 @@ def test_engine_start_already_running_no_wait(
     # Verify the engine is returned
     assert result is mock_engine
     assert result.current_status == EngineStatus.RUNNING
+
+
+def test_wait_strategy_intervals():
+    strategy = WaitStrategy(initial_interval=1, backoff=2, max_interval=5)
+    assert list(islice(strategy.intervals(), 5)) == [1, 2, 4, 5, 5]
+
+    for kwargs in (
+        {"initial_interval": 0},
+        {"timeout": 0},
+        {"backoff": 0.5},
+        {"initial_interval": 10, "max_interval": 5},
+    ):
+        with raises(ValueError):
+            WaitStrategy(**kwargs)
+
+
+@patch("time.sleep")
+def test_wait_for_engines_batched(
+    mock_sleep: MagicMock,
+    httpx_mock: HTTPXMock,
+    resource_manager: ResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    """wait_for_engines polls all waiting engines with one query."""
+    engines = [
+        replace(mock_engine, name=f"engine_{i}", current_status=EngineStatus.STARTING)
+        for i in range(3)
+    ]
+    statuses = {
+        "engine_0": [EngineStatus.RUNNING],
+        "engine_1": [EngineStatus.STARTING] * 3 + [EngineStatus.RUNNING],
+        "engine_2": [EngineStatus.STOPPED],
+    }
+    queries = []
+
+    def get_engines_callback(request: Request) -> Response:
+        queries.append(request.content.decode())
+        names = re.findall(r"'(engine_\d)'", queries[-1])
+        return get_objects_from_db_callback(
+            [
+                replace(engines[int(name[-1])], current_status=statuses[name].pop(0))
+                for name in names
+            ]
+        )(request)
+
+    httpx_mock.add_callback(
+        get_engines_callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+
+    strategy = WaitStrategy(initial_interval=1, backoff=2, max_interval=3)
+    result = resource_manager.engines.wait_for_engines(
+        [engines[0], "engine_1", "engine_2"], strategy
+    )
+
+    assert [engine.name for engine in result] == ["engine_0", "engine_1", "engine_2"]
+    assert result[0] is engines[0]
+    assert [engine.current_status for engine in result] == [
+        EngineStatus.RUNNING,
+        EngineStatus.RUNNING,
+        EngineStatus.STOPPED,
+    ]
+    # One query for engines passed by name, then one per poll
+    assert len(queries) == 4
+    assert "engine_name IN ('engine_0', 'engine_1')" in queries[1]
+    assert "engine_name IN ('engine_1')" in queries[2]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 3]
+
+
+@patch("time.sleep")
+@patch("time.time")
+def test_wait_for_engines_sleep_capped(
+    mock_time: MagicMock,
+    mock_sleep: MagicMock,
+    httpx_mock: HTTPXMock,
+    resource_manager: ResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    """The last sleep ends at the timeout, followed by one more status check."""
+    clock = [0.0]
+    mock_time.side_effect = lambda: clock[0]
+    mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+    httpx_mock.add_callback(
+        get_objects_from_db_callback(
+            [replace(mock_engine, current_status=EngineStatus.STARTING)]
+        ),
+        url=system_engine_no_db_query_url,
+        is_reusable=True,
+    )
+    engine = replace(mock_engine, current_status=EngineStatus.STARTING)
+    strategy = WaitStrategy(initial_interval=4, backoff=1, max_interval=4, timeout=10)
+
+    with raises(TimeoutError, match="Exceeded timeout of 10s"):
+        resource_manager.engines.wait_for_engines([engine], strategy)
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [4, 4, 2]
+    assert len(httpx_mock.get_requests(url=system_engine_no_db_query_url)) == 3
+
+
+def test_engine_start_async(
+    httpx_mock: HTTPXMock,
+    resource_manager: ResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    callback = create_mock_engine_with_status_transitions(
+        mock_engine, [EngineStatus.STOPPED, EngineStatus.RUNNING]
+    )
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+    mock_engine._service = resource_manager.engines
+
+    future = mock_engine.start_async()
+
+    assert future.result(timeout=10) is mock_engine
+    assert mock_engine.current_status == EngineStatus.RUNNING
+    assert any(
+        request.content.startswith(b"START ENGINE")
+        for request in httpx_mock.get_requests()
+    )
+
+
+def test_engine_start_async_batched(
+    httpx_mock: HTTPXMock,
+    resource_manager: ResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    """Engines started in the background are checked with one status query."""
+    mock_engine._service = resource_manager.engines
+    engines = [replace(mock_engine, name=f"engine_{i}") for i in range(2)]
+    statuses = {
+        engine.name: [EngineStatus.STOPPING] * 2
+        + [EngineStatus.STOPPED, EngineStatus.RUNNING]
+        for engine in engines
+    }
+    queries = []
+
+    def get_engines_callback(request: Request) -> Response:
+        queries.append(request.content.decode())
+        names = re.findall(r"'(engine_\d)'", queries[-1])
+        if not names:
+            # START ENGINE statement
+            return get_objects_from_db_callback(engines[:1])(request)
+        return get_objects_from_db_callback(
+            [
+                replace(
+                    engines[int(name[-1])],
+                    current_status=statuses[name].pop(0)
+                    if len(statuses[name]) > 1
+                    else statuses[name][0],
+                )
+                for name in names
+            ]
+        )(request)
+
+    httpx_mock.add_callback(
+        get_engines_callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+
+    strategy = WaitStrategy(initial_interval=0.05, backoff=1, max_interval=0.05)
+    futures = [engine.start_async(strategy) for engine in engines]
+
+    assert [future.result(timeout=10) for future in futures] == engines
+    assert [engine.current_status for engine in engines] == [EngineStatus.RUNNING] * 2
+    assert any("engine_name IN ('engine_0', 'engine_1')" in q for q in queries)
+    assert sum(q.startswith("START ENGINE") for q in queries) == 2
+
+
+def test_engine_start_async_errors(
+    httpx_mock: HTTPXMock,
+    resource_manager: ResourceManager,
+    mock_engine: Engine,
+    system_engine_no_db_query_url: str,
+):
+    """Errors while waiting fail the start future and don't stop the poller."""
+    callback = create_mock_engine_with_status_transitions(
+        mock_engine, [EngineStatus.STOPPED, EngineStatus.RUNNING]
+    )
+    httpx_mock.add_callback(
+        callback, url=system_engine_no_db_query_url, is_reusable=True
+    )
+    mock_engine._service = resource_manager.engines
+
+    with patch.object(
+        EngineService, "_waiting_engines", side_effect=KeyError("engine")
+    ):
+        with raises(KeyError):
+            mock_engine.start_async().result(timeout=10)
+
+    with patch.object(_EngineStartPoller, "_poll", side_effect=ValueError()):
+        with raises(ValueError):
+            mock_engine.start_async().result(timeout=10)
+    assert _start_poller._thread is None
+
+    assert mock_engine.start_async().result(timeout=10) is mock_engine
@@ -1,5 +1,7 @@
+import sys
 from dataclasses import Field, dataclass, fields
-from typing import AsyncGenerator, Dict, Generator, List
+from subprocess import run
+from typing import AsyncGenerator, Dict, Generator, List, Tuple
 
 from httpx import Request, Response
 
@@ -59,3 +61,57 @@ async def async_execute_generator_requests(
                 request = await requests.asend(response)
             except StopAsyncIteration:
                 break
+
+
+# Dependencies that shouldn't be imported until a connection is made
+HEAVY_MODULES = (
+    "anyio",
+    "appdirs",
+    "cryptography",
+    "httpcore",
+    "httpx",
+    "pydantic",
+    "sqlparse",
+    "trio",
+)
+# Importing a DB API module should take a fraction of the time of importing
+# the http client, measured in the same interpreter to cancel out machine speed
+IMPORT_TIME_BASELINE = "httpx"
+IMPORT_TIME_BUDGET_RATIO = 0.5
+
+
+def profile_import(module: str) -> Tuple[float, List[str]]:
+    """Import a module and then the baseline module in a new interpreter.
+
+    Returns:
+        Cumulative import time of the module relative to the baseline module,
+        as reported by ``python -X importtime``, and the heavy modules it
+        imported
+    """
+    result = run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules)); "
+            f"import {IMPORT_TIME_BASELINE}",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            import_times[name.strip()] = int(cumulative)
+    heavy_modules = [m for m in result.stdout.strip().split(",") if m]
+    if module not in import_times:
+        raise AssertionError(f"{module} import time not reported")
+    if IMPORT_TIME_BASELINE not in import_times:
+        # The module imported the baseline itself
+        return 1.0, heavy_modules
+    return import_times[module] / import_times[IMPORT_TIME_BASELINE], heavy_modules
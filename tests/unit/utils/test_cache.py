@@ -1,4 +1,5 @@
 import time
+from threading import Thread
 from typing import Generator
 from unittest.mock import patch
 
@@ -6,6 +7,7 @@ from pytest import fixture, mark
 
 from firebolt.utils.cache import (
     CACHE_EXPIRY_SECONDS,
+    CACHE_PURGE_INTERVAL_SECONDS,
     ConnectionInfo,
     SecureCacheKey,
     UtilCache,
@@ -351,3 +353,79 @@ def test_cache_disable_enable_behavior(
     else:
         # Keep cache enabled - should continue working
         assert cache.get(sample_cache_key) is not None
+
+
+def test_cache_lru_eviction():
+    """Test least recently used entries are evicted when the cache is full."""
+    cache = UtilCache[str](cache_name="lru_test_cache", max_size=2)
+    cache.enable()
+    keys = [SecureCacheKey([f"key{i}"], "secret") for i in range(3)]
+
+    cache.set(keys[0], "a")
+    cache.set(keys[1], "b")
+    # Reading key0 makes key1 the least recently used entry
+    assert cache.get(keys[0]) == "a"
+    cache.set(keys[2], "c")
+
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "a"
+    assert cache.get(keys[2]) == "c"
+    assert cache.evictions == 1
+
+
+def test_cache_counters(cache, sample_cache_key, sample_connection_info):
+    """Test hit and miss counters."""
+    assert cache.get(sample_cache_key) is None
+    cache.set(sample_cache_key, sample_connection_info)
+    cache.get(sample_cache_key)
+    cache.get(sample_cache_key)
+
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 0)
+
+
+def test_cache_purges_expired_entries_on_set(
+    cache, additional_cache_keys, sample_cache_key, fixed_time
+):
+    """Test expired entries are removed by a later write without being read."""
+    with patch("time.time", return_value=fixed_time):
+        for key in additional_cache_keys:
+            cache.set(key, ConnectionInfo(id="expiring"))
+    assert len(cache) == len(additional_cache_keys)
+
+    later = fixed_time + max(CACHE_EXPIRY_SECONDS, CACHE_PURGE_INTERVAL_SECONDS)
+    with patch("time.time", return_value=later):
+        cache.set(sample_cache_key, ConnectionInfo(id="fresh"))
+
+    assert len(cache) == 1
+    assert cache.misses == 0
+
+
+def test_cache_concurrent_access():
+    """Test the cache stays consistent when used from many threads."""
+    cache = UtilCache[str](cache_name="threaded_test_cache", max_size=50)
+    cache.enable()
+    keys = [SecureCacheKey([f"key{i}"], "secret") for i in range(100)]
+    errors = []
+
+    def worker(offset: int) -> None:
+        try:
+            for i in range(500):
+                key = keys[(i + offset) % len(keys)]
+                if i % 3 == 0:
+                    cache.set(key, "value")
+                elif i % 7 == 0:
+                    cache.delete(key)
+                else:
+                    assert cache.get(key) in (None, "value")
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [Thread(target=worker, args=(n * 10,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache) <= 50
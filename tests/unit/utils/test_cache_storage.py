@@ -0,0 +1,154 @@
+import os
+import time
+from hashlib import sha256
+from unittest.mock import patch
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest import fixture
+
+from firebolt.utils.cache import (
+    ConnectionInfo,
+    DatabaseInfo,
+    EngineInfo,
+    SecureCacheKey,
+    UtilCache,
+)
+from firebolt.utils.cache_storage import ConnectionInfoFileStorage
+
+CACHE_DIR = "/cache"
+
+
+@fixture
+def storage() -> ConnectionInfoFileStorage:
+    return ConnectionInfoFileStorage(CACHE_DIR)
+
+
+@fixture
+def key() -> SecureCacheKey:
+    return SecureCacheKey(["client_id", "client_secret", "account"], "client_secret")
+
+
+@fixture
+def connection_info() -> ConnectionInfo:
+    return ConnectionInfo(
+        id="connection_id",
+        expiry_time=int(time.time()) + 100,
+        system_engine=EngineInfo("https://system.engine", {"account_id": "id"}),
+        databases={"db": DatabaseInfo("db")},
+        engines={"engine": EngineInfo("https://engine", {"engine": "engine"})},
+    )
+
+
+def test_storage_roundtrip(
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    assert storage.load(key) is None
+
+    storage.save(key, connection_info)
+    assert storage.load(key) == connection_info
+    # A new storage instance, e.g. in another process, reads the same record
+    assert ConnectionInfoFileStorage(CACHE_DIR).load(key) == connection_info
+
+    storage.delete(key)
+    assert storage.load(key) is None
+
+
+def test_storage_encrypted(
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    """Records are not readable without the credentials."""
+    storage.save(key, connection_info)
+
+    for name in os.listdir(CACHE_DIR):
+        with open(os.path.join(CACHE_DIR, name)) as f:
+            content = f.read()
+        assert "system.engine" not in content
+        assert "client_id" not in content
+
+    other_key = SecureCacheKey(key.key.split("#"), "other_secret")
+    assert storage.load(other_key) is None
+
+
+def test_storage_file_names_salted(
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    """Record file names can't be derived from the credentials alone."""
+    storage.save(key, connection_info)
+    other_storage = ConnectionInfoFileStorage("/other_cache")
+    other_storage.save(key, connection_info)
+
+    (name,) = [name for name in os.listdir(CACHE_DIR) if name.endswith(".json")]
+    (other_name,) = [
+        name for name in os.listdir("/other_cache") if name.endswith(".json")
+    ]
+    assert name != other_name
+    assert name != f"{sha256(key.key.encode('utf-8')).hexdigest()}.json"
+
+    # The salt is kept when the cache is cleared
+    storage.clear()
+    storage.save(key, connection_info)
+    assert name in os.listdir(CACHE_DIR)
+
+
+def test_storage_expired(
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    storage.save(key, connection_info)
+    with patch("firebolt.utils.cache_storage.time", return_value=2**40):
+        assert storage.load(key) is None
+    assert storage.load(key) is None, "Expired record should be removed"
+
+
+def test_storage_invalid_file(
+    fs: FakeFilesystem,
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    storage.save(key, connection_info)
+    (path,) = [
+        os.path.join(CACHE_DIR, name)
+        for name in os.listdir(CACHE_DIR)
+        if name.endswith(".json")
+    ]
+    with open(path, "w") as f:
+        f.write("{broken")
+    assert storage.load(key) is None
+
+    # Failing writes don't break the cache or leave temporary files behind
+    names = set(os.listdir(CACHE_DIR))
+    with patch("os.replace", side_effect=PermissionError):
+        storage.save(key, connection_info)
+    assert set(os.listdir(CACHE_DIR)) == names
+    fs.chmod(CACHE_DIR, 0o500)
+    storage.save(key, connection_info)
+
+
+def test_util_cache_with_storage(
+    storage: ConnectionInfoFileStorage,
+    key: SecureCacheKey,
+    connection_info: ConnectionInfo,
+):
+    """Values are written through to storage and read from it on a miss."""
+    cache = UtilCache[ConnectionInfo]()
+    cache.set_storage(storage)
+    cache.set(key, connection_info)
+
+    new_process_cache = UtilCache[ConnectionInfo]()
+    new_process_cache.set_storage(storage)
+    assert new_process_cache.get(key) == connection_info
+
+    new_process_cache.delete(key)
+    assert storage.load(key) is None
+
+    cache.set(key, connection_info)
+    cache.clear()
+    assert storage.load(key) is None
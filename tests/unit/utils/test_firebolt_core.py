@@ -1,9 +1,12 @@
 """Unit tests for Firebolt Core utility functions."""
 
-from pytest import raises
+import sys
+
+from pytest import mark, raises
 
 from firebolt.utils.exception import ConfigurationError
 from firebolt.utils.firebolt_core import (
+    get_core_certificate_context,
     parse_firebolt_core_url,
     validate_firebolt_core_parameters,
 )
@@ -104,3 +107,12 @@ def test_validate_firebolt_core_parameters():
             engine_name="test_engine",
             engine_url="https://example.com",
         )
+
+
+@mark.skipif(sys.version_info < (3, 10), reason="truststore requires Python 3.10")
+def test_core_certificate_context_reused(monkeypatch):
+    """The Core certificate context is created once per process."""
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+    context = get_core_certificate_context()
+    assert get_core_certificate_context() is context
+    assert get_core_certificate_context(http2=True) is not context
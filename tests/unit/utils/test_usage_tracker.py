@@ -6,6 +6,9 @@ from pytest import mark, raises
 from firebolt.utils.usage_tracker import (
     CLIENT_MAP,
     DRIVER_MAP,
+    _format_user_agent,
+    _location_matcher,
+    _stack_locations,
     detect_connectors,
     get_sdk_properties,
     get_user_agent_header,
@@ -139,12 +142,30 @@ StackItem = namedtuple("StackItem", "function filename")
     ],
 )
 def test_detect_connectors(stack, map, expected):
+    locations = [(item.filename, item.function) for item in stack]
     with patch(
-        "firebolt.utils.usage_tracker.inspect.stack", MagicMock(return_value=stack)
+        "firebolt.utils.usage_tracker._stack_locations",
+        MagicMock(return_value=locations),
     ):
         assert detect_connectors(map) == expected
 
 
+def test_detect_connectors_cached():
+    """Stack locations are matched once, the stack isn't inspected."""
+    locations = _stack_locations()
+    assert locations[0] == (__file__, "test_detect_connectors_cached")
+
+    match_location = _location_matcher(tuple(CLIENT_MAP))
+    match_location.cache_clear()
+    with patch("inspect.stack") as stack_mock:
+        assert detect_connectors(CLIENT_MAP) == {}
+        misses = match_location.cache_info().misses
+        assert detect_connectors(CLIENT_MAP) == {}
+    stack_mock.assert_not_called()
+    assert match_location.cache_info().misses == misses
+    assert match_location.cache_info().hits >= len(locations)
+
+
 @mark.parametrize(
     "drivers,clients,additional_parameters,expected_string",
     [
@@ -225,3 +246,18 @@ def test_user_agent(drivers, clients, additional_parameters, expected_string):
 def test_incorrect_user_agent(drivers, clients):
     with raises(ValueError):
         get_user_agent_header(drivers, clients)
+
+
+@patch(
+    "firebolt.utils.usage_tracker.get_sdk_properties",
+    MagicMock(return_value=("1", "2", "Win", "ciso")),
+)
+def test_user_agent_cached():
+    """User agent is formatted once for the same inputs."""
+    _format_user_agent.cache_clear()
+    for _ in range(3):
+        assert get_user_agent_header([("ConnectorA", "0.1.1")]) == (
+            "PythonSDK/2 (Python 1; Win; ciso) ConnectorA/0.1.1"
+        )
+    assert _format_user_agent.cache_info().misses == 1
+    assert _format_user_agent.cache_info().hits == 2
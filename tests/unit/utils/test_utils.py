@@ -1,7 +1,14 @@
+import gc
+import weakref
+
 import pytest
 from httpx import Response, codes
 
-from firebolt.utils.util import get_internal_error_code, parse_url_and_params
+from firebolt.utils.util import (
+    cached_property,
+    get_internal_error_code,
+    parse_url_and_params,
+)
 
 
 @pytest.mark.parametrize(
@@ -65,3 +72,58 @@ def test_parse_url_and_params_multiple_values(url):
     with pytest.raises(ValueError) as excinfo:
         parse_url_and_params(url)
     assert "Multiple values found for key 'param1'" in str(excinfo.value)
+
+
+class _Counted:
+    def __init__(self, value: int):
+        self.value = value
+        self.calls = 0
+
+    @cached_property
+    def doubled(self) -> int:
+        self.calls += 1
+        return self.value * 2
+
+
+class _Slotted:
+    __slots__ = ("value", "calls", "_cached_doubled", "__weakref__")
+
+    def __init__(self, value: int):
+        self.value = value
+        self.calls = 0
+
+    @cached_property
+    def doubled(self) -> int:
+        self.calls += 1
+        return self.value * 2
+
+
+@pytest.mark.parametrize("cls", [_Counted, _Slotted])
+def test_cached_property_per_instance(cls):
+    first, second = cls(1), cls(2)
+    assert (first.doubled, first.doubled) == (2, 2)
+    assert (second.doubled, second.doubled) == (4, 4)
+    assert first.calls == second.calls == 1
+    assert isinstance(cls.doubled, cached_property)
+
+
+def test_cached_property_slots_without_cache_slot():
+    class NoSlot:
+        __slots__ = ()
+
+        @cached_property
+        def value(self) -> int:
+            return 1
+
+    with pytest.raises(TypeError, match="_cached_value"):
+        NoSlot().value
+
+
+@pytest.mark.parametrize("cls", [_Counted, _Slotted])
+def test_cached_property_instance_collected(cls):
+    instance = cls(1)
+    assert instance.doubled == 2
+    ref = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert ref() is None, "Cached property kept the instance alive"